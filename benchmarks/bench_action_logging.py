@@ -0,0 +1,99 @@
+"""
+Benchmark comparing the per-action overhead of verbose action logging with the failure flight recorder.
+
+The page-object actions run against an in-process fake driver, so the timings isolate the framework's own
+logging cost from browser round trips. Log records are written to a temporary file with the framework's format.
+
+Usage:
+    python benchmarks/bench_action_logging.py --actions 20000
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import sys
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+root_path = Path(__file__).parent.parent
+sys.path.append(str(root_path))
+
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+from utils.logger import Logger
+from utils.flight_recorder import flight_recorder, configure_flight_recorder
+
+LOCATOR = (By.ID, 'customer.firstName')
+
+
+class FakeElement:
+    """Element that is always visible, enabled and accepts every interaction."""
+
+    def is_displayed(self) -> bool:
+        return True
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def send_keys(self, text: str) -> None:
+        pass
+
+
+class FakeDriver:
+    """Driver that finds a FakeElement for every locator without any round trip."""
+
+    def __init__(self):
+        self.element = FakeElement()
+
+    def find_element(self, by: str, value: str) -> FakeElement:
+        return self.element
+
+
+def run_actions(actions: int) -> float:
+    """
+    Runs alternating click and send_keys actions on a fresh page object.
+
+    :param actions: The number of actions.
+    :return: The mean time per action in microseconds.
+    """
+    page = BasePage(FakeDriver())
+    start = time.perf_counter()
+    for index in range(actions):
+        if index % 2:
+            page.click(LOCATOR)
+        else:
+            page.send_keys(LOCATOR, 'John')
+    return (time.perf_counter() - start) / actions * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare verbose action logging with the flight recorder.')
+    parser.add_argument('--actions', type=int, default=10000, help='number of page-object actions per mode')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as log_dir:
+        handler = logging.FileHandler(Path(log_dir) / 'bench.log', encoding='utf-8')
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        Logger._handlers = [handler]
+
+        verbose = run_actions(args.actions)
+        configure_flight_recorder({'mode': 'flight_recorder', 'flight_recorder_size': 200})
+        recorded = run_actions(args.actions)
+        handler.close()
+
+    print(f'{"mode":<18}{"actions":>9}{"us/action":>12}')
+    print(f'{"verbose":<18}{args.actions:>9}{verbose:>12.1f}')
+    print(f'{"flight_recorder":<18}{args.actions:>9}{recorded:>12.1f}')
+    print(f'Buffered records: {len(flight_recorder.records)} (capped at {flight_recorder.records.maxlen})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark comparing one browser process per test with isolated contexts inside a single browser.
+
+For each mode it runs N concurrent "tests" (open a page and read its title), then reports the memory
+of the driver/browser process trees per concurrent test and the throughput in tests per second. The process mode
+launches and drives its browsers in parallel threads; the contexts mode interleaves its flows on the single driver.
+
+Usage:
+    python benchmarks/bench_browser_contexts.py --tests 8 --url https://parabank.parasoft.com/parabank/index.htm
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from selenium.webdriver.remote.webdriver import WebDriver
+
+root_path = Path(__file__).parent.parent
+sys.path.append(str(root_path))
+
+from utils.webdriver_initializer import WebDriverInitializer
+from utils.browser_context_pool import BrowserContextPool
+from utils.process_metrics import get_driver_rss
+
+
+def run_process_mode(tests: int, url: str) -> dict:
+    """
+    Runs every test in its own browser process, launching the browsers and running the tests in parallel.
+
+    :param tests: The number of concurrent tests.
+    :param url: The URL each test opens.
+    :return: The measured results.
+    """
+    def run_test(driver: WebDriver) -> None:
+        driver.get(url)
+        _ = driver.title
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=tests) as executor:
+        launches = [executor.submit(lambda: WebDriverInitializer().initialize_webdriver()) for _ in range(tests)]
+        drivers = [launch.result() for launch in launches if launch.exception() is None]
+        try:
+            if len(drivers) < tests:
+                raise RuntimeError(f'{tests - len(drivers)} browsers failed to launch: '
+                                   f'{next(launch.exception() for launch in launches if launch.exception())}')
+            list(executor.map(run_test, drivers))
+            elapsed = time.perf_counter() - start
+            total_rss = sum(get_driver_rss(driver) for driver in drivers)
+        finally:
+            list(executor.map(lambda driver: driver.quit(), drivers))
+    return {'mode': 'process', 'elapsed': elapsed, 'rss': total_rss}
+
+
+def run_context_mode(tests: int, url: str) -> dict:
+    """
+    Runs every test in its own isolated context of one shared browser, interleaving the flows.
+
+    :param tests: The number of concurrent tests.
+    :param url: The URL each test opens.
+    :return: The measured results.
+    """
+    start = time.perf_counter()
+    driver = WebDriverInitializer().initialize_webdriver()
+    try:
+        pool = BrowserContextPool(driver)
+        contexts = [pool.create_context() for _ in range(tests)]
+        failures = pool.run_interleaved(
+            (context, [lambda: driver.get(url), lambda: driver.title]) for context in contexts
+        )
+        if failures:
+            raise RuntimeError(f'{len(failures)} context flows failed: {failures}')
+        elapsed = time.perf_counter() - start
+        total_rss = get_driver_rss(driver)
+        pool.close_all()
+    finally:
+        driver.quit()
+    return {'mode': 'contexts', 'elapsed': elapsed, 'rss': total_rss}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare per-test browser processes with shared-browser contexts.')
+    parser.add_argument('--tests', type=int, default=4, help='number of concurrent tests')
+    parser.add_argument('--url', default='about:blank', help='URL opened by every test')
+    args = parser.parse_args()
+    print(f'{"mode":<10}{"tests":>7}{"MB/test":>10}{"tests/s":>10}')
+    for result in (run_process_mode(args.tests, args.url), run_context_mode(args.tests, args.url)):
+        mb_per_test = result['rss'] / args.tests / 1024 / 1024
+        throughput = args.tests / result['elapsed']
+        print(f'{result["mode"]:<10}{args.tests:>7}{mb_per_test:>10.1f}{throughput:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark measuring the cold `pytest --collect-only` time of the test suite against the configured budget.
+
+Every run collects the suite in a fresh interpreter; the benchmark reports the median and slowest wall time and exits
+with status 1 when the median exceeds `startup.collection_budget_seconds` in config/config.json.
+
+Usage:
+    python benchmarks/bench_collection_time.py --runs 5
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+root_path = Path(__file__).parent.parent
+sys.path.append(str(root_path))
+
+from utils.config_loader import ConfigLoader
+
+
+def measure_collection() -> float:
+    """
+    Collects the test suite once in a fresh interpreter.
+
+    :return: The wall time in seconds.
+    :raises RuntimeError: When the collection fails.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-m', 'pytest', '--collect-only', '-q', '-o', 'addopts=', '-p', 'no:cacheprovider'],
+        cwd=root_path, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f'Collection failed: {result.stdout}{result.stderr}')
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure the cold collection time of the test suite.')
+    parser.add_argument('--runs', type=int, default=5, help='number of cold collections')
+    args = parser.parse_args()
+    budget = ConfigLoader().get_setting('startup', {}).get('collection_budget_seconds', 3.0)
+    timings = [measure_collection() for _ in range(args.runs)]
+    median = statistics.median(timings)
+    print(f'{"runs":>6}{"median s":>10}{"max s":>10}{"budget s":>10}')
+    print(f'{args.runs:>6}{median:>10.2f}{max(timings):>10.2f}{budget:>10.2f}')
+    if median > budget:
+        print(f'Cold collection exceeds the budget of {budget} seconds.')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
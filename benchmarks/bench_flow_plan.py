@@ -0,0 +1,109 @@
+"""
+Benchmark comparing a hand-coded register-then-lookup flow with the same flow declared as a flow plan.
+
+Both variants run against the local ParaBank stand-in server; the benchmark reports the wall time and the number of
+WebDriver wire commands per iteration, and the per-operation timings of the plan.
+
+Usage:
+    python benchmarks/bench_flow_plan.py --iterations 5
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import sys
+import time
+import uuid
+import argparse
+from pathlib import Path
+
+root_path = Path(__file__).parent.parent
+sys.path.append(str(root_path))
+
+from pages.register_page import RegisterPage
+from pages.forgot_info_page import ForgotInfoPage
+from utils.flow_plan import FlowPlan
+from utils.stand_in_server import StandInServer
+from utils.data_generator import generate_register_data
+from utils.webdriver_initializer import WebDriverInitializer
+from utils.command_listeners import add_command_listener, remove_command_listener
+from utils.command_accounting import CommandAccountant
+
+LOOKUP_FIELDS = ['first_name', 'last_name', 'address', 'city', 'state', 'zip_code', 'ssn']
+
+
+def generate_data() -> dict:
+    """Generates registration data with a unique username."""
+    data = generate_register_data()
+    data['username'] = f'{data["username"]}{uuid.uuid4().hex[:6]}'
+    return data
+
+
+def run_hand_coded(driver, base_url: str, data: dict) -> None:
+    """The flow as the tests used to write it."""
+    driver.get(f'{base_url}register.htm')
+    register_page = RegisterPage(driver)
+    register_page.register_user(user_data=data)
+    register_page.get_welcome_message()
+    driver.get(f'{base_url}lookup.htm')
+    forgot_info_page = ForgotInfoPage(driver)
+    forgot_info_page.perform_lookup_customer(user_data={key: data[key] for key in LOOKUP_FIELDS})
+    forgot_info_page.get_welcome_message()
+    forgot_info_page.get_displayed_paragraph()
+    forgot_info_page.get_credentials()
+
+
+def build_plan(data: dict) -> FlowPlan:
+    """The same flow declared as a flow plan."""
+    return (FlowPlan('register_and_lookup')
+            .input(RegisterPage, 'register_user', url='register.htm', user_data=data)
+            .read(RegisterPage, 'WELCOME_TITLE', name='welcome_message')
+            .input(ForgotInfoPage, 'perform_lookup_customer', url='lookup.htm',
+                   user_data={key: data[key] for key in LOOKUP_FIELDS})
+            .read(ForgotInfoPage, 'WELCOME_TITLE', name='lookup_title')
+            .read(ForgotInfoPage, 'CURRENT_PARAGRAPH', name='paragraph')
+            .read(ForgotInfoPage, 'get_credentials', name='credentials'))
+
+
+def measure(driver, iterations: int, flow) -> tuple[float, float]:
+    """
+    Runs a flow several times.
+
+    :return: The mean seconds and mean wire commands per iteration.
+    """
+    accountant = CommandAccountant()
+    add_command_listener(driver, accountant)
+    start = time.perf_counter()
+    try:
+        for _ in range(iterations):
+            driver.delete_all_cookies()
+            flow(generate_data())
+    finally:
+        remove_command_listener(driver, accountant)
+    return (time.perf_counter() - start) / iterations, accountant.count / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare a hand-coded flow with the same flow plan.')
+    parser.add_argument('--iterations', type=int, default=5, help='flow runs per variant')
+    args = parser.parse_args()
+    with StandInServer() as server:
+        driver = WebDriverInitializer(headless=True).initialize_webdriver()
+        try:
+            base_url = server.base_url
+            hand_coded = measure(driver, args.iterations, lambda data: run_hand_coded(driver, base_url, data))
+            timings = []
+            planned = measure(driver, args.iterations,
+                              lambda data: timings.append(build_plan(data).compile().run(driver, base_url).timings))
+        finally:
+            driver.quit()
+    print(f'{"variant":<12}{"ms/flow":>10}{"commands/flow":>15}')
+    for variant, (seconds, commands) in (('hand-coded', hand_coded), ('flow plan', planned)):
+        print(f'{variant:<12}{seconds * 1000:>10.1f}{commands:>15.1f}')
+    print('Flow plan operations (last run):')
+    for name, seconds in timings[-1]:
+        print(f'  {name:<34}{seconds * 1000:>8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
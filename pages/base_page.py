@@ -15,6 +15,9 @@ from selenium.common.exceptions import TimeoutException, ElementNotInteractableE
     NoAlertPresentException
 from selenium.webdriver.common.by import By
 from utils.logger import Logger
+from utils.browser_context_pool import BrowserContext
+from utils.flight_recorder import recorded_action
+from utils.error_pages import fail_fast
 
 root_path = Path(__file__).parent.parent
 sys.path.append(str(root_path))
@@ -24,11 +27,29 @@ class BasePage:
     """Base class for all page objects in the framework"""
 
     WELCOME_TITLE = (By.CSS_SELECTOR, 'h1[class="title"]')
+    # Canonical URL relative to the base URL, and a locator whose presence proves the page is loaded and pristine
+    URL: str | None = None
+    READY_LOCATOR: tuple[str, str] | None = None
+    # Max allowed milliseconds per page-load metric (ttfb, dom_content_loaded, load) of documents loaded from URL,
+    # merged over the configured default budget. Empty means the default budget applies.
+    PERFORMANCE_BUDGET: dict[str, float] = {}
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: WebDriver, context: BrowserContext = None):
         self.driver = driver
+        self.context = context
         self.logger = Logger(__name__)
 
+    @property
+    def window_handle(self) -> str | None:
+        """The window handle this page object is bound to, or None when it uses the current window."""
+        return self.context.window_handle if self.context is not None else None
+
+    def _ensure_window(self) -> None:
+        """Switches the driver to the bound context's window before an action, when bound to one."""
+        if self.context is not None:
+            self.context.activate()
+
+    @recorded_action('find_element')
     def find_element(self, locator: tuple[str, str], timeout: int = 10) -> WebElement:
         """
         Finds and returns a single WebElement.
@@ -39,16 +60,18 @@ class BasePage:
         :raises TimeoutException: when the WebElement isn't found or not visible within the timeout.
         """
         try:
-            self.logger.info(f'Locating a visible WebElement with locator: {locator}')
+            self._ensure_window()
+            self.logger.info('Locating a visible WebElement with locator: %s', locator)
             web_element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
+                fail_fast(EC.visibility_of_element_located(locator))
             )
-            self.logger.info(f'Successfully located the WebElement with locator: {locator}')
+            self.logger.info('Successfully located the WebElement with locator: %s', locator)
             return web_element
         except TimeoutException as e:
             self.logger.error(f'Timeout! The WebElement with locator: {locator} not visible within {timeout} seconds.')
             raise TimeoutException(f'Visible WebElement not found: {locator}') from e
 
+    @recorded_action('find_elements')
     def find_elements(self, locator: tuple[str, str], timeout: int = 10) -> list[WebElement]:
         """
         Finds and returns a list of WebElements.
@@ -59,16 +82,18 @@ class BasePage:
         :raises TimeoutException: when no WebElements are found or not visible within the timeout.
         """
         try:
-            self.logger.info(f'Locating WebElements with locator: {locator}')
+            self._ensure_window()
+            self.logger.info('Locating WebElements with locator: %s', locator)
             web_elements = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_all_elements_located(locator)
+                fail_fast(EC.presence_of_all_elements_located(locator))
             )
-            self.logger.info(f'Successfully located {len(web_elements)} WebElements with locator: {locator}')
+            self.logger.info('Successfully located %d WebElements with locator: %s', len(web_elements), locator)
             return web_elements
         except TimeoutException as e:
             self.logger.error(f'Timeout! No visible WebElements found with locator {locator} within {timeout} seconds.')
             raise TimeoutException(f'Visible WebElements not found: {locator}') from e
 
+    @recorded_action('click')
     def click(self, locator: tuple[str, str], timeout: int = 10) -> None:
         """
         Clicks on a WebElement after waiting for it to be present and clickable.
@@ -78,16 +103,18 @@ class BasePage:
         :raises TimeoutException: when a WebElement isn't found or not clickable within the timeout.
         """
         try:
-            self.logger.info(f'Attempting to Click on a WebElement with locator: {locator}')
+            self._ensure_window()
+            self.logger.info('Attempting to Click on a WebElement with locator: %s', locator)
             web_element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
+                fail_fast(EC.element_to_be_clickable(locator))
             )
             web_element.click()
-            self.logger.info(f'Successfully clicked on the WebElement with locator: {locator}')
+            self.logger.info('Successfully clicked on the WebElement with locator: %s', locator)
         except TimeoutException as e:
             self.logger.error(f'Timeout: WebElement {locator} not clickable within {timeout} seconds.')
             raise TimeoutException(f'WebElement not found or not clickable {locator}') from e
 
+    @recorded_action('send_keys')
     def send_keys(self, locator: tuple[str, str], text: str) -> None:
         """
         Enters text into a WebElement after ensuring its visible and interactable.
@@ -99,11 +126,11 @@ class BasePage:
         :raises WebDriverException: for other errors.
         """
         try:
-            self.logger.info(f'Sending text "{text}" to a WebElement with locator: {locator}')
+            self.logger.info('Sending text "%s" to a WebElement with locator: %s', text, locator)
             web_element = self.find_element(locator)
             web_element.clear()
             web_element.send_keys(text)
-            self.logger.info(f'Successfully sent text: "{text}" to the WebElement with locator: {locator}.')
+            self.logger.info('Successfully sent text: "%s" to the WebElement with locator: %s.', text, locator)
         except TimeoutException as e:
             self.logger.error(f'Timeout! WebElement {locator} not found or not visible within timeout.')
             raise TimeoutException(f'Element not found or not visible: {locator}') from e
@@ -116,6 +143,7 @@ class BasePage:
             raise WebDriverException(f'Failed to send the text "{text}" to WebElement with this '
                                      f'locator: {locator}.') from e
 
+    @recorded_action('switch_to_iframe')
     def switch_to_iframe(self, locator: tuple[str, str], timeout: int = 10) -> None:
         """
         Switches the WebDriver's context to the specified iframe.
@@ -126,11 +154,12 @@ class BasePage:
         :raises WebDriverException: when an error occurs while trying to switch to iframe.
         """
         try:
-            self.logger.info(f'Switching to iframe with locator: {locator}.')
+            self._ensure_window()
+            self.logger.info('Switching to iframe with locator: %s.', locator)
             WebDriverWait(self.driver, timeout).until(
-                EC.frame_to_be_available_and_switch_to_it(locator)
+                fail_fast(EC.frame_to_be_available_and_switch_to_it(locator))
             )
-            self.logger.info(f'Successfully switched to iframe with locator: {locator}.')
+            self.logger.info('Successfully switched to iframe with locator: %s.', locator)
         except TimeoutException as e:
             self.logger.error(f'Timeout! iframe with {locator} not available within {timeout} seconds.')
             raise TimeoutException(f'iframe not available or not switchable: {locator}') from e
@@ -138,6 +167,7 @@ class BasePage:
             self.logger.critical(f'An error occurred while trying to switch to iframe with locator: {locator}.')
             raise WebDriverException(f'Failed to switch to iframe with locator : {locator}.') from e
 
+    @recorded_action('switch_to_default_content', has_locator=False)
     def switch_to_default_content(self) -> None:
         """
         Switches the WebDriver's context back to the default content (outside all iframes   ).
@@ -145,6 +175,7 @@ class BasePage:
         :raises WebDriverException: when an error occurs while trying to switch to the default content.
         """
         try:
+            self._ensure_window()
             self.logger.info('Attempting to switch back to default content.')
             self.driver.switch_to.default_content()
             self.logger.info('Successfully switched back to the default content.')
@@ -152,6 +183,7 @@ class BasePage:
             self.logger.critical('An error occurred while trying to switch back to the default content.')
             raise WebDriverException('Failed to switch back to the default content.') from e
 
+    @recorded_action('accept_alert', has_locator=False)
     def accept_alert(self, timeout: int = 10) -> None:
         """
         Accepts an alert (clicks the "OK" button).
@@ -162,6 +194,7 @@ class BasePage:
         :raises WebDriverException: when an error occurs while trying to accept an alert.
         """
         try:
+            self._ensure_window()
             self.logger.info('Accepting an Alert.')
             alert = WebDriverWait(self.driver, timeout).until(
                 EC.alert_is_present()
@@ -178,6 +211,7 @@ class BasePage:
             self.logger.critical('An error occurred while trying to accept the Alert.')
             raise WebDriverException('Failed to accept alert.') from e
 
+    @recorded_action('dismiss_alert', has_locator=False)
     def dismiss_alert(self, timeout: int = 10) -> None:
         """
         Dismisses an alert (clicks the "Cancel" button).
@@ -188,7 +222,8 @@ class BasePage:
         :raises WebDriverException: when an error occurs while trying to dismiss an alert.
         """
         try:
-            self.logger.info(f'Waiting up tp {timeout} seconds for alert to appear.')
+            self._ensure_window()
+            self.logger.info('Waiting up tp %s seconds for alert to appear.', timeout)
             alert = WebDriverWait(self.driver, timeout).until(
                 EC.alert_is_present()
             )
@@ -205,6 +240,7 @@ class BasePage:
             self.logger.critical('An error occurred while trying to dismiss the Alert.')
             raise WebDriverException('Unable to dismiss the Alert.') from e
 
+    @recorded_action('get_alert_text', has_locator=False)
     def get_alert_text(self, timeout: int = 10) -> str:
         """
         Gets the text of an alert.
@@ -215,6 +251,7 @@ class BasePage:
         :raises WebDriverException: when an error occurs while trying to gett an alert text.
         """
         try:
+            self._ensure_window()
             self.logger.info('Attempting to retrieve alert text.')
             alert = WebDriverWait(self.driver, timeout).until(
                 EC.alert_is_present()
@@ -231,6 +268,7 @@ class BasePage:
             self.logger.critical('An error occurred while trying to retrieve the text of the alert.')
             raise WebDriverException('Failed to get the alert text.') from e
 
+    @recorded_action('send_keys_to_alert', has_locator=False)
     def send_keys_to_alert(self, text: str, timeout: int = 10) -> None:
         """
         Sends text to a prompt alert.
@@ -242,6 +280,7 @@ class BasePage:
         :raises WebDriverException: when an error occurs while trying to send keys to a prompt alert.
         """
         try:
+            self._ensure_window()
             self.logger.info('Attempting to send text to prompt alert.')
             alert = WebDriverWait(self.driver, timeout).until(
                 EC.alert_is_present()
@@ -264,7 +303,7 @@ class BasePage:
 
         :param user_data: A dictionary containing user input values.
         :param locators_mapper: A dictionary mapping field names to their corresponding locators.
-        :raises Exception: when an error occurs while trying to fill form fields.
+        :raises WebDriverException: when an error occurs while trying to fill form fields.
         """
         try:
             for field, locator in locators_mapper.items():
@@ -272,15 +311,15 @@ class BasePage:
                     value = user_data[field]
                     field_label = field.replace("_", " ")
                     if field in ['password', 'confirm_password']:
-                        self.logger.info(f'Sending the {field_label} to the form')
+                        self.logger.info('Sending the %s to the form', field_label)
                     else:
-                        self.logger.info(f'Sending the {field_label} "{value}" to the form')
+                        self.logger.info('Sending the %s "%s" to the form', field_label, value)
                     self.send_keys(locator=locator, text=value)
                 else:
                     self.logger.warning(f'Field "{field}" is defined in locator map but missing in user_data')
-        except Exception as e:
+        except WebDriverException as e:
             self.logger.error(f'Failed to fill out the form field! Error: {e}')
-            raise Exception('An error occurred while filling form fields.')
+            raise WebDriverException('An error occurred while filling form fields.') from e
 
     def get_welcome_message(self) -> str:
         """
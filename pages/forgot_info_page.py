@@ -6,6 +6,7 @@ Forgot info page class for the ParaBank automation framework
 @contact: raedeleyan1@gmail.com
 """
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 from .base_page import BasePage
 from utils.logger import Logger
 
@@ -23,9 +24,13 @@ class ForgotInfoPage(BasePage):
     FIND_MY_LOGIN_INFO_BUTTON = (By.XPATH, '//input[@type="submit" and @value="Find My Login Info"]')
     CURRENT_PARAGRAPH = (By.XPATH, '//div[@id="rightPanel"]/descendant::p[1]')
     CREDENTIALS_PARAGRAPH = (By.XPATH, '//div[@id="rightPanel"]//descendant::p[2]')
+    URL = 'lookup.htm'
+    # The first name field of a form that isn't showing validation errors from a previous submission
+    READY_LOCATOR = (By.XPATH, '//input[@id="firstName"][not(//span[@class="error" and normalize-space()])]')
+    PERFORMANCE_BUDGET = {'ttfb': 1500, 'dom_content_loaded': 4000, 'load': 8000}
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, context=None):
+        super().__init__(driver, context)
         self.logger = Logger(__name__)
 
     def perform_lookup_customer(self, user_data: dict) -> None:
@@ -49,7 +54,7 @@ class ForgotInfoPage(BasePage):
             self.fill_form_fields(user_data=user_data, locators_mapper=locators_mapper)
             self.click(locator=self.FIND_MY_LOGIN_INFO_BUTTON)
             self.logger.info('Customer lookup submitted successfully.')
-        except Exception as e:
+        except WebDriverException as e:
             self.logger.error(f'Customer lookup failed! Error: {e}')
             raise Exception('An error occurred while trying to perform customer lookup.')
 
@@ -76,6 +81,6 @@ class ForgotInfoPage(BasePage):
                 credentials[key.strip().lower()] = value.strip()
             self.logger.info(f'Credentials extracted successfully.')
             return credentials
-        except Exception as e:
+        except (ValueError, WebDriverException) as e:
             self.logger.error(f'Credentials extraction failed! Error: {e}')
             raise Exception('An error occurred while trying to extract credentials.')
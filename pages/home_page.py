@@ -6,6 +6,7 @@ Home page class for the ParaBank automation framework
 @contact: raedeleyan1@gmail.com
 """
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 from .base_page import BasePage
 from utils.logger import Logger
 
@@ -17,9 +18,12 @@ class HomePage(BasePage):
     LOGIN_BUTTON = (By.CSS_SELECTOR, 'input[class="button"]')
     USER_FULL_NAME = (By.CSS_SELECTOR, 'p[class="smallText"]')
     MAIN_TITLE = (By.XPATH, '//div[@id="showOverview"]//child::h1[@class="title"]')
+    URL = 'index.htm'
+    READY_LOCATOR = USERNAME_INPUT
+    PERFORMANCE_BUDGET = {'ttfb': 1500, 'dom_content_loaded': 4000, 'load': 8000}
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, context=None):
+        super().__init__(driver, context)
         self.logger = Logger(__name__)
 
     def login_user(self, username: str, password: str) -> None:
@@ -36,7 +40,7 @@ class HomePage(BasePage):
             self.send_keys(locator=self.PASSWORD_INPUT, text=password)
             self.click(locator=self.LOGIN_BUTTON)
             self.logger.info('The user logged in successfully')
-        except Exception as e:
+        except WebDriverException as e:
             self.logger.error(f'Failed to log in. Error: {e}')
             raise Exception(f'An error occurred while trying to log in.') from e
 
@@ -52,7 +56,7 @@ class HomePage(BasePage):
             web_element = self.find_element(locator=self.USER_FULL_NAME)
             self.logger.info(f'The user full name retrieved is: {web_element.text}')
             return web_element.text
-        except Exception as e:
+        except WebDriverException as e:
             self.logger.error(f'Failed to retrieve user full name. Error: {e}')
             raise Exception(f'An error occurred while retrieving the user full name.') from e
 
@@ -68,6 +72,6 @@ class HomePage(BasePage):
             web_element = self.find_element(locator=self.MAIN_TITLE)
             self.logger.info(f'The main title retrieved is: {web_element.text}')
             return web_element.text
-        except Exception as e:
+        except WebDriverException as e:
             self.logger.error(f'Failed to retrieve main title. Error: {e}')
             raise Exception(f'An error occurred while retrieving the main title.') from e
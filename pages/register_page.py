@@ -6,6 +6,7 @@ Register page class for the ParaBank automation framework
 @contact: raedeleyan1@gmail.com
 """
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 from .base_page import BasePage
 from utils.logger import Logger
 
@@ -25,6 +26,10 @@ class RegisterPage(BasePage):
     PASSWORD_INPUT = (By.ID, 'customer.password')
     CONFIRM_PASSWORD_INPUT = (By.ID, 'repeatedPassword')
     REGISTER_BUTTON = (By.CSS_SELECTOR, 'input[value="Register"]')
+    URL = 'register.htm'
+    # The first name field of a form that isn't showing validation errors from a previous submission
+    READY_LOCATOR = (By.XPATH, '//input[@id="customer.firstName"][not(//span[@class="error" and normalize-space()])]')
+    PERFORMANCE_BUDGET = {'ttfb': 1500, 'dom_content_loaded': 4000, 'load': 8000}
     POPUP_ERROR_MESSAGES = {
         'first_name': (By.ID, 'customer.firstName.errors'),
         'last_name': (By.ID, 'customer.lastName.errors'),
@@ -38,8 +43,8 @@ class RegisterPage(BasePage):
         'confirm_password': (By.ID, 'repeatedPassword.errors'),
     }
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, context=None):
+        super().__init__(driver, context)
         self.logger = Logger(__name__)
 
     def register_user(self, user_data: dict) -> None:
@@ -66,7 +71,7 @@ class RegisterPage(BasePage):
         try:
             self.fill_form_fields(user_data=user_data, locators_mapper=locators_mapper)
             self.click(locator=self.REGISTER_BUTTON)
-        except Exception as e:
+        except WebDriverException as e:
             self.logger.error(f'Failed to register the user! Error: {e}')
             raise Exception('An error occurred while trying to register the user!') from e
 
@@ -86,6 +91,6 @@ class RegisterPage(BasePage):
                 raise ValueError(f'Unsupported input field: "{missing_required_input_field}"')
             welcome_element = self.find_element(locator)
             return welcome_element.text
-        except Exception as e:
+        except (ValueError, WebDriverException) as e:
             self.logger.error(f'Failed to retrieve the popup error message! Error: {e}')
             raise Exception('An error occurred while retrieving the popup error message!') from e
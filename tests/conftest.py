@@ -9,6 +9,7 @@ import sys
 import os
 import pytest
 from pathlib import Path
+from urllib.parse import urlsplit
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.common.exceptions import WebDriverException
 
@@ -17,51 +18,315 @@ sys.path.append(str(root_path))
 
 from utils.logger import Logger
 from utils.webdriver_initializer import WebDriverInitializer
-from utils.data_generator import *
+from utils.config_loader import ConfigLoader
+from utils.browser_context_pool import BrowserContextPool
+from utils.driver_proxy import DriverProxy
+from utils.resource_monitor import ResourceMonitor, MB
+from utils.performance_timing import PerformanceRecorder
+from utils.command_listeners import add_command_listener, remove_command_listener
+from utils.command_accounting import CommandAccountant
+from utils.shard_planner import TimingHistory, build_units, partition, order_failing_first
+from utils.data_generator import generate_register_data
+from utils.flight_recorder import flight_recorder, configure_flight_recorder
+from utils.caching_proxy import CachingProxy
+from utils.page_router import PageRouter, get_base_url
 
+config = ConfigLoader()
+# Configured before any logger is created so that the flight-recorder mode quiets them all
+configure_flight_recorder(config.get_setting('logging', {}))
 logger = Logger(__name__)
+execution_mode = config.get_setting('execution', {}).get('mode', 'process')
+resource_monitor_settings = config.get_setting('resource_monitor', {})
+performance_settings = config.get_setting('performance', {})
+command_accounting_settings = config.get_setting('command_accounting', {})
+caching_proxy_settings = config.get_setting('caching_proxy', {})
+self_healing_settings = config.get_setting('self_healing', {})
+leaking_tests = []
+proxy_stats: dict[str, int] = {}
+routers: list[PageRouter] = []
+infrastructure_failures: list[tuple[str, list[dict]]] = []
+test_outcomes: dict[str, dict] = {}
+
+
+def pytest_addoption(parser):
+    """Registers the duration-aware sharding options."""
+    group = parser.getgroup('sharding')
+    group.addoption('--shard-count', type=int, default=1, help='split the suite into this many shards')
+    group.addoption('--shard-index', type=int, default=0, help='0-based index of the shard to run')
+    group.addoption('--durations-path', default='.test_durations.json', help='per-test timing history file')
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_collection_modifyitems(config, items):
+    """Keeps only this node's shard, bin-packed by historical duration, running historically failing tests first."""
+    result = yield
+    shard_count = config.getoption('shard_count')
+    shard_index = config.getoption('shard_index')
+    if shard_count <= 1:
+        return result
+    if not 0 <= shard_index < shard_count:
+        raise pytest.UsageError(f'--shard-index must be between 0 and {shard_count - 1}')
+    history = TimingHistory(config.getoption('durations_path'))
+    units = build_units(items, chain_of=lambda item: getattr(item.get_closest_marker('chain'), 'args', [None])[0],
+                        group_of=lambda item: item.parent.nodeid if item.cls is not None else None)
+    shards = partition(units, shard_count, duration_of=lambda item: history.duration(item.nodeid))
+    selected = order_failing_first(shards[shard_index],
+                                   failure_score_of=lambda item: history.failure_score(item.nodeid))
+    selected_ids = {item.nodeid for item in selected}
+    config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in selected_ids])
+    items[:] = selected
+    return result
+
+
+def pytest_runtest_logreport(report):
+    """Accumulates the duration and outcome of every test over its setup, call and teardown phases."""
+    outcome = test_outcomes.setdefault(report.nodeid, {'duration': 0.0, 'failed': False, 'called': False,
+                                                       'skipped': False})
+    outcome['duration'] += report.duration
+    outcome['failed'] = outcome['failed'] or report.failed
+    outcome['skipped'] = outcome['skipped'] or report.skipped
+    outcome['called'] = outcome['called'] or report.when == 'call'
+
+
+def pytest_sessionfinish(session):
+    """
+    Merges the durations and failures of the tests that ran in this session into the timing history. Skipped tests
+    keep their history, and tests that failed before their call phase only add a failure.
+    """
+    if session.config.option.collectonly or hasattr(session.config, 'workerinput'):
+        return
+    ran = {nodeid: outcome for nodeid, outcome in test_outcomes.items()
+           if not outcome['skipped'] and (outcome['called'] or outcome['failed'])}
+    if not ran:
+        return
+    history = TimingHistory(session.config.getoption('durations_path'))
+    for nodeid, outcome in ran.items():
+        history.update(nodeid, outcome['duration'] if outcome['called'] else None, outcome['failed'])
+    history.save()
+
+
+def create_driver() -> WebDriver:
+    """Initializes a new maximized WebDriver."""
+    driver = WebDriverInitializer().initialize_webdriver()
+    driver.maximize_window()
+    return driver
+
+
+@pytest.fixture(scope='session')
+def resource_monitor() -> ResourceMonitor | None:
+    """Session-scoped background monitor of browser resources, or None when it is disabled in the config."""
+    if not resource_monitor_settings.get('enabled', False):
+        yield None
+        return
+    monitor = ResourceMonitor.from_config(resource_monitor_settings)
+    monitor.start()
+    yield monitor
+    monitor.stop()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def caching_proxy() -> CachingProxy | None:
+    """
+    Session-scoped local proxy serving static assets from an on-disk cache to every browser the session launches,
+    or None when it is disabled in the config or the base URL is HTTPS, whose traffic the proxy can only tunnel.
+    """
+    if not caching_proxy_settings.get('enabled', False):
+        yield None
+        return
+    base_url = get_base_url()
+    if urlsplit(base_url).scheme != 'http':
+        logger.warning(f'Caching proxy not started: it only caches plain-HTTP origins and the base URL is {base_url}')
+        yield None
+        return
+    proxy = CachingProxy.from_config(caching_proxy_settings).start()
+    WebDriverInitializer.proxy_server = proxy.address
+    logger.info(f'Caching proxy started at {proxy.address}')
+    yield proxy
+    WebDriverInitializer.proxy_server = None
+    proxy.stop()
+    proxy_stats.update(proxy.stats, hit_ratio=proxy.hit_ratio())
+
+
+@pytest.fixture(scope='session')
+def context_pool(resource_monitor: ResourceMonitor | None) -> BrowserContextPool:
+    """
+    Session-scoped pool of isolated browser contexts hosted by a single browser process. The host browser is
+    registered with the resource monitor once, for the lifetime of the pool.
+    """
+    host_driver = WebDriverInitializer().initialize_webdriver()
+    pool = BrowserContextPool(host_driver)
+    if resource_monitor is not None:
+        resource_monitor.register(host_driver)
+    yield pool
+    pool.close_all()
+    if resource_monitor is not None:
+        resource_monitor.unregister(host_driver)
+    host_driver.quit()
 
 
 @pytest.fixture(scope='class')
 def browser(request) -> WebDriver:
-    """Class-scoped browser fixture with setup/teardown to initialize the webdriver."""
+    """
+    Class-scoped browser fixture with setup/teardown to initialize the webdriver.
+
+    In the "contexts" execution mode every test class gets a fresh isolated context of one shared browser
+    instead of its own browser process; the shared browser is registered with the resource monitor by the pool.
+    """
     driver = None
+    context = None
+    monitor = request.getfixturevalue('resource_monitor') if execution_mode != 'contexts' else None
     try:
         logger.info(f"\n{'='*50}\nStarting Setup Phase\n{'='*50}")
-        driver = WebDriverInitializer().initialize_webdriver()
-        driver.maximize_window()
+        if execution_mode == 'contexts':
+            context = request.getfixturevalue('context_pool').create_context()
+            context.activate()
+            driver = context.pool.driver
+        else:
+            driver = DriverProxy(create_driver, self_healing=self_healing_settings.get('enabled', False),
+                                 max_respawns=self_healing_settings.get('max_respawns', 3))
+        if monitor is not None:
+            monitor.register(driver)
         yield driver
     except Exception as e:
         logger.error(f'Failed to initialize WebDriver. Error: {e}')
+        raise
     finally:
         if driver is not None:
             logger.info(f"\n{'='*50}\nStarting Teardown Phase\n{'='*50}")
-            driver.quit()
+            if monitor is not None:
+                monitor.unregister(driver)
+            try:
+                if context is not None:
+                    context.close()
+                else:
+                    driver.quit()
+            except WebDriverException as e:
+                logger.warning(f'Failed to quit the WebDriver. Error: {e}')
+
+
+@pytest.fixture(scope='class')
+def router(browser: WebDriver) -> PageRouter:
+    """Class-scoped page router of the browser, resolving page URLs against the configured base URL."""
+    page_router = PageRouter(browser)
+    routers.append(page_router)
+    return page_router
+
+
+@pytest.fixture(autouse=True)
+def resource_boundary(request):
+    """Recycles the driver at the test boundary when it exceeds a threshold and samples resources before the test."""
+    monitor = request.getfixturevalue('resource_monitor')
+    if monitor is None or 'browser' not in request.fixturenames:
+        yield
+        return
+    driver = request.getfixturevalue('browser')
+    reason = monitor.recycle_reason(driver)
+    if reason is not None and isinstance(driver, DriverProxy):
+        driver.recycle(reason)
+        monitor.reset(driver)
+    stats = monitor.get_stats(driver)
+    if stats is not None:
+        request.node.resource_monitor = monitor
+        request.node.resource_before = (stats.rss, stats.cpu_time)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def session_checkpoint(request):
+    """Remembers the browser's URL and cookies before every test, for a self-healing session to restore on a crash."""
+    if not self_healing_settings.get('enabled', False) or 'browser' not in request.fixturenames:
+        yield
+        return
+    driver = request.getfixturevalue('browser')
+    if isinstance(driver, DriverProxy):
+        driver.checkpoint()
+        request.node.driver_proxy = driver
+        request.node.respawns_before = len(driver.respawns)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def flight_recording():
+    """Starts every test with an empty flight-recorder buffer."""
+    flight_recorder.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def page_timing(request):
+    """Collects the navigation and resource timing of every document the test loads, when enabled in the config."""
+    if not performance_settings.get('enabled', False) or 'browser' not in request.fixturenames:
+        yield None
+        return
+    driver = request.getfixturevalue('browser')
+    recorder = PerformanceRecorder.from_config(performance_settings)
+    add_command_listener(driver, recorder)
+    request.node.performance_recorder = recorder
+    yield recorder
+    remove_command_listener(driver, recorder)
+
+
+@pytest.fixture(autouse=True)
+def command_accounting(request):
+    """
+    Counts the wire commands the test sends, per page-object method, when enabled in the config or when the test
+    declares a round-trip budget.
+    """
+    enabled = command_accounting_settings.get('enabled', False) or request.node.get_closest_marker('round_trip_budget')
+    if not enabled or 'browser' not in request.fixturenames:
+        yield None
+        return
+    driver = request.getfixturevalue('browser')
+    accountant = CommandAccountant()
+    add_command_listener(driver, accountant)
+    request.node.command_accountant = accountant
+    yield accountant
+    remove_command_listener(driver, accountant)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Fails a passing test whose wire-command count exceeds its round-trip budget, or that loaded a document exceeding
+    its performance budget.
+    """
+    result = yield
+    recorder = getattr(item, 'performance_recorder', None)
+    driver = item.funcargs.get('browser')
+    if recorder is not None and driver is not None:
+        recorder.record(driver)
+        recorder.enforce()
+    marker = item.get_closest_marker('round_trip_budget')
+    accountant = getattr(item, 'command_accountant', None)
+    if marker is not None and accountant is not None and accountant.count > marker.args[0]:
+        summary = accountant.summary()
+        breakdown = ', '.join(f'{label}: {entry["count"]}' for label, entry in summary['by_method'].items())
+        raise AssertionError(f'The test sent {accountant.count} WebDriver commands, which exceeds its round-trip '
+                             f'budget of {marker.args[0]} ({breakdown})')
+    return result
 
 
 @pytest.fixture(scope='session')
 def register_data() -> dict:
     """Fixture that generates a dictionary of fake registration data."""
-    password = generate_password()
-    return {
-        "first_name": generate_first_name(),
-        "last_name": generate_last_name(),
-        "address": generate_address(),
-        "city": generate_city(),
-        "state": generate_state(),
-        "zip_code": generate_zipcode(),
-        "phone": generate_phone_number(),
-        "ssn": generate_ssn(),
-        "username": generate_username(),
-        "password": password,
-        "confirm_password": password
-    }
+    return generate_register_data()
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Pytest hook to handle test reports."""
     outcome = yield
     report = outcome.get_result()
+    attach_respawns(item, report)
+    if report.when == 'call':
+        attach_resource_delta(item, report)
+        attach_page_timings(item, report)
+        accountant = getattr(item, 'command_accountant', None)
+        if accountant is not None:
+            report.user_properties.append(('wire_commands', accountant.summary()))
+    if report.failed and flight_recorder.enabled and flight_recorder.records:
+        recorded_actions = flight_recorder.format()
+        logger.error('Flight recorder of %s (%s):\n%s', item.nodeid, report.when, recorded_actions)
+        report.sections.append(('flight recorder', recorded_actions))
     if report.when == 'call' and report.failed:
         driver = item.funcargs.get('browser')
         if driver is not None:
@@ -82,3 +347,83 @@ def pytest_runtest_makereport(item, call):
                         f'onclick="window.open(this.src)" /></div>')
                 extra.append(plugin.extras.html(html))
                 report.extras = extra
+
+
+def attach_resource_delta(item, report) -> None:
+    """Attaches the RSS and CPU deltas of the test's browser session to its report and flags leaking tests."""
+    monitor = getattr(item, 'resource_monitor', None)
+    driver = item.funcargs.get('browser')
+    if monitor is None or driver is None:
+        return
+    stats = monitor.get_stats(driver)
+    if stats is None:
+        return
+    before = item.resource_before
+    rss_delta = stats.rss - before[0]
+    cpu_delta = stats.cpu_time - before[1]
+    report.user_properties.append(('rss_delta_mb', round(rss_delta / MB, 1)))
+    report.user_properties.append(('cpu_delta_s', round(cpu_delta, 2)))
+    report.user_properties.append(('command_count', stats.command_count))
+    # In the contexts mode the RSS belongs to the browser shared by every class, so it isn't attributed to the test
+    if execution_mode != 'contexts' and monitor.is_leak(rss_delta):
+        logger.warning(f'{item.nodeid} grew the browser RSS by {rss_delta / MB:.1f} MB')
+        report.user_properties.append(('resource_leak', True))
+        leaking_tests.append((item.nodeid, rss_delta))
+
+
+def attach_respawns(item, report) -> None:
+    """Flags the test during which the browser session crashed and was respawned as an infrastructure failure."""
+    proxy = getattr(item, 'driver_proxy', None)
+    if proxy is None or getattr(item, 'infrastructure_failure', False):
+        return
+    respawns = proxy.respawns[item.respawns_before:]
+    if not respawns:
+        return
+    item.infrastructure_failure = True
+    report.user_properties.append(('infrastructure_failure', respawns))
+    report.sections.append(('infrastructure failure', '\n'.join(
+        f'Browser session crashed ({respawn["error"]}) and was respawned in {respawn["seconds"]} s'
+        for respawn in respawns
+    )))
+    infrastructure_failures.append((item.nodeid, respawns))
+
+
+def attach_page_timings(item, report) -> None:
+    """Records the last loaded document and attaches the test's page timings to its report."""
+    recorder = getattr(item, 'performance_recorder', None)
+    driver = item.funcargs.get('browser')
+    if recorder is None or driver is None:
+        return
+    recorder.record(driver)
+    report.user_properties.append(('page_timings', recorder.records))
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    """
+    Lists the tests flagged as leaking browser memory or as infrastructure failures, and reports the caching proxy
+    and navigation stats.
+    """
+    if infrastructure_failures:
+        terminalreporter.section('infrastructure failures')
+        for nodeid, respawns in infrastructure_failures:
+            seconds = sum(respawn['seconds'] for respawn in respawns)
+            terminalreporter.write_line(f'{nodeid}: browser session crashed, {len(respawns)} respawn(s) in '
+                                        f'{seconds:.2f} s ({respawns[-1]["error"]})')
+        total = sum(len(respawns) for _, respawns in infrastructure_failures)
+        terminalreporter.write_line(f'{total} browser respawn(s) in total')
+    if routers:
+        terminalreporter.section('page navigation')
+        navigations = sum(page_router.navigations for page_router in routers)
+        avoided = sum(page_router.navigations_avoided for page_router in routers)
+        terminalreporter.write_line(f'{navigations} page loads, {avoided} redundant page loads avoided')
+    if proxy_stats:
+        terminalreporter.section('caching proxy')
+        terminalreporter.write_line(
+            f'{proxy_stats["hits"]} hits, {proxy_stats["misses"]} misses ({proxy_stats["hit_ratio"]:.0%} hit ratio), '
+            f'{proxy_stats["bytes_saved"] / 1024:.1f} KB served from cache, {proxy_stats["passed_through"]} '
+            f'requests and {proxy_stats["tunnels"]} tunnels passed through, {proxy_stats["errors"]} errors'
+        )
+    if leaking_tests:
+        terminalreporter.section('browser resource leaks')
+        for nodeid, rss_delta in leaking_tests:
+            terminalreporter.write_line(f'{nodeid}: +{rss_delta / MB:.1f} MB RSS')
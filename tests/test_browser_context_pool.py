@@ -0,0 +1,100 @@
+"""
+Test module for the isolation of browser contexts, run against a fake DevTools driver and, when a headless Chrome is
+available, against the local ParaBank stand-in.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import pytest
+from selenium.common.exceptions import WebDriverException
+from utils.browser_context_pool import BrowserContextPool
+from utils.stand_in_server import StandInServer
+from utils.webdriver_initializer import WebDriverInitializer
+
+
+class FakeSwitchTo:
+    """Window switching of the fake driver."""
+
+    def __init__(self, driver: 'FakeCdpDriver'):
+        self.driver = driver
+
+    def window(self, window_handle: str) -> None:
+        self.driver.current_window_handle = window_handle
+
+
+class FakeCdpDriver:
+    """Driver answering the DevTools commands of the context pool, with one cookie jar per context unless shared."""
+
+    def __init__(self, shared_cookie_jar: bool = False):
+        self.shared_cookie_jar = shared_cookie_jar
+        self.window_handles = ['host']
+        self.current_window_handle = 'host'
+        self.switch_to = FakeSwitchTo(self)
+        self.cookie_jars: dict[str | None, list[dict]] = {None: []}
+
+    def _jar(self, params: dict) -> list[dict]:
+        context_id = None if self.shared_cookie_jar else params.get('browserContextId')
+        return self.cookie_jars.setdefault(context_id, [])
+
+    def execute_cdp_cmd(self, cmd: str, params: dict) -> dict:
+        if cmd == 'Target.createBrowserContext':
+            return {'browserContextId': f'context-{len(self.cookie_jars)}'}
+        if cmd == 'Target.createTarget':
+            self.window_handles.append(f'target-{len(self.window_handles)}')
+            self._jar(params)
+            return {'targetId': self.window_handles[-1]}
+        if cmd == 'Storage.setCookies':
+            self._jar(params).extend(params['cookies'])
+        elif cmd == 'Storage.getCookies':
+            return {'cookies': list(self._jar(params))}
+        elif cmd == 'Storage.clearCookies':
+            self._jar(params).clear()
+        return {}
+
+
+@pytest.fixture
+def chrome():
+    """Fixture with a headless Chrome driver, skipping the test when none can be launched on this machine."""
+    try:
+        driver = WebDriverInitializer(headless=True, browser='chrome').initialize_webdriver()
+    except Exception as e:
+        pytest.skip(f'No headless Chrome available: {e}')
+    yield driver
+    driver.quit()
+
+
+class TestBrowserContextPool:
+    """Test suite for the browser context pool."""
+
+    def test_isolated_contexts_created(self):
+        """Test case to verify that contexts with separate cookie jars pass the check and leave no probe cookie."""
+        driver = FakeCdpDriver()
+        pool = BrowserContextPool(driver)
+        first, second = pool.create_context(), pool.create_context()
+        assert first.window_handle != second.window_handle
+        assert all(not jar for jar in driver.cookie_jars.values()), 'The isolation probe cookie was left behind.'
+
+    def test_shared_cookie_jar_rejected(self):
+        """Test case to verify that a context whose cookies are visible outside of it is rejected."""
+        pool = BrowserContextPool(FakeCdpDriver(shared_cookie_jar=True))
+        with pytest.raises(WebDriverException, match='error occurred while creating a browser context'):
+            pool.create_context()
+        assert pool.contexts == []
+
+    def test_cookies_and_storage_not_shared(self, chrome):
+        """Test case to verify that cookies and localStorage set in one context are invisible to another context."""
+        with StandInServer() as server:
+            pool = BrowserContextPool(chrome)
+            first, second = pool.create_context(), pool.create_context()
+            with first:
+                chrome.get(f'{server.base_url}index.htm')
+                chrome.add_cookie({'name': 'probe', 'value': 'first'})
+                chrome.execute_script("localStorage.setItem('probe', 'first');")
+            with second:
+                chrome.get(f'{server.base_url}index.htm')
+                assert chrome.get_cookie('probe') is None
+                assert chrome.execute_script("return localStorage.getItem('probe');") is None
+            with first:
+                assert chrome.get_cookie('probe')['value'] == 'first'
+            pool.close_all()
@@ -0,0 +1,92 @@
+"""
+Test module for the static asset caching proxy, run against the local stand-in server.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import pytest
+from urllib.parse import urlencode
+from urllib.request import ProxyHandler, build_opener
+from utils.caching_proxy import CachingProxy, AssetCache
+from utils.stand_in_server import StandInServer
+
+
+@pytest.fixture
+def stand_in():
+    """Fixture that serves the ParaBank stand-in on a free local port."""
+    with StandInServer() as server:
+        yield server
+
+
+@pytest.fixture
+def proxy(tmp_path):
+    """Fixture that runs the caching proxy with an empty cache directory."""
+    with CachingProxy(cache_dir=str(tmp_path / 'cache')) as caching_proxy:
+        yield caching_proxy
+
+
+def open_through(proxy: CachingProxy, url: str, data: dict = None) -> tuple[int, dict, bytes]:
+    """Requests the URL through the proxy and returns the status, headers and body."""
+    opener = build_opener(ProxyHandler({'http': f'http://{proxy.address}'}))
+    with opener.open(url, data=urlencode(data).encode() if data else None, timeout=10) as response:
+        return response.status, dict(response.headers), response.read()
+
+
+class TestCachingProxy:
+    """Test suite for the caching proxy."""
+
+    def test_static_asset_served_from_cache(self, stand_in: StandInServer, proxy: CachingProxy):
+        """Test case to verify that a static asset is fetched once and then served from the on-disk cache."""
+        first = open_through(proxy, f'{stand_in.base_url}style.css')
+        second = open_through(proxy, f'{stand_in.base_url}style.css')
+        assert first[0] == second[0] == 200
+        assert first[2] == second[2], 'The cached asset differs from the one served by the origin.'
+        assert second[1]['Content-Type'] == 'text/css'
+        assert (proxy.stats['misses'], proxy.stats['hits']) == (1, 1), f'Unexpected cache stats: {proxy.stats}'
+        assert proxy.stats['bytes_saved'] == len(second[2])
+
+    def test_cache_shared_between_proxies(self, stand_in: StandInServer, proxy: CachingProxy):
+        """Test case to verify that a second proxy on the same cache directory starts warm."""
+        open_through(proxy, f'{stand_in.base_url}images/logo.gif')
+        with CachingProxy(cache_dir=str(proxy.cache.cache_dir)) as second_proxy:
+            status, _, _ = open_through(second_proxy, f'{stand_in.base_url}images/logo.gif')
+            assert status == 200
+            assert second_proxy.stats['hits'] == 1, f'Unexpected cache stats: {second_proxy.stats}'
+
+    def test_dynamic_requests_pass_through(self, stand_in: StandInServer, proxy: CachingProxy):
+        """Test case to verify that pages and form POSTs reach the origin untouched and are never cached."""
+        form = {'customer.firstName': 'John', 'customer.lastName': 'Doe', 'customer.address.street': '1 Main St',
+                'customer.address.city': 'Springfield', 'customer.address.state': 'IL',
+                'customer.address.zipCode': '62701', 'customer.ssn': '123-45-6789', 'customer.username': 'jdoe',
+                'customer.password': 'secret', 'repeatedPassword': 'secret'}
+        open_through(proxy, f'{stand_in.base_url}register.htm')
+        status, headers, body = open_through(proxy, f'{stand_in.base_url}register.htm', data=form)
+        assert status == 200
+        assert b'Welcome jdoe' in body, 'The registration POST was not forwarded to the origin.'
+        assert 'JSESSIONID' in headers.get('Set-Cookie', ''), 'The session cookie was not passed through.'
+        assert 'jdoe' in stand_in.customers
+        assert proxy.stats['passed_through'] == 2
+        assert proxy.stats['hits'] == proxy.stats['misses'] == 0
+
+    def test_cache_honours_vary(self, tmp_path):
+        """Test case to verify that responses with a Vary header are cached per value of the varying request header."""
+        cache = AssetCache(str(tmp_path))
+        url = 'http://parabank.test/parabank/style.css'
+        headers = {'Content-Type': 'text/css', 'Vary': 'Accept-Language'}
+        cache.put(url, headers, b'english', {'Accept-Language': 'en'})
+        cache.put(url, headers, b'deutsch', {'Accept-Language': 'de'})
+        assert cache.get(url, {'Accept-Language': 'en'}) == (headers, b'english')
+        assert cache.get(url, {'Accept-Language': 'de'}) == (headers, b'deutsch')
+        assert cache.get(url, {'Accept-Language': 'fr'}) is None
+        cache.put(f'{url}?any', {'Vary': '*'}, b'never cached')
+        assert cache.get(f'{url}?any') is None
+
+    def test_entry_written_as_one_file(self, tmp_path):
+        """Test case to verify that an entry's headers and body live in one file replaced atomically."""
+        cache = AssetCache(str(tmp_path))
+        url = 'http://parabank.test/parabank/js/app.js'
+        cache.put(url, {'Content-Type': 'application/javascript'}, b'first\nbody')
+        cache.put(url, {'Content-Type': 'text/javascript'}, b'second')
+        assert len(list(tmp_path.iterdir())) == 1, 'The entry is split across files or left temporary files.'
+        assert cache.get(url) == ({'Content-Type': 'text/javascript'}, b'second')
@@ -0,0 +1,78 @@
+"""
+Test module for the wire-command accounting and the command connection pool, run against in-process fake drivers.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from pages.home_page import HomePage
+from utils.command_listeners import add_command_listener
+from utils.command_accounting import CommandAccountant, configure_command_connection
+
+DRIVER_SERVER_URL = 'http://127.0.0.1:9515'
+
+
+class FakeElement:
+    """Element whose state is read through the driver's execute, like a remote element."""
+
+    def __init__(self, driver: 'FakeDriver'):
+        self.driver = driver
+
+    def is_displayed(self) -> bool:
+        return self.driver.execute(Command.W3C_EXECUTE_SCRIPT)
+
+    @property
+    def text(self) -> str:
+        return self.driver.execute(Command.GET_ELEMENT_TEXT)
+
+
+class FakeDriver:
+    """Driver sending every command through execute, on a document where every element shows the same text."""
+
+    def __init__(self, command_executor: RemoteConnection = None):
+        self.command_executor = command_executor
+        self.current_url = 'http://parabank.test/parabank/overview.htm'
+
+    def execute(self, driver_command: str, params: dict = None):
+        if driver_command == Command.FIND_ELEMENT:
+            return FakeElement(self)
+        return {Command.W3C_EXECUTE_SCRIPT: True, Command.GET_ELEMENT_TEXT: 'Accounts Overview'}.get(driver_command)
+
+    def find_element(self, by: str, value: str) -> FakeElement:
+        return self.execute(Command.FIND_ELEMENT, {'using': by, 'value': value})
+
+
+class TestCommandAccounting:
+    """Test suite for the wire-command accounting."""
+
+    def test_commands_attributed_to_page_object_method(self):
+        """Test case to verify that commands are counted per outermost page-object method, the rest under <test>."""
+        driver = FakeDriver()
+        accountant = CommandAccountant()
+        add_command_listener(driver, accountant)
+        assert HomePage(driver).get_main_title() == 'Accounts Overview'
+        driver.execute(Command.GET_CURRENT_URL)
+        summary = accountant.summary()
+        assert summary['count'] == 5
+        assert summary['by_method']['HomePage.get_main_title']['commands'] == {
+            Command.FIND_ELEMENT: 1, Command.W3C_EXECUTE_SCRIPT: 1, Command.GET_ELEMENT_TEXT: 2}
+        assert summary['by_method']['<test>']['commands'] == {Command.GET_CURRENT_URL: 1}
+
+    def test_connection_pool_resized_and_old_pool_released(self):
+        """Test case to verify that the command pool is rebuilt with the configured size and the old one cleared."""
+        executor = RemoteConnection(client_config=ClientConfig(remote_server_addr=DRIVER_SERVER_URL))
+        previous_pool = executor._conn
+        previous_pool.connection_from_url(DRIVER_SERVER_URL)
+        configure_command_connection(FakeDriver(executor), pool_size=4, pool_block=True)
+        assert executor._conn is not previous_pool
+        assert (executor._conn.connection_pool_kw['maxsize'], executor._conn.connection_pool_kw['block']) == (4, True)
+        assert len(previous_pool.pools) == 0, 'The connections of the old pool were not released.'
+
+    def test_pool_left_alone_without_keep_alive(self):
+        """Test case to verify that a driver created without keep-alive keeps sending commands without a pool."""
+        executor = RemoteConnection(client_config=ClientConfig(remote_server_addr=DRIVER_SERVER_URL, keep_alive=False))
+        configure_command_connection(FakeDriver(executor), pool_size=4)
+        assert not hasattr(executor, '_conn')
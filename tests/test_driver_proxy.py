@@ -0,0 +1,132 @@
+"""
+Test module for the self-healing driver proxy, run against in-process fake drivers.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import pytest
+from selenium.webdriver.remote.command import Command
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchElementException
+from utils.driver_proxy import DriverProxy, is_session_dead
+from utils.command_listeners import CommandListener, add_command_listener
+
+BASE_URL = 'http://parabank.test/parabank/'
+
+
+class FakeDriver:
+    """Driver sending every command through execute, which fails for every command once the session crashed."""
+
+    def __init__(self):
+        self.url = 'about:blank'
+        self.cookies = []
+        self.crashed = False
+
+    def execute(self, driver_command: str, params: dict = None):
+        if self.crashed:
+            raise InvalidSessionIdException('invalid session id')
+        if driver_command == Command.FIND_ELEMENT:
+            raise NoSuchElementException(f'No element {params["value"]}')
+        if driver_command == Command.GET:
+            self.url = params['url']
+        elif driver_command == Command.ADD_COOKIE:
+            self.cookies.append(params['cookie'])
+        return {Command.GET_CURRENT_URL: self.url, Command.GET_ALL_COOKIES: list(self.cookies)}.get(driver_command)
+
+    @property
+    def current_url(self) -> str:
+        return self.execute(Command.GET_CURRENT_URL)
+
+    def get(self, url: str) -> None:
+        self.execute(Command.GET, {'url': url})
+
+    def get_cookies(self) -> list:
+        return self.execute(Command.GET_ALL_COOKIES)
+
+    def add_cookie(self, cookie: dict) -> None:
+        self.execute(Command.ADD_COOKIE, {'cookie': cookie})
+
+    def refresh(self) -> None:
+        self.execute(Command.REFRESH)
+
+    def find_element(self, by: str, value: str) -> None:
+        self.execute(Command.FIND_ELEMENT, {'using': by, 'value': value})
+
+    def quit(self) -> None:
+        self.execute(Command.QUIT)
+
+
+class CommandRecorder(CommandListener):
+    """Listener recording the commands that returned successfully."""
+
+    def __init__(self):
+        self.commands = []
+
+    def after_command(self, driver, command: str, params: dict, duration: float) -> None:
+        self.commands.append(command)
+
+
+class TestDriverProxy:
+    """Test suite for the self-healing driver proxy."""
+
+    @pytest.fixture
+    def drivers(self) -> list[FakeDriver]:
+        """Fixture that collects every fake driver the proxy creates."""
+        return []
+
+    @pytest.fixture
+    def factory(self, drivers: list[FakeDriver]):
+        """Fixture that creates fake drivers."""
+        def create_driver() -> FakeDriver:
+            drivers.append(FakeDriver())
+            return drivers[-1]
+        return create_driver
+
+    def test_dead_session_respawned_with_state(self, drivers: list[FakeDriver], factory):
+        """Test case to verify that a dead session is respawned on the checkpointed URL and cookies."""
+        proxy = DriverProxy(factory, self_healing=True)
+        proxy.get(f'{BASE_URL}overview.htm')
+        proxy.add_cookie({'name': 'JSESSIONID', 'value': 'ABC123'})
+        proxy.checkpoint()
+        drivers[0].crashed = True
+        with pytest.raises(InvalidSessionIdException):
+            proxy.get(f'{BASE_URL}transfer.htm')
+        assert proxy.wrapped_driver is drivers[1], 'The crashed session was not respawned.'
+        assert drivers[1].url == f'{BASE_URL}overview.htm'
+        assert drivers[1].cookies == [{'name': 'JSESSIONID', 'value': 'ABC123'}]
+        assert len(proxy.respawns) == 1 and proxy.respawns[0]['error'] == 'invalid session id'
+        assert proxy.respawns[0]['seconds'] >= 0
+
+    def test_listeners_carried_over(self, drivers: list[FakeDriver], factory):
+        """Test case to verify that the respawned session keeps the listeners and keeps healing itself."""
+        proxy = DriverProxy(factory, self_healing=True)
+        recorder = CommandRecorder()
+        add_command_listener(proxy, recorder)
+        drivers[0].crashed = True
+        with pytest.raises(InvalidSessionIdException):
+            proxy.get(f'{BASE_URL}index.htm')
+        proxy.get(f'{BASE_URL}index.htm')
+        assert recorder.commands == [Command.GET]
+        drivers[1].crashed = True
+        with pytest.raises(InvalidSessionIdException):
+            proxy.refresh()
+        assert len(drivers) == 3 and len(proxy.respawns) == 2
+        assert drivers[2].url == f'{BASE_URL}index.htm', 'The last loaded URL was not restored.'
+
+    def test_page_errors_not_respawned(self, drivers: list[FakeDriver], factory):
+        """Test case to verify that errors caused by the page leave the session alone."""
+        proxy = DriverProxy(factory, self_healing=True)
+        with pytest.raises(NoSuchElementException) as error:
+            proxy.find_element('id', 'customer.firstName')
+        assert not is_session_dead(error.value)
+        assert is_session_dead(ConnectionRefusedError(111, 'Connection refused'))
+        assert len(drivers) == 1 and proxy.respawns == []
+
+    def test_respawns_limited(self, drivers: list[FakeDriver], factory):
+        """Test case to verify that the proxy stops respawning after the max number of respawns."""
+        proxy = DriverProxy(factory, self_healing=True, max_respawns=1)
+        for _ in range(3):
+            proxy.wrapped_driver.crashed = True
+            with pytest.raises(InvalidSessionIdException):
+                proxy.refresh()
+        assert len(drivers) == 2 and len(proxy.respawns) == 1
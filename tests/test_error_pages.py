@@ -0,0 +1,75 @@
+"""
+Test module for the fail-fast server error page detection, run against an in-process fake driver.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import time
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from pages.base_page import BasePage
+from pages.register_page import RegisterPage
+from utils.error_pages import ServerErrorPage, ErrorPageDetector, fail_fast, DEFAULT_ERROR_PAGE_SETTINGS
+
+ERROR_URL = 'http://parabank.test/parabank/register.htm'
+
+
+class FakeDriver:
+    """Driver on a document without any of the looked-up elements, optionally matching a failure signature."""
+
+    def __init__(self, error_match: list = None):
+        self.current_url = ERROR_URL
+        self.error_match = error_match
+        self.scripts = 0
+        self.script_args = ()
+
+    def find_element(self, by: str, value: str):
+        raise NoSuchElementException(f'No element {by}={value}')
+
+    def execute_script(self, script: str, *args):
+        self.scripts += 1
+        self.script_args = args
+        return self.error_match
+
+
+class TestErrorPages:
+    """Test suite for the server error page detection."""
+
+    def test_wait_aborts_on_error_page(self):
+        """Test case to verify that a wait on an error page fails within milliseconds with the page's error text."""
+        driver = FakeDriver(['Error!', 'An internal error has occurred and has been logged.'])
+        start = time.perf_counter()
+        with pytest.raises(ServerErrorPage, match='An internal error has occurred') as error:
+            BasePage(driver).find_element(RegisterPage.FIRST_NAME_INPUT, timeout=10)
+        assert time.perf_counter() - start < 1, 'The wait did not abort on the error page.'
+        assert (error.value.signature, error.value.url) == ('Error!', ERROR_URL)
+
+    def test_page_object_surfaces_error_page(self):
+        """Test case to verify that page-object methods let the specific exception through instead of wrapping it."""
+        driver = FakeDriver(['HTTP Status [45]\\d\\d', 'HTTP Status 500 - Internal Server Error'])
+        with pytest.raises(ServerErrorPage, match='HTTP Status 500'):
+            RegisterPage(driver).register_user(user_data={'first_name': 'John'})
+
+    def test_wait_times_out_without_error_page(self):
+        """Test case to verify that a missing element on a regular page still waits out the timeout."""
+        driver = FakeDriver()
+        with pytest.raises(TimeoutException):
+            BasePage(driver).find_element(RegisterPage.FIRST_NAME_INPUT, timeout=1)
+        assert driver.scripts >= 2, 'The error page check did not run while waiting.'
+
+    def test_check_skipped_when_condition_met(self):
+        """Test case to verify that the error page check costs nothing when the wait condition is met."""
+        driver = FakeDriver(['Error!', 'Error!'])
+        detector = ErrorPageDetector.from_config(DEFAULT_ERROR_PAGE_SETTINGS)
+        assert fail_fast(lambda web_driver: 'element', detector)(driver) == 'element'
+        assert driver.scripts == 0
+
+    def test_error_title_qualified_by_body(self):
+        """Test case to verify that the generic "Error!" title needs the internal-error text to signal an error page."""
+        driver = FakeDriver()
+        detector = ErrorPageDetector.from_config({})
+        assert not detector.check(driver)
+        titles = dict(driver.script_args[0])
+        assert titles['Error!'] == 'An internal error has occurred' and titles['Bad Gateway'] is None
+        assert ErrorPageDetector.from_config({'titles': ['Oops']}).titles == {'Oops': None}
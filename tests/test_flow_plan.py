@@ -0,0 +1,102 @@
+"""
+Test module for the flow plan compiler and executor, run against an in-process fake driver.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import pytest
+from selenium.webdriver.common.by import By
+from utils.flow_plan import FlowPlan, FlowAssertionError
+
+BASE_URL = 'http://parabank.test/parabank/'
+
+
+class FakeDriver:
+    """Driver recording navigations and answering batched reads from a fixed set of texts."""
+
+    def __init__(self, current_url: str = 'about:blank', texts: dict = None):
+        self.current_url = current_url
+        self.texts = texts or {}
+        self.visited = []
+        self.scripts = 0
+
+    def get(self, url: str) -> None:
+        self.visited.append(url)
+        self.current_url = url
+
+    def delete_all_cookies(self) -> None:
+        pass
+
+    def execute_script(self, script: str, locators: list) -> list:
+        self.scripts += 1
+        return [self.texts.get(tuple(locator)) for locator in locators]
+
+
+class FakePage:
+    """Page object exposing two locators, a getter and an input method."""
+
+    TITLE = (By.CSS_SELECTOR, 'h1.title')
+    PARAGRAPH = (By.XPATH, '//p[1]')
+    submitted = []
+
+    def __init__(self, driver, context=None):
+        self.driver = driver
+
+    def submit(self, value: str) -> None:
+        FakePage.submitted.append(value)
+        self.driver.current_url = f'{BASE_URL}done.htm'
+
+    def get_status(self) -> str:
+        return 'ok'
+
+
+class TestFlowPlan:
+    """Test suite for flow plans."""
+
+    def test_redundant_navigations_are_compiled_out(self):
+        """Test case to verify that a step on the page the previous step declared it lands on doesn't navigate."""
+        plan = (FlowPlan('flow')
+                .input(FakePage, 'submit', url='form.htm', lands_on='done.htm', value='a')
+                .read(FakePage, 'TITLE', url='done.htm')
+                .input(FakePage, 'submit', url='done.htm', value='b'))
+        kinds = [operation.kind for operation in plan.compile().operations]
+        assert kinds == ['navigate', 'input', 'read_batch', 'input'], f'Unexpected operations: {kinds}'
+
+    def test_consecutive_locator_reads_are_batched(self):
+        """Test case to verify that consecutive locator reads run in one script round trip."""
+        driver = FakeDriver(texts={FakePage.TITLE: 'Customer Lookup', FakePage.PARAGRAPH: 'Located'})
+        plan = (FlowPlan('flow')
+                .read(FakePage, 'TITLE', url='lookup.htm', name='title')
+                .read(FakePage, 'PARAGRAPH', name='paragraph')
+                .read(FakePage, 'get_status', name='status'))
+        execution_plan = plan.compile()
+        result = execution_plan.run(driver, BASE_URL)
+        assert [operation.kind for operation in execution_plan.operations] == ['navigate', 'read_batch', 'read']
+        assert driver.scripts == 1, f'Expected a single batched read, but ran {driver.scripts} scripts'
+        assert result.values == {'title': 'Customer Lookup', 'paragraph': 'Located', 'status': 'ok'}
+        assert [name for name, _ in result.timings] == ['open', 'title+paragraph', 'status']
+
+    def test_navigation_skipped_when_already_on_page(self):
+        """Test case to verify that the plan doesn't reload the page the browser is already on."""
+        driver = FakeDriver(current_url=f'{BASE_URL}form.htm;jsessionid=ABC123')
+        FakePage.submitted.clear()
+        result = FlowPlan('flow').input(FakePage, 'submit', url='form.htm', value='a').compile().run(driver, BASE_URL)
+        assert driver.visited == []
+        assert (result.navigations, result.navigations_avoided) == (0, 1)
+        assert FakePage.submitted == ['a']
+
+    def test_fresh_session_always_navigates(self):
+        """Test case to verify that a flow starting a fresh session reloads its first page."""
+        driver = FakeDriver(current_url=f'{BASE_URL}form.htm')
+        result = FlowPlan('flow', fresh_session=True).input(FakePage, 'submit', url='form.htm', value='a') \
+            .compile().run(driver, BASE_URL)
+        assert driver.visited == [f'{BASE_URL}form.htm']
+        assert result.navigations == 1
+
+    def test_unexpected_read_fails_the_flow(self):
+        """Test case to verify that a read not matching its expected value raises FlowAssertionError."""
+        driver = FakeDriver(texts={FakePage.TITLE: 'Error!'})
+        plan = FlowPlan('flow').read(FakePage, 'TITLE', url='lookup.htm', expect='Customer Lookup')
+        with pytest.raises(FlowAssertionError, match='Customer Lookup'):
+            plan.compile().run(driver, BASE_URL)
@@ -8,15 +8,17 @@ Test module for the Home Page.
 import pytest
 from selenium.webdriver.remote.webdriver import WebDriver
 from pages.home_page import HomePage
+from utils.flow_plan import FlowPlan
+from utils.page_router import PageRouter
 
 
 @pytest.mark.order(2)
+@pytest.mark.chain('customer')
 class TestHomePage:
 
-    def test_login_functionality(self, browser: WebDriver, register_data: dict):
+    def test_login_functionality(self, router: PageRouter, register_data: dict):
         """Test case to verify that the registered user can log in successfully"""
-        browser.get('https://parabank.parasoft.com/parabank/index.htm')
-        home_page = HomePage(browser)
+        home_page = router.open(HomePage)
         home_page.login_user(username=register_data['username'], password=register_data['password'])
         expected_full_name = f'Welcome {register_data["first_name"]} {register_data["last_name"]}'
         expected_main_title = 'Accounts Overview'
@@ -30,3 +32,24 @@ class TestHomePage:
             f'The main title of the account is incorrect. The expected main title is {expected_main_title}, but the '
             f'actual main title is {actual_main_title}.'
         )
+
+    def test_login_functionality_with_flow_plan(self, browser: WebDriver, router: PageRouter, register_data: dict):
+        """Test case to verify that the registered user can log in successfully through a flow plan"""
+        plan = (FlowPlan('login', fresh_session=True)
+                .input(HomePage, 'login_user', url=HomePage.URL, username=register_data['username'],
+                       password=register_data['password'])
+                .read(HomePage, 'USER_FULL_NAME', name='full_name')
+                .read(HomePage, 'MAIN_TITLE', name='main_title'))
+        result = plan.compile().run(browser, router=router)
+        expected_full_name = f'Welcome {register_data["first_name"]} {register_data["last_name"]}'
+        expected_main_title = 'Accounts Overview'
+        actual_full_name = result['full_name']
+        actual_main_title = result['main_title']
+        assert expected_full_name == actual_full_name, (
+            f'The full name of the account is incorrect. The expected full name is {expected_full_name}, but the '
+            f'actual full name is {actual_full_name}.'
+        )
+        assert expected_main_title == actual_main_title, (
+            f'The main title of the account is incorrect. The expected main title is {expected_main_title}, but the '
+            f'actual main title is {actual_main_title}.'
+        )
@@ -0,0 +1,82 @@
+"""
+Test module for the launch-flag autotuner's ranking and profile write-back, run without launching a browser.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import json
+import shutil
+import pytest
+from selenium.common.exceptions import WebDriverException
+from utils.config_loader import ConfigLoader
+from utils.webdriver_initializer import WebDriverInitializer
+from utils.launch_autotuner import LaunchAutotuner, rank, format_report, format_config, save_profile
+
+MB = 1024 * 1024
+
+
+def measurement(cold_start: float, navigation: float, register: float, peak_mb: float) -> dict:
+    """Builds the measurement of one successful run."""
+    return {'cold_start': cold_start, 'navigation': navigation, 'register': register, 'peak_rss': peak_mb * MB}
+
+
+class TestLaunchAutotuner:
+    """Test suite for the launch-flag autotuner."""
+
+    def test_candidates_ranked_by_median_total(self):
+        """Test case to verify that candidates rank by median total time, with failing candidates last."""
+        results = {
+            'slow': [measurement(1.0, 0.2, 0.8, 300)] * 3,
+            'fast': [measurement(0.6, 0.1, 0.5, 350), measurement(0.5, 0.1, 0.5, 340), measurement(3.0, 1, 1, 900)],
+            'flaky': [measurement(0.3, 0.1, 0.4, 200), None, measurement(0.3, 0.1, 0.4, 200)],
+            'broken': [None] * 3,
+        }
+        flags = {name: [f'--{name}'] for name in results}
+        rows = rank(results, flags)
+        assert [row['candidate'] for row in rows] == ['fast', 'slow', 'flaky', 'broken']
+        assert rows[0]['total'] == pytest.approx(1.2) and rows[0]['peak_mb'] == pytest.approx(350)
+        report = format_report(rows).splitlines()
+        assert report[1].startswith('1     fast') and report[1].endswith('--fast')
+        assert 'all runs failed' in report[4]
+
+    def test_headless_flag_added_once(self):
+        """Test case to verify that headless tuning adds the browser's headless flag unless a candidate has it."""
+        tuner = LaunchAutotuner('chrome', {}, headless=True)
+        assert tuner.effective_flags(['--incognito']) == ['--incognito', '--headless=new']
+        assert tuner.effective_flags(['--headless=new']) == ['--headless=new']
+        assert tuner.effective_flags(['--headless']) == ['--headless']
+
+    def test_driver_resolved_once_outside_cold_start(self, monkeypatch):
+        """Test case to verify that the driver is resolved once before the runs and every launch reuses its path."""
+        resolved, launched = [], []
+        monkeypatch.setattr(WebDriverInitializer, 'resolve_driver_path',
+                            lambda initializer: resolved.append(initializer.browser) or '/drivers/chromedriver')
+
+        def initialize_webdriver(initializer):
+            launched.append(initializer.driver_path)
+            raise WebDriverException('No browser in this test.')
+
+        monkeypatch.setattr(WebDriverInitializer, 'initialize_webdriver', initialize_webdriver)
+        tuner = LaunchAutotuner('chrome', {'current': [], 'lean': ['--disable-gpu']}, runs=2)
+        rows = tuner.run(base_url='http://parabank.test/parabank/')
+        assert resolved == ['chrome']
+        assert launched == ['/drivers/chromedriver'] * 4
+        assert all(row['failures'] == 2 for row in rows)
+
+    def test_saved_profile_selected_by_initializer(self, tmp_path):
+        """Test case to verify that a saved and selected profile keeps the config layout and drives the launch."""
+        config_path = tmp_path / 'config.json'
+        shutil.copy('config/config.json', config_path)
+        original = config_path.read_text()
+        assert format_config(json.loads(original)) == original, 'Formatting changed the config layout.'
+        flags = ['--headless=new', '--disable-gpu']
+        save_profile('chrome', 'tuned', flags, select=True, config_path=str(config_path))
+        settings = json.loads(config_path.read_text())['chrome']
+        assert (settings['profiles'], settings['profile']) == ({'tuned': flags}, 'tuned')
+        initializer = WebDriverInitializer(browser='chrome')
+        initializer.config = ConfigLoader(str(config_path))
+        assert initializer.get_configured_flags() == flags
+        initializer.profile = 'missing'
+        with pytest.raises(ValueError, match='Unknown launch-flag profile'):
+            initializer.get_configured_flags()
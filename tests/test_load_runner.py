@@ -0,0 +1,58 @@
+"""
+Test module for the browser-driven load runner, run offline against the local ParaBank stand-in.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import pytest
+from utils.load_runner import LoadRunner, ACQUIRE_STEP
+from utils.stand_in_server import StandInServer
+from utils.webdriver_initializer import WebDriverInitializer
+
+
+@pytest.fixture
+def stand_in():
+    """Fixture that serves the ParaBank stand-in on a free local port."""
+    with StandInServer() as server:
+        yield server
+
+
+@pytest.fixture(scope='module')
+def headless_browser_available() -> None:
+    """Fixture that skips the test when no headless browser can be launched on this machine."""
+    try:
+        WebDriverInitializer(headless=True).initialize_webdriver().quit()
+    except Exception as e:
+        pytest.skip(f'No headless browser available: {e}')
+
+
+class TestLoadRunner:
+    """Test suite for the load runner."""
+
+    def test_smoke_run_against_stand_in(self, headless_browser_available, stand_in: StandInServer):
+        """Test case to verify that a short run registers and logs in customers on the stand-in without errors."""
+        runner = LoadRunner(base_url=stand_in.base_url, users=2, duration=10, flow_mix={'register': 1, 'login': 1},
+                            think_time=(0.1, 0.2), drivers=1)
+        rows = {row['step']: row for row in runner.run()}
+        assert rows['register.submit']['count'] >= 1 and rows['register.verify']['error_rate'] == 0
+        assert all(row['error_rate'] == 0 for row in rows.values()), f'Failing steps: {rows}'
+        assert len(stand_in.customers) >= 1
+
+    def test_driver_launch_failures_recorded(self, stand_in: StandInServer):
+        """Test case to verify that virtual users record failing driver launches and keep running to the deadline."""
+        def failing_factory():
+            raise ConnectionError('Could not reach host')
+
+        runner = LoadRunner(base_url=stand_in.base_url, users=2, duration=0.5, flow_mix={'register': 1},
+                            think_time=(0.05, 0.05), driver_factory=failing_factory)
+        rows = {row['step']: row for row in runner.run()}
+        assert list(rows) == [f'register.{ACQUIRE_STEP}']
+        assert rows[f'register.{ACQUIRE_STEP}']['count'] >= 4, 'The virtual users stopped after the first failure.'
+        assert rows[f'register.{ACQUIRE_STEP}']['error_rate'] == 1
+
+    @pytest.mark.parametrize('configured', [['headless'], ['-headless'], ['--headless'], ['--headless=old']])
+    def test_configured_headless_variant_kept(self, configured: list[str]):
+        """Test case to verify that headless launches don't add a second headless flag to a configured variant."""
+        initializer = WebDriverInitializer(headless=True, browser='chrome', browser_options=configured)
+        assert initializer._get_browser_options().arguments == configured
@@ -0,0 +1,85 @@
+"""
+Test module for the log shard rotation, pruning and merging, run against a temporary logs directory.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import io
+import os
+import gzip
+import time
+import logging
+from pathlib import Path
+from utils.logger import DEFAULT_LOG_SETTINGS, create_file_handler, prune_logs, read_run_id
+from utils.log_merger import merge_logs, find_runs
+
+SETTINGS = dict(DEFAULT_LOG_SETTINGS, backup_count=2)
+
+
+def log_run(log_dir: Path, run_id: str, message: str, worker_id: str = 'main', owner: bool = True) -> None:
+    """Logs a message into a worker's shard as one process of a run."""
+    handler = create_file_handler(log_dir, worker_id, run_id, SETTINGS, owner)
+    handler.emit(logging.LogRecord('test', logging.INFO, __file__, 0, message, None, None))
+    handler.close()
+
+
+def write_shard(path: Path, records: list[tuple[str, str]]) -> None:
+    """Writes (timestamp, message) records in the log format, gzip-compressed for .gz paths."""
+    text = ''.join(f'{timestamp} - test - INFO - {message}\n' for timestamp, message in records)
+    if path.suffix == '.gz':
+        with gzip.open(path, 'wt', encoding='utf-8') as file:
+            file.write(text)
+    else:
+        path.write_text(text, encoding='utf-8')
+
+
+class TestLogger:
+    """Test suite for the log shards."""
+
+    def test_new_run_rolls_previous_run_over(self, tmp_path: Path):
+        """Test case to verify that a run starts a fresh shard and keeps the previous run as a compressed rollover."""
+        log_run(tmp_path, 'run-1', 'first run')
+        log_run(tmp_path, 'run-2', 'second run')
+        log_run(tmp_path, 'run-2', 'subprocess of the second run', owner=False)
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['execution_main.log', 'execution_main.log.1.gz']
+        assert read_run_id(tmp_path / 'execution_main.log') == 'run-2'
+        active = (tmp_path / 'execution_main.log').read_text()
+        assert 'second run' in active and 'subprocess of the second run' in active and 'first run' not in active
+        with gzip.open(tmp_path / 'execution_main.log.1.gz', 'rt') as rollover:
+            assert 'first run' in rollover.read()
+
+    def test_runs_bounded_by_backup_count(self, tmp_path: Path):
+        """Test case to verify that repeated runs keep a stable shard name and at most backup_count rollovers."""
+        for run in range(5):
+            log_run(tmp_path, f'run-{run}', 'message')
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            'execution_main.log', 'execution_main.log.1.gz', 'execution_main.log.2.gz']
+
+    def test_prune_by_age_and_count(self, tmp_path: Path):
+        """Test case to verify that pruning deletes expired files and the oldest files beyond the max count."""
+        now = time.time()
+        ages_in_days = {'execution_pid1.log': 10, 'execution_pid2.log': 3, 'execution_pid3.log': 2,
+                        'execution_main.log.1.gz': 1, 'execution_main.log': 0, 'merged.log': 30}
+        for name, age in ages_in_days.items():
+            (tmp_path / name).write_text('')
+            os.utime(tmp_path / name, (now - age * 86400, now - age * 86400))
+        prune_logs(tmp_path, max_age_days=7, max_files=3)
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            'execution_main.log', 'execution_main.log.1.gz', 'execution_pid3.log', 'merged.log']
+
+    def test_merge_only_latest_run(self, tmp_path: Path):
+        """Test case to verify that the merged log interleaves the shards of the latest run only, in time order."""
+        write_shard(tmp_path / 'execution_gw0.log.1.gz', [('2026-10-18 09:00:00', 'Log run old started'),
+                                                          ('2026-10-18 09:00:02', 'old gw0')])
+        write_shard(tmp_path / 'execution_gw0.log', [('2026-10-19 10:00:00', 'Log run new started'),
+                                                     ('2026-10-19 10:00:03', 'new gw0')])
+        write_shard(tmp_path / 'execution_gw1.log', [('2026-10-19 10:00:01', 'Log run new started'),
+                                                     ('2026-10-19 10:00:02', 'new gw1')])
+        assert find_runs(tmp_path) == ['old', 'new']
+        output = io.StringIO()
+        assert merge_logs(tmp_path, output) == 4
+        assert [line.split(' - ')[-1] for line in output.getvalue().splitlines()] == [
+            'Log run new started', 'Log run new started', 'new gw1', 'new gw0']
+        assert merge_logs(tmp_path, io.StringIO(), run_id='old') == 2
+        assert merge_logs(tmp_path, io.StringIO(), all_runs=True) == 6
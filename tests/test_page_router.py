@@ -0,0 +1,60 @@
+"""
+Test module for the page router, run against an in-process fake driver.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import pytest
+from pages.register_page import RegisterPage
+from utils.page_router import PageRouter
+
+BASE_URL = 'http://parabank.test/parabank/'
+
+
+class FakeDriver:
+    """Driver whose current document is a URL plus the set of locators present in it."""
+
+    def __init__(self, current_url: str = 'about:blank', present: set = None):
+        self.current_url = current_url
+        self.present = present or set()
+        self.visited = []
+
+    def get(self, url: str) -> None:
+        self.visited.append(url)
+        self.current_url = url
+
+    def find_elements(self, by: str, value: str) -> list:
+        return [object()] if (by, value) in self.present else []
+
+
+class TestPageRouter:
+    """Test suite for the page router."""
+
+    def test_navigation_avoided_on_ready_page(self):
+        """Test case to verify that the router doesn't reload a page whose readiness locator is present."""
+        driver = FakeDriver(f'{BASE_URL}register.htm;jsessionid=ABC123', present={RegisterPage.READY_LOCATOR})
+        router = PageRouter(driver, BASE_URL)
+        page = router.open(RegisterPage)
+        assert isinstance(page, RegisterPage)
+        assert driver.visited == []
+        assert (router.navigations, router.navigations_avoided) == (0, 1)
+
+    @pytest.mark.parametrize('current_url, present', [
+        ('about:blank', set()),
+        (f'{BASE_URL}index.htm', {RegisterPage.READY_LOCATOR}),
+        (f'{BASE_URL}register.htm', set()),
+    ], ids=['blank', 'other_page', 'same_url_not_ready'])
+    def test_navigates_when_page_not_satisfied(self, current_url: str, present: set):
+        """Test case to verify that the router loads the page when the current document doesn't satisfy it."""
+        driver = FakeDriver(current_url, present)
+        router = PageRouter(driver, BASE_URL)
+        router.open(RegisterPage)
+        assert driver.visited == [f'{BASE_URL}register.htm']
+        assert (router.navigations, router.navigations_avoided) == (1, 0)
+
+    def test_base_url_read_from_config(self):
+        """Test case to verify that page URLs resolve against the configured base URL by default."""
+        router = PageRouter(FakeDriver())
+        assert router.resolve(RegisterPage.URL) == f'{router.base_url}register.htm'
+        assert router.base_url.endswith('/')
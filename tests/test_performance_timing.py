@@ -0,0 +1,76 @@
+"""
+Test module for the page load timing and performance budgets, run against an in-process fake driver.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import pytest
+from pages.base_page import BasePage
+from pages.register_page import RegisterPage
+from utils.performance_timing import PerformanceRecorder, PerformanceBudgetExceeded
+
+BASE_URL = 'http://parabank.test/parabank/'
+
+
+class StatementPage(BasePage):
+    """Page object declaring a tighter load budget than the default."""
+
+    URL = 'statement.htm'
+    PERFORMANCE_BUDGET = {'load': 2000}
+
+
+class FakeDriver:
+    """Driver whose current document has a fixed timing, answering the page timing script."""
+
+    def __init__(self, url: str, load: float, time_origin: float = 1.0):
+        self.timing = {'url': url, 'time_origin': time_origin, 'ttfb': 100, 'dom_content_loaded': 500, 'load': load,
+                       'slowest_resources': []}
+        self.scripts = 0
+
+    def execute_script(self, script: str, *args) -> dict:
+        self.scripts += 1
+        return dict(self.timing)
+
+
+class TestPerformanceTiming:
+    """Test suite for the performance budgets."""
+
+    def test_page_object_construction_has_no_side_effects(self):
+        """Test case to verify that constructing a page object doesn't read or check the current document."""
+        driver = FakeDriver(f'{BASE_URL}index.htm', load=60000)
+        RegisterPage(driver)
+        assert driver.scripts == 0
+
+    def test_page_budget_overrides_default(self):
+        """Test case to verify that a page URL's budget overrides single metrics of the default budget."""
+        recorder = PerformanceRecorder(page_budgets={'register.htm': {'load': 10000}})
+        assert recorder.budget_for(f'{BASE_URL}register.htm;jsessionid=ABC123')['load'] == 10000
+        assert recorder.budget_for(f'{BASE_URL}register.htm')['ttfb'] == recorder.budget['ttfb']
+        assert recorder.budget_for(f'{BASE_URL}index.htm') == recorder.budget
+        recorder.record(FakeDriver(f'{BASE_URL}register.htm', load=9000))
+        assert recorder.violations == []
+
+    def test_violation_fails_the_test_once_enforced(self):
+        """Test case to verify that a document over budget is remembered and fails the test when enforced."""
+        recorder = PerformanceRecorder(budget={'load': 8000})
+        driver = FakeDriver(f'{BASE_URL}index.htm', load=9000)
+        recorder.record(driver)
+        recorder.record(driver)
+        assert len(recorder.violations) == 1, 'The same document was checked twice.'
+        assert recorder.records[0]['budget_violations'] == ['load 9000 ms > 8000 ms']
+        with pytest.raises(PerformanceBudgetExceeded, match='index.htm exceeded its performance budget'):
+            recorder.enforce()
+        recorder.enforce_budgets = False
+        recorder.enforce()
+
+    def test_page_declared_budget_fails_test(self):
+        """Test case to verify that the budget declared by the page object of a document fails a slow load."""
+        recorder = PerformanceRecorder()
+        assert recorder.budget_for(f'{BASE_URL}statement.htm;jsessionid=ABC123') == dict(recorder.budget, load=2000)
+        recorder.record(FakeDriver(f'{BASE_URL}statement.htm', load=3000))
+        with pytest.raises(PerformanceBudgetExceeded, match='statement.htm exceeded its performance budget: load'):
+            recorder.enforce()
+        overridden = PerformanceRecorder(page_budgets={'statement.htm': {'load': 5000}})
+        overridden.record(FakeDriver(f'{BASE_URL}statement.htm', load=3000))
+        assert overridden.violations == [], 'The configured override did not take precedence over the page budget.'
@@ -0,0 +1,112 @@
+"""
+Test module for the protocol-level request templates and their replay, run offline against the local ParaBank stand-in.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import json
+import pytest
+from urllib.parse import urlencode
+from utils.protocol_load import extract_requests, build_template, ProtocolReplayer
+from utils.stand_in_server import StandInServer
+
+BASE_URL = 'http://parabank.test/parabank/'
+DATA = {'first_name': 'Ada', 'last_name': 'Lovelace', 'address': '12 Main St', 'city': 'London', 'state': 'LDN',
+        'zip_code': '10001', 'phone': '5550100', 'ssn': '123-45-6789', 'username': 'ada1a2b3c',
+        'password': 'Pa$$w0rd', 'confirm_password': 'Pa$$w0rd'}
+REGISTER_FORM = {'customer.firstName': 'Ada', 'customer.lastName': 'Lovelace', 'customer.address.street': '12 Main St',
+                 'customer.address.city': 'London', 'customer.address.state': 'LDN',
+                 'customer.address.zipCode': '10001', 'customer.phoneNumber': '5550100',
+                 'customer.ssn': '123-45-6789', 'customer.username': 'ada1a2b3c', 'customer.password': 'Pa$$w0rd',
+                 'repeatedPassword': 'Pa$$w0rd'}
+
+
+def log_entry(method: str, **params) -> dict:
+    """Builds one Chrome performance log entry wrapping a DevTools event."""
+    return {'level': 'INFO', 'timestamp': 0, 'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def request_sent(url: str, resource_type: str = 'Document', method: str = 'GET', post_data: str = None,
+                 **params) -> dict:
+    """Builds the log entry of a Network.requestWillBeSent event."""
+    request = {'url': url, 'method': method}
+    if post_data is not None:
+        request['postData'] = post_data
+    return log_entry('Network.requestWillBeSent', request=request, type=resource_type, **params)
+
+
+@pytest.fixture
+def recorded_log() -> list[dict]:
+    """Fixture with the performance log of a recorded register-and-login flow against the stand-in."""
+    return [
+        request_sent(f'{BASE_URL}register.htm'),
+        log_entry('Network.responseReceived', response={'url': f'{BASE_URL}register.htm', 'status': 200}),
+        request_sent(f'{BASE_URL}style.css', 'Stylesheet'),
+        request_sent('data:image/png;base64,AAAA', 'Image'),
+        request_sent(f'{BASE_URL}register.htm;jsessionid=0A1B2C', method='POST', post_data=urlencode(REGISTER_FORM)),
+        request_sent(f'{BASE_URL}index.htm'),
+        request_sent(f'{BASE_URL}login.htm', method='POST',
+                     post_data=urlencode({'username': 'ada1a2b3c', 'password': 'Pa$$w0rd'})),
+        request_sent(f'{BASE_URL}overview.htm', redirectResponse={'status': 302}),
+    ]
+
+
+@pytest.fixture
+def template(recorded_log: list[dict]) -> dict:
+    """Fixture with the request template built from the recorded log and the headings the UI saw."""
+    requests = extract_requests(recorded_log)
+    markers = ['Signing up is easy!', 'Welcome ada1a2b3c', 'ParaBank | Welcome | Online Banking', 'Accounts Overview']
+    for request, marker in zip(requests, markers):
+        request['expect'] = marker
+    return build_template(requests, BASE_URL, DATA)
+
+
+@pytest.fixture
+def stand_in():
+    """Fixture that serves the ParaBank stand-in on a free local port."""
+    with StandInServer() as server:
+        yield server
+
+
+class TestProtocolLoad:
+    """Test suite for the protocol-level load mode."""
+
+    def test_extract_document_requests(self, recorded_log: list[dict]):
+        """Test case to verify that only documents are extracted, without redirect follow-ups or non-HTTP URLs."""
+        requests = extract_requests(recorded_log)
+        assert [(request['method'], request['url'].rsplit('/', 1)[-1]) for request in requests] == [
+            ('GET', 'register.htm'), ('POST', 'register.htm;jsessionid=0A1B2C'), ('GET', 'index.htm'),
+            ('POST', 'login.htm')]
+        with_assets = extract_requests(recorded_log, include_assets=True)
+        assert [request['type'] for request in with_assets] == ['Document', 'Stylesheet', 'Document', 'Document',
+                                                               'Document']
+
+    def test_template_parameterized(self, template: dict):
+        """Test case to verify that the template uses placeholders for the user data, base URL and success markers."""
+        steps = template['steps']
+        assert [step['name'] for step in steps] == ['GET register.htm', 'POST register.htm', 'GET index.htm',
+                                                   'POST login.htm']
+        assert steps[1]['url'] == '${base_url}register.htm', 'The session id was kept in the URL.'
+        form = dict(steps[1]['form'])
+        assert form['customer.username'] == '${username}' and form['repeatedPassword'] == '${password}'
+        assert steps[3]['form'] == [['username', '${username}'], ['password', '${password}']]
+        assert [step['expect'] for step in steps] == ['Signing up is easy!', 'Welcome ${username}',
+                                                     'ParaBank | Welcome | Online Banking', 'Accounts Overview']
+        assert 'username' in template['parameters'] and 'password' in template['parameters']
+
+    def test_replay_against_stand_in(self, template: dict, stand_in: StandInServer):
+        """Test case to verify that a replayed template registers and logs in customers without errors."""
+        replayer = ProtocolReplayer(template, stand_in.base_url, users=2, duration=0.5, report_interval=60)
+        rows = {row['step']: row for row in replayer.run()}
+        assert rows['POST login.htm']['count'] >= 2
+        assert all(row['error_rate'] == 0 for row in rows.values()), f'Failing steps: {rows}'
+        assert len(stand_in.customers) >= 2
+
+    def test_error_page_with_success_status_fails(self, template: dict, stand_in: StandInServer):
+        """Test case to verify that a 200 error page without the step's success marker counts as an error."""
+        template['steps'] = template['steps'][2:]
+        replayer = ProtocolReplayer(template, stand_in.base_url, users=1, duration=0.2, report_interval=60)
+        rows = {row['step']: row for row in replayer.run()}
+        assert rows['GET index.htm']['error_rate'] == 0
+        assert rows['POST login.htm']['error_rate'] == 1, 'The login error page was counted as a success.'
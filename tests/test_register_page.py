@@ -8,16 +8,19 @@ Test module for the Register Page.
 import pytest
 from selenium.webdriver.remote.webdriver import WebDriver
 from pages.register_page import RegisterPage
+from utils.flow_plan import FlowPlan
+from utils.page_router import PageRouter
+from utils.data_generator import generate_register_data
 
 
 @pytest.mark.order(1)
 class TestRegisterPage:
     """Test suite for user registration functionality."""
 
-    def test_register_new_user(self, browser: WebDriver, register_data: dict):
+    @pytest.mark.chain('customer')
+    def test_register_new_user(self, router: PageRouter, register_data: dict):
         """Test case to verify that a new user can register successfully."""
-        browser.get('https://parabank.parasoft.com/parabank/register.htm')
-        register_page = RegisterPage(browser)
+        register_page = router.open(RegisterPage)
         register_page.register_user(user_data=register_data)
         expected_welcome_message: str = f'Welcome {register_data["username"]}'
         actual_welcome_message: str = register_page.get_welcome_message()
@@ -25,15 +28,27 @@ class TestRegisterPage:
             f'The expected welcome message is {expected_welcome_message}, but the actual '
             f'welcome message is {actual_welcome_message}')
 
+    def test_register_new_user_with_flow_plan(self, browser: WebDriver, router: PageRouter):
+        """Test case to verify that another new user can register successfully through a flow plan."""
+        user_data = generate_register_data()
+        plan = (FlowPlan('register', fresh_session=True)
+                .input(RegisterPage, 'register_user', url=RegisterPage.URL, user_data=user_data)
+                .read(RegisterPage, 'WELCOME_TITLE', name='welcome_message'))
+        result = plan.compile().run(browser, router=router)
+        expected_welcome_message: str = f'Welcome {user_data["username"]}'
+        actual_welcome_message: str = result['welcome_message']
+        assert expected_welcome_message == actual_welcome_message, (
+            f'The expected welcome message is {expected_welcome_message}, but the actual '
+            f'welcome message is {actual_welcome_message}')
+
     @pytest.mark.parametrize("missing_field", ["first_name", "last_name", "address", "city", "state", "zip_code", "ssn",
                                                "username", "password", "confirm_password"])
-    def test_register_with_missing_required_field_input(self, browser: WebDriver, register_data: dict,
+    def test_register_with_missing_required_field_input(self, router: PageRouter, register_data: dict,
                                                         missing_field: str):
         """Test case to verify registration fails when a required field is missing."""
-        browser.get('https://parabank.parasoft.com/parabank/register.htm')
         user_data = register_data.copy()
         user_data.pop(missing_field)
-        register_page = RegisterPage(browser)
+        register_page = router.open(RegisterPage)
         register_page.register_user(user_data=user_data)
         popup_error_message: str = register_page.get_popup_error_message(missing_field)
         assert popup_error_message is not None, (
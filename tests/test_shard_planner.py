@@ -0,0 +1,81 @@
+"""
+Test module for the duration-aware shard planner, run against stand-in collection items.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import random
+from pathlib import Path
+from dataclasses import dataclass
+from utils.shard_planner import TimingHistory, build_units, partition, order_failing_first
+
+
+@dataclass(frozen=True)
+class Item:
+    """Stand-in for a collected pytest item."""
+    nodeid: str
+    duration: float = 1.0
+    group: str | None = None
+    chain: str | None = None
+    failures: float = 0.0
+
+
+def plan(items: list[Item], shard_count: int) -> list[list[str]]:
+    """Plans the shards of the items and returns the node ids every shard runs, in order."""
+    units = build_units(items, chain_of=lambda item: item.chain, group_of=lambda item: item.group)
+    shards = partition(units, shard_count, duration_of=lambda item: item.duration)
+    return [[item.nodeid for item in order_failing_first(shard, lambda item: item.failures)] for shard in shards]
+
+
+class TestShardPlanner:
+    """Test suite for the shard planner."""
+
+    def test_shards_balanced_by_duration(self):
+        """Test case to verify that the longest-processing-time packing balances the shard durations."""
+        durations = {'a': 5, 'b': 4, 'c': 3, 'd': 3, 'e': 3, 'f': 2}
+        items = [Item(nodeid, duration) for nodeid, duration in durations.items()]
+        shards = plan(items, 2)
+        assert sorted(sum(durations[nodeid] for nodeid in shard) for shard in shards) == [10, 10]
+        assert sorted(nodeid for shard in shards for nodeid in shard) == sorted(durations), 'A test was lost.'
+
+    def test_plan_deterministic(self):
+        """Test case to verify that every node computes the same plan, ties included, for the same collection."""
+        rng = random.Random(7)
+        items = [Item(f'test_{index}', rng.choice([1.0, 2.0, 3.0])) for index in range(40)]
+        assert plan(items, 3) == plan(list(items), 3)
+        assert len({nodeid for shard in plan(items, 3) for nodeid in shard}) == 40
+
+    def test_chain_kept_together_in_order(self):
+        """Test case to verify that a chain spanning classes runs in order on one shard, with the classes it touches."""
+        items = [Item('forgot::TestLookup::test_lookup', group='TestLookup', chain='account'),
+                 Item('home::TestHome::test_login', group='TestHome', chain='account'),
+                 Item('home::TestHome::test_title', group='TestHome'),
+                 Item('register::TestRegister::test_register', group='TestRegister', chain='account'),
+                 Item('other::test_a', 4.0), Item('other::test_b', 4.0)]
+        shards = plan(items, 3)
+        chained = [shard for shard in shards if 'home::TestHome::test_login' in shard]
+        assert chained == [['forgot::TestLookup::test_lookup', 'home::TestHome::test_login',
+                            'home::TestHome::test_title', 'register::TestRegister::test_register']]
+
+    def test_failing_first_keeps_classes_whole(self):
+        """Test case to verify that failing-first moves whole classes, never splitting a class-scoped browser."""
+        items = [Item('a::TestA::test_1', group='TestA'), Item('a::TestA::test_2', group='TestA'),
+                 Item('b::TestB::test_1', group='TestB'), Item('b::TestB::test_2', group='TestB', failures=1.0),
+                 Item('b::TestB::test_3', group='TestB'), Item('c::test_module_level', failures=0.5)]
+        assert plan(items, 1) == [['b::TestB::test_1', 'b::TestB::test_2', 'b::TestB::test_3', 'c::test_module_level',
+                                   'a::TestA::test_1', 'a::TestA::test_2']]
+
+    def test_history_merged(self, tmp_path: Path):
+        """Test case to verify that saving merges into the existing history and keeps durations of unrun tests."""
+        path = tmp_path / '.test_durations.json'
+        history = TimingHistory(str(path))
+        history.update('a', 2.0, failed=False)
+        history.update('b', 5.0, failed=True)
+        history.save()
+        history = TimingHistory(str(path))
+        history.update('b', None, failed=True)
+        history.save()
+        assert TimingHistory(str(path)).tests == {'a': {'duration': 2.0, 'failures': 0.0},
+                                                  'b': {'duration': 5.0, 'failures': 1.5}}
+        assert [entry.name for entry in tmp_path.iterdir()] == ['.test_durations.json']
@@ -0,0 +1,30 @@
+"""
+Test module for the framework startup time. The wall-clock collection time is measured by
+benchmarks/bench_collection_time.py instead, since it depends on the machine.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import sys
+import subprocess
+from pathlib import Path
+
+root_path = Path(__file__).parent.parent
+
+# Modules that must only be imported on first use, never while collecting tests
+LAZY_MODULES = ['faker', 'webdriver_manager', 'selenium.webdriver.chrome', 'selenium.webdriver.firefox',
+                'selenium.webdriver.edge', 'aiohttp']
+
+
+class TestStartupTime:
+    """Test suite guarding the dependencies loaded while collecting the test suite."""
+
+    def test_heavy_dependencies_are_lazy(self):
+        """Test case to verify that importing conftest doesn't load the lazily imported dependencies."""
+        script = (f'import sys; sys.path.insert(0, "tests"); import conftest; '
+                  f'print(",".join(m for m in {LAZY_MODULES!r} if m in sys.modules))')
+        result = subprocess.run([sys.executable, '-c', script], cwd=root_path, capture_output=True, text=True)
+        assert result.returncode == 0, f'Importing conftest failed: {result.stderr}'
+        eagerly_imported = result.stdout.strip()
+        assert not eagerly_imported, f'These modules are imported at collection time: {eagerly_imported}'
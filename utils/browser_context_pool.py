@@ -0,0 +1,197 @@
+"""
+Browser context pool for the ParaBank automation framework.
+
+Hosts many isolated browser contexts (separate cookie jars and storage, one tab each) inside a single
+Chromium-based browser process, so several page-object flows can share one WebDriver session without
+sharing state.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import threading
+from typing import Callable, Iterable
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from .logger import Logger
+
+ISOLATION_PROBE_COOKIE = 'context_isolation_probe'
+ISOLATION_PROBE_DOMAIN = 'isolation.probe.invalid'
+
+
+class BrowserContext:
+    """An isolated browser context bound to a single window handle of the host browser."""
+
+    def __init__(self, pool: 'BrowserContextPool', context_id: str, window_handle: str):
+        self.pool = pool
+        self.context_id = context_id
+        self.window_handle = window_handle
+
+    def activate(self) -> None:
+        """Switches the host driver to this context's window if it isn't already active."""
+        self.pool.activate(self.window_handle)
+
+    def close(self) -> None:
+        """Closes this context's window and disposes the context together with its cookies and storage."""
+        self.pool.close_context(self)
+
+    def __enter__(self) -> 'BrowserContext':
+        """Takes exclusive use of the host driver and activates this context's window."""
+        self.pool.lock.acquire()
+        try:
+            self.activate()
+        except Exception:
+            self.pool.lock.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Releases the host driver for other contexts."""
+        self.pool.lock.release()
+
+
+class BrowserContextPool:
+    """Creates, switches between and disposes isolated browser contexts of one WebDriver session."""
+
+    def __init__(self, driver: WebDriver):
+        self.logger = Logger(__name__)
+        self.driver = driver
+        self._validate_driver()
+        self.lock = threading.RLock()
+        self.host_handle = driver.current_window_handle
+        self._active_handle = self.host_handle
+        self.contexts: list[BrowserContext] = []
+
+    def _validate_driver(self) -> None:
+        """Validate that the driver can create isolated contexts through the Chrome DevTools Protocol."""
+        if not hasattr(self.driver, 'execute_cdp_cmd'):
+            self.logger.error(f'Browser contexts are not supported by {type(self.driver).__name__}')
+            raise ValueError('Isolated browser contexts require a Chromium-based browser (chrome or edge).')
+
+    def create_context(self, url: str = 'about:blank', timeout: int = 10) -> BrowserContext:
+        """
+        Creates a new isolated browser context with a single tab.
+
+        :param url: The URL to open in the context's tab. Default is a blank page.
+        :param timeout: The max time to wait for the tab to be exposed as a window handle. Default is 10 sec.
+        :return: The created BrowserContext.
+        :raises TimeoutException: When the new tab doesn't appear as a window handle within the timeout.
+        :raises WebDriverException: When the context can't be created or isn't isolated.
+        """
+        with self.lock:
+            try:
+                existing_handles = set(self.driver.window_handles)
+                context_id = self.driver.execute_cdp_cmd(
+                    'Target.createBrowserContext', {'disposeOnDetach': True})['browserContextId']
+                target_id = self.driver.execute_cdp_cmd(
+                    'Target.createTarget', {'url': url, 'browserContextId': context_id})['targetId']
+                new_handles = WebDriverWait(self.driver, timeout).until(
+                    lambda driver: set(driver.window_handles) - existing_handles
+                )
+                window_handle = target_id if target_id in new_handles else new_handles.pop()
+                self._verify_isolation(context_id)
+            except TimeoutException as e:
+                self.logger.error(f'Timeout! The new browser context tab did not appear within {timeout} seconds.')
+                raise TimeoutException('Browser context tab not exposed as a window handle.') from e
+            except WebDriverException as e:
+                self.logger.error(f'Failed to create a browser context. Error: {e}')
+                raise WebDriverException('An error occurred while creating a browser context.') from e
+            context = BrowserContext(pool=self, context_id=context_id, window_handle=window_handle)
+            self.contexts.append(context)
+            self.logger.info(f'Created browser context {context_id} bound to window {window_handle}')
+            return context
+
+    def _verify_isolation(self, context_id: str) -> None:
+        """
+        Verifies that a freshly created context starts with an empty cookie jar, and that a probe cookie set in it
+        stays invisible to the host browser and to every other context of the pool.
+
+        :param context_id: The id of the browser context.
+        :raises WebDriverException: When the context shares cookies with another context.
+        """
+        if self._get_cookies(context_id):
+            raise WebDriverException(f'Browser context {context_id} is not isolated: it already holds cookies.')
+        probe = {'name': ISOLATION_PROBE_COOKIE, 'value': context_id, 'domain': ISOLATION_PROBE_DOMAIN, 'path': '/'}
+        self.driver.execute_cdp_cmd('Storage.setCookies', {'cookies': [probe], 'browserContextId': context_id})
+        try:
+            for other_id in [None] + [context.context_id for context in self.contexts]:
+                if any(cookie['name'] == ISOLATION_PROBE_COOKIE and cookie['value'] == context_id
+                       for cookie in self._get_cookies(other_id)):
+                    other = 'the host browser' if other_id is None else f'context {other_id}'
+                    raise WebDriverException(f'Browser context {context_id} is not isolated: {other} sees its cookies.')
+        finally:
+            self.driver.execute_cdp_cmd('Storage.clearCookies', {'browserContextId': context_id})
+
+    def _get_cookies(self, context_id: str | None) -> list[dict]:
+        """
+        Reads every cookie of a browser context.
+
+        :param context_id: The id of the browser context, or None for the host browser's default context.
+        :return: The cookies.
+        """
+        params = {'browserContextId': context_id} if context_id else {}
+        return self.driver.execute_cdp_cmd('Storage.getCookies', params).get('cookies', [])
+
+    def activate(self, window_handle: str) -> None:
+        """
+        Switches the driver to the given window handle, skipping the round-trip when it is already active.
+
+        :param window_handle: The window handle to activate.
+        """
+        with self.lock:
+            if self._active_handle != window_handle:
+                self.driver.switch_to.window(window_handle)
+                self._active_handle = window_handle
+
+    def close_context(self, context: BrowserContext) -> None:
+        """
+        Closes a context's window and disposes the context.
+
+        :param context: The context to dispose.
+        """
+        with self.lock:
+            try:
+                self.activate(context.window_handle)
+                self.driver.close()
+                self.driver.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': context.context_id})
+                self.logger.info(f'Disposed browser context {context.context_id}')
+            except WebDriverException as e:
+                self.logger.warning(f'Failed to dispose browser context {context.context_id}. Error: {e}')
+            finally:
+                if context in self.contexts:
+                    self.contexts.remove(context)
+                self.driver.switch_to.window(self.host_handle)
+                self._active_handle = self.host_handle
+
+    def close_all(self) -> None:
+        """Disposes every context created by this pool."""
+        for context in list(self.contexts):
+            self.close_context(context)
+
+    def run_interleaved(self, flows: Iterable[tuple[BrowserContext, list[Callable]]]) -> dict[str, Exception]:
+        """
+        Runs several page-object flows round-robin, one step at a time, each inside its own context.
+
+        A flow that raises stops at the failing step; the remaining flows keep running.
+
+        :param flows: Pairs of a context and the list of zero-argument steps to run in it.
+        :return: A mapping of context id to the exception that stopped its flow, for failed flows only.
+        """
+        pending = [(context, iter(steps)) for context, steps in flows]
+        failures = {}
+        while pending:
+            still_running = []
+            for context, steps in pending:
+                step = next(steps, None)
+                if step is None:
+                    continue
+                try:
+                    with context:
+                        step()
+                    still_running.append((context, steps))
+                except Exception as e:
+                    self.logger.error(f'Flow in browser context {context.context_id} failed. Error: {e}')
+                    failures[context.context_id] = e
+            pending = still_running
+        return failures
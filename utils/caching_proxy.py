@@ -0,0 +1,297 @@
+"""
+Local caching forward proxy for the static assets of the application under test.
+
+Browsers start with a cold HTTP cache (they run in incognito/private mode), so every test class re-downloads the
+same stylesheets, scripts and images. The proxy serves those assets from an on-disk cache shared by all browsers of
+the session and passes everything else, including form POSTs and pages, through to the origin untouched. HTTPS
+traffic is tunnelled (CONNECT) without being inspected, so only plain-HTTP origins benefit from the cache; the test
+session therefore only starts the proxy for a plain-HTTP base URL, such as the local stand-in server.
+
+Usage:
+    python -m utils.caching_proxy --port 8899 --cache-dir .asset_cache
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import os
+import json
+import time
+import socket
+import select
+import hashlib
+import argparse
+import threading
+import http.client
+from pathlib import Path
+from typing import Mapping
+from urllib.parse import urlsplit
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from .page_router import SESSION_ID_PATTERN
+
+STATIC_EXTENSIONS = ('.css', '.js', '.png', '.gif', '.jpg', '.jpeg', '.svg', '.ico', '.woff', '.woff2', '.ttf')
+HOP_BY_HOP_HEADERS = {'connection', 'proxy-connection', 'keep-alive', 'transfer-encoding', 'te', 'trailer',
+                      'upgrade', 'proxy-authorization', 'proxy-authenticate'}
+
+
+def is_static_asset(url: str) -> bool:
+    """Whether the URL points to a static asset, judged by the extension of its path."""
+    return SESSION_ID_PATTERN.sub('', urlsplit(url).path).lower().endswith(STATIC_EXTENSIONS)
+
+
+class AssetCache:
+    """
+    On-disk cache of asset responses keyed by URL, safe to share between processes.
+
+    Every entry is a single file holding the headers (one JSON line) followed by the body, so it is replaced with one
+    atomic rename. Responses with a Vary header are stored per value of the request headers they vary on, which an
+    index file per URL lists.
+    """
+
+    def __init__(self, cache_dir: str, ttl: float = 24 * 60 * 60):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    def _path(self, url: str, vary: list[str] = (), request_headers: Mapping[str, str] = None) -> Path:
+        key = SESSION_ID_PATTERN.sub('', url)
+        if vary:
+            values = {name.lower(): value for name, value in request_headers.items()}
+            key += ''.join(f'\n{name}: {values.get(name, "")}' for name in vary)
+        return self.cache_dir / hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, url: str, request_headers: Mapping[str, str] = None) -> tuple[dict, bytes] | None:
+        """
+        Looks up a fresh cached response.
+
+        :param url: The asset URL.
+        :param request_headers: The request headers, matched against the Vary header of the cached response.
+        :return: The cached headers and body, or None when the asset isn't cached or has expired.
+        """
+        try:
+            vary = json.loads(self._path(url).with_suffix('.vary').read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            vary = []
+        path = self._path(url, vary, request_headers or {})
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            meta, _, body = path.read_bytes().partition(b'\n')
+            return json.loads(meta), body
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, url: str, headers: dict, body: bytes, request_headers: Mapping[str, str] = None) -> None:
+        """
+        Stores a response, writing through temporary files so concurrent readers never see partial entries.
+
+        :param url: The asset URL.
+        :param headers: The response headers to replay.
+        :param body: The response body.
+        :param request_headers: The request headers, stored against when the response has a Vary header.
+        """
+        vary_header = ','.join(value for name, value in headers.items() if name.lower() == 'vary')
+        vary = sorted({name.strip().lower() for name in vary_header.split(',') if name.strip()})
+        if '*' in vary:
+            return
+        if vary:
+            self._write(self._path(url).with_suffix('.vary'), json.dumps(vary).encode())
+        self._write(self._path(url, vary, request_headers or {}), json.dumps(headers).encode() + b'\n' + body)
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        """Writes a file through a temporary file and an atomic rename."""
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+
+class CachingProxyHandler(BaseHTTPRequestHandler):
+    """Forward-proxy request handler serving static assets from the cache."""
+
+    protocol_version = 'HTTP/1.1'
+    server: 'CachingProxy'
+
+    def log_message(self, format, *args) -> None:
+        """Silence the default per-request stderr logging."""
+
+    def do_GET(self) -> None:
+        if not is_static_asset(self.path):
+            return self._forward()
+        cached = self.server.cache.get(self.path, self.headers)
+        if cached is not None:
+            headers, body = cached
+            self.server.count('hits', len(body))
+            return self._send(200, headers, body)
+        status, headers, body = self._fetch()
+        if status is None:
+            return
+        cache_control = headers.get('Cache-Control', '').lower()
+        if status == 200 and 'no-store' not in cache_control and 'private' not in cache_control:
+            self.server.cache.put(self.path, {name: value for name, value in headers.items() if name != 'Set-Cookie'},
+                                  body, self.headers)
+        self.server.count('misses')
+        self._send(status, headers, body)
+
+    def do_POST(self) -> None:
+        self._forward()
+
+    do_HEAD = do_PUT = do_DELETE = do_OPTIONS = do_PATCH = do_POST
+
+    def do_CONNECT(self) -> None:
+        """Tunnels HTTPS traffic to the origin without inspecting it."""
+        host, _, port = self.path.partition(':')
+        try:
+            upstream = socket.create_connection((host, int(port or 443)), timeout=self.server.upstream_timeout)
+        except OSError:
+            self.send_error(502)
+            return
+        self.server.count('tunnels')
+        self.send_response(200, 'Connection Established')
+        self.end_headers()
+        sockets = [self.connection, upstream]
+        try:
+            while True:
+                readable, _, errored = select.select(sockets, [], sockets, self.server.upstream_timeout)
+                if errored or not readable:
+                    break
+                for source in readable:
+                    data = source.recv(64 * 1024)
+                    if not data:
+                        return
+                    (upstream if source is self.connection else self.connection).sendall(data)
+        except OSError:
+            pass
+        finally:
+            upstream.close()
+            self.close_connection = True
+
+    def _forward(self) -> None:
+        """Passes the request through to the origin untouched."""
+        status, headers, body = self._fetch()
+        if status is not None:
+            self.server.count('passed_through')
+            self._send(status, headers, body)
+
+    def _fetch(self) -> tuple[int | None, dict, bytes]:
+        """
+        Sends the request to the origin.
+
+        :return: The origin's status, end-to-end headers and body; the status is None when the request failed.
+        """
+        url = urlsplit(self.path)
+        if not url.hostname:
+            self.send_error(400, 'Proxy requests must use an absolute URL')
+            return None, {}, b''
+        length = int(self.headers.get('Content-Length', 0))
+        request_body = self.rfile.read(length) if length else None
+        headers = {name: value for name, value in self.headers.items() if name.lower() not in HOP_BY_HOP_HEADERS}
+        connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        connection = connection_class(url.hostname, url.port, timeout=self.server.upstream_timeout)
+        try:
+            target = url.path + (f'?{url.query}' if url.query else '')
+            connection.request(self.command, target or '/', body=request_body, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+            response_headers = {name: value for name, value in response.getheaders()
+                                if name.lower() not in HOP_BY_HOP_HEADERS | {'content-length', 'set-cookie'}}
+            # Set-Cookie may repeat, so it is carried as a list
+            cookies = response.msg.get_all('Set-Cookie')
+            if cookies:
+                response_headers['Set-Cookie'] = cookies
+            return response.status, response_headers, body
+        except (OSError, http.client.HTTPException) as e:
+            self.server.count('errors')
+            self.send_error(502, f'Origin unreachable: {e}')
+            return None, {}, b''
+        finally:
+            connection.close()
+
+    def _send(self, status: int, headers: dict, body: bytes) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            for item in value if isinstance(value, list) else [value]:
+                self.send_header(name, item)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+
+class CachingProxy(ThreadingHTTPServer):
+    """In-process caching forward proxy running on a background thread."""
+
+    daemon_threads = True
+
+    def __init__(self, cache_dir: str = '.asset_cache', host: str = '127.0.0.1', port: int = 0,
+                 ttl: float = 24 * 60 * 60, timeout: float = 30):
+        super().__init__((host, port), CachingProxyHandler)
+        self.cache = AssetCache(cache_dir, ttl)
+        self.upstream_timeout = timeout
+        self.stats = {'hits': 0, 'misses': 0, 'passed_through': 0, 'tunnels': 0, 'errors': 0, 'bytes_saved': 0}
+        self._stats_lock = threading.Lock()
+        self._thread = None
+
+    @classmethod
+    def from_config(cls, settings: dict) -> 'CachingProxy':
+        """
+        Creates a proxy from the "caching_proxy" section of the configuration file.
+
+        :param settings: The configuration section.
+        :return: The proxy.
+        """
+        return cls(cache_dir=settings.get('cache_dir', '.asset_cache'), port=settings.get('port', 0),
+                   ttl=settings.get('ttl_seconds', 24 * 60 * 60))
+
+    @property
+    def address(self) -> str:
+        """The host:port browsers use as their proxy server."""
+        host, port = self.server_address[:2]
+        return f'{host}:{port}'
+
+    def count(self, stat: str, saved_bytes: int = 0) -> None:
+        """Increments a stat counter, and the saved bytes for cache hits."""
+        with self._stats_lock:
+            self.stats[stat] += 1
+            self.stats['bytes_saved'] += saved_bytes
+
+    def hit_ratio(self) -> float:
+        """The share of static asset requests served from the cache."""
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    def start(self) -> 'CachingProxy':
+        """Starts serving on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name='caching-proxy', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and releases the socket."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> 'CachingProxy':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Run the local caching proxy for static assets.')
+    parser.add_argument('--host', default='127.0.0.1', help='interface to bind')
+    parser.add_argument('--port', type=int, default=8899, help='port to listen on')
+    parser.add_argument('--cache-dir', default='.asset_cache', help='directory of the on-disk cache')
+    args = parser.parse_args()
+    proxy = CachingProxy(args.cache_dir, args.host, args.port)
+    print(f'Caching proxy listening on {proxy.address}')
+    try:
+        proxy.serve_forever()
+    except KeyboardInterrupt:
+        proxy.server_close()
+        print(f'Cache stats: {proxy.stats}')
+
+
+if __name__ == '__main__':
+    main()
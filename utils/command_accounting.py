@@ -0,0 +1,93 @@
+"""
+WebDriver wire-command accounting for the ParaBank automation framework.
+
+Counts the wire commands a test sends to the driver server, attributes them to the page-object method that issued
+them, records their latency, and tunes the keep-alive connection pool of the driver's command executor.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import sys
+from selenium.webdriver.remote.webdriver import WebDriver
+from .logger import Logger
+from .command_listeners import CommandListener, get_target
+
+logger = Logger(__name__)
+
+
+def get_page_object_method() -> str:
+    """
+    Finds the outermost page-object method on the call stack, i.e. the one a test or flow called.
+
+    :return: A label such as "RegisterPage.register_user", or "<test>" for commands sent outside page objects.
+    """
+    label = '<test>'
+    frame = sys._getframe(1)
+    while frame is not None:
+        instance = frame.f_locals.get('self')
+        if instance is not None and frame.f_globals.get('__name__', '').startswith('pages.'):
+            label = f'{type(instance).__name__}.{frame.f_code.co_name}'
+        frame = frame.f_back
+    return label
+
+
+class CommandAccountant(CommandListener):
+    """Accumulates the count and latency of wire commands, in total and per page-object method."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.by_method: dict[str, dict] = {}
+
+    def after_command(self, driver: WebDriver, command: str, params: dict, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        entry = self.by_method.setdefault(get_page_object_method(), {'count': 0, 'time_ms': 0.0, 'commands': {}})
+        entry['count'] += 1
+        entry['time_ms'] += duration * 1000
+        entry['commands'][command] = entry['commands'].get(command, 0) + 1
+
+    def summary(self) -> dict:
+        """
+        Summarizes the accounted commands.
+
+        :return: The total count and time, and the per page-object method breakdown.
+        """
+        return {
+            'count': self.count,
+            'time_ms': round(self.total_time * 1000, 1),
+            'by_method': {label: dict(entry, time_ms=round(entry['time_ms'], 1))
+                          for label, entry in sorted(self.by_method.items(), key=lambda item: -item[1]['count'])},
+        }
+
+
+def configure_command_connection(driver: WebDriver, pool_size: int = 1, pool_block: bool = False) -> None:
+    """
+    Sizes the keep-alive connection pool the driver uses to send commands to the driver server.
+
+    Keep-alive itself is chosen when the driver is created (see WebDriverInitializer). The local Chrome, Firefox and
+    Edge drivers build their command executor and its ClientConfig themselves, so the pool settings go into that
+    ClientConfig afterwards and the executor's pool is rebuilt from it, releasing the connections of the old pool.
+
+    :param driver: The WebDriver (or DriverProxy).
+    :param pool_size: The max number of idle connections kept for reuse; raise it when several threads share a driver.
+    :param pool_block: Whether to wait for a free connection instead of opening a throwaway one when the pool is busy.
+    """
+    executor = get_target(driver).command_executor
+    client_config = getattr(executor, 'client_config', None)
+    if client_config is None or not client_config.keep_alive:
+        logger.info('Command connection pool not configured: keep-alive is off')
+        return
+    client_config.init_args_for_pool_manager = {
+        'init_args_for_pool_manager': {'maxsize': pool_size, 'block': pool_block}
+    }
+    try:
+        previous_pool = getattr(executor, '_conn', None)
+        executor._conn = executor._get_connection_manager()
+    except AttributeError as e:
+        logger.warning(f'The command executor {type(executor).__name__} does not support connection tuning: {e}')
+        return
+    if previous_pool is not None:
+        previous_pool.clear()
+    logger.info(f'Command connection pool configured: pool size {pool_size}, blocking {pool_block}')
@@ -0,0 +1,109 @@
+"""
+Command listener module for the ParaBank automation framework.
+
+Hooks into WebDriver.execute, the single funnel every wire command goes through, so several observers
+(resource monitor, performance recorder, ...) can watch the commands a session issues.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import time
+import threading
+from selenium.webdriver.remote.webdriver import WebDriver
+
+_dispatching = threading.local()
+
+
+class CommandListener:
+    """Base class for observers of the wire commands sent by a WebDriver."""
+
+    def before_command(self, driver: WebDriver, command: str, params: dict) -> None:
+        """Called before a command is sent."""
+
+    def after_command(self, driver: WebDriver, command: str, params: dict, duration: float) -> None:
+        """Called after a command returned successfully, with its duration in seconds."""
+
+    def on_command_error(self, driver: WebDriver, command: str, params: dict, error: Exception) -> None:
+        """Called when a command raised, before the error propagates."""
+
+
+def get_target(driver: WebDriver) -> WebDriver:
+    """Returns the real WebDriver behind a DriverProxy, or the driver itself."""
+    return getattr(driver, 'wrapped_driver', driver)
+
+
+def get_command_listeners(driver: WebDriver) -> list[CommandListener]:
+    """
+    Retrieves the listeners attached to a WebDriver.
+
+    :param driver: The WebDriver (or DriverProxy).
+    :return: The attached listeners.
+    """
+    return list(get_target(driver).__dict__.get('_command_listeners', []))
+
+
+def add_command_listener(driver: WebDriver, listener: CommandListener) -> None:
+    """
+    Attaches a listener to a WebDriver, installing the dispatching execute wrapper on first use.
+
+    :param driver: The WebDriver (or DriverProxy).
+    :param listener: The listener to attach.
+    """
+    target = get_target(driver)
+    listeners = target.__dict__.get('_command_listeners')
+    if listeners is None:
+        listeners = target._command_listeners = []
+        target.execute = _create_dispatcher(target, type(target).execute.__get__(target), listeners)
+    if listener not in listeners:
+        listeners.append(listener)
+
+
+def remove_command_listener(driver: WebDriver, listener: CommandListener) -> None:
+    """
+    Detaches a listener from a WebDriver.
+
+    :param driver: The WebDriver (or DriverProxy).
+    :param listener: The listener to detach.
+    """
+    listeners = get_target(driver).__dict__.get('_command_listeners', [])
+    if listener in listeners:
+        listeners.remove(listener)
+
+
+def _create_dispatcher(target: WebDriver, execute, listeners: list[CommandListener]):
+    """
+    Creates the execute wrapper notifying the listeners around every command and of every failed command.
+
+    Commands issued by the listeners themselves are sent without notifying the listeners again.
+    """
+    def dispatching_execute(driver_command: str, params: dict = None):
+        if getattr(_dispatching, 'active', False) or not listeners:
+            return execute(driver_command, params)
+        _dispatching.active = True
+        try:
+            for listener in listeners:
+                listener.before_command(target, driver_command, params)
+        finally:
+            _dispatching.active = False
+        start = time.perf_counter()
+        try:
+            response = execute(driver_command, params)
+        except Exception as e:
+            _dispatching.active = True
+            try:
+                for listener in listeners:
+                    listener.on_command_error(target, driver_command, params, e)
+            finally:
+                _dispatching.active = False
+            raise
+        duration = time.perf_counter() - start
+        _dispatching.active = True
+        try:
+            for listener in listeners:
+                listener.after_command(target, driver_command, params, duration)
+        finally:
+            _dispatching.active = False
+        return response
+
+    return dispatching_execute
@@ -71,3 +71,15 @@ class ConfigLoader:
             raise ValueError(f'No specified options found for this browser: {browser_name}')
         self.logger.info(f'The specified options for this browser "{browser_name}" are: {browser_options}')
         return browser_options
+
+    def get_setting(self, key: str, default=None):
+        """
+        Retrieves an optional top-level setting from the configuration file.
+
+        :param key: The name of the setting.
+        :param default: The value returned when the setting isn't present.
+        :return: The setting value, or the default if it is missing.
+        """
+        value = self.config.get(key, default)
+        self.logger.info(f'The "{key}" setting is: {value}')
+        return value
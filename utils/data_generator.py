@@ -5,55 +5,79 @@ Generates fake user data for testing purposes using the Faker library.
 @date: 04/15/2025
 @contact: raedeleyan1@gmail.com
 """
-from faker import Faker
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_faker():
+    """Returns the shared Faker instance, importing and creating it on first use."""
+    from faker import Faker
+    return Faker()
 
-fake: Faker = Faker()
 
 def generate_first_name() -> str:
     """Generates a random first name."""
-    return fake.first_name()
+    return get_faker().first_name()
 
 
 def generate_last_name() -> str:
     """Generates a random last name."""
-    return fake.last_name()
+    return get_faker().last_name()
 
 
 def generate_address() -> str:
     """Generates a random address."""
-    return fake.address()
+    return get_faker().address()
 
 
 def generate_city() -> str:
     """Generates a random city."""
-    return fake.city()
+    return get_faker().city()
 
 
 def generate_state() -> str:
     """Generates a random state."""
-    return fake.state()
+    return get_faker().state()
 
 
 def generate_zipcode() -> str:
     """Generates a random zipcode."""
-    return fake.zipcode()
+    return get_faker().zipcode()
 
 
 def generate_phone_number() -> str:
     """Generates a random phone number."""
-    return fake.phone_number()
+    return get_faker().phone_number()
 
 
 def generate_ssn() -> str:
     """Generates a random SSN."""
-    return fake.ssn()
+    return get_faker().ssn()
 
 
 def generate_username() -> str:
     """Generates a random username."""
-    return fake.user_name()
+    return get_faker().user_name()
 
 
 def generate_password() -> str:
     """Generates a random password."""
-    return fake.password(length=12, special_chars=True, digits=True, upper_case=True, lower_case=True)
+    return get_faker().password(length=12, special_chars=True, digits=True, upper_case=True, lower_case=True)
+
+
+def generate_register_data() -> dict:
+    """Generates a dictionary of fake registration data with a matching password confirmation."""
+    password = generate_password()
+    return {
+        "first_name": generate_first_name(),
+        "last_name": generate_last_name(),
+        "address": generate_address(),
+        "city": generate_city(),
+        "state": generate_state(),
+        "zip_code": generate_zipcode(),
+        "phone": generate_phone_number(),
+        "ssn": generate_ssn(),
+        "username": generate_username(),
+        "password": password,
+        "confirm_password": password
+    }
@@ -0,0 +1,97 @@
+"""
+WebDriver pool for the ParaBank automation framework.
+
+Lends a bounded number of WebDriver sessions to concurrent workers, creating them lazily and reusing them
+instead of launching a browser per unit of work.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import queue
+import threading
+from typing import Callable
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+from .logger import Logger
+
+
+class DriverPool:
+    """Thread-safe pool of at most `size` WebDriver sessions."""
+
+    def __init__(self, size: int, factory: Callable[[], WebDriver]):
+        self.logger = Logger(__name__)
+        self.size = size
+        self.factory = factory
+        self._idle: queue.LifoQueue[WebDriver] = queue.LifoQueue()
+        self._created: list[WebDriver] = []
+        self._slots = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float = None) -> WebDriver:
+        """
+        Borrows a WebDriver from the pool, creating one while the pool isn't full.
+
+        :param timeout: The max time to wait for an idle WebDriver when the pool is full. Default is no limit.
+        :return: The WebDriver.
+        :raises TimeoutError: When no WebDriver becomes idle within the timeout.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_create = self._slots < self.size
+            if can_create:
+                self._slots += 1
+        if can_create:
+            try:
+                driver = self.factory()
+            except Exception:
+                with self._lock:
+                    self._slots -= 1
+                raise
+            with self._lock:
+                self._created.append(driver)
+            self.logger.info(f'Created pooled WebDriver {len(self._created)}/{self.size}')
+            return driver
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty as e:
+            raise TimeoutError(f'No pooled WebDriver became idle within {timeout} seconds.') from e
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Returns a borrowed WebDriver to the pool.
+
+        :param driver: The WebDriver to return.
+        """
+        self._idle.put(driver)
+
+    def discard(self, driver: WebDriver) -> None:
+        """
+        Quits a broken WebDriver and frees its slot so a replacement can be created.
+
+        :param driver: The WebDriver to discard.
+        """
+        with self._lock:
+            if driver in self._created:
+                self._created.remove(driver)
+                self._slots -= 1
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            self.logger.warning(f'Failed to quit a discarded WebDriver. Error: {e}')
+
+    def close(self) -> None:
+        """Quits every WebDriver created by the pool."""
+        with self._lock:
+            drivers = list(self._created)
+            self._created.clear()
+            self._slots = 0
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException as e:
+                self.logger.warning(f'Failed to quit a pooled WebDriver. Error: {e}')
+        self.logger.info(f'Closed {len(drivers)} pooled WebDrivers')
@@ -0,0 +1,178 @@
+"""
+Driver proxy module for the ParaBank automation framework.
+
+Wraps a replaceable WebDriver so the session behind a fixture can be recycled between tests without the
+tests or page objects holding a stale reference. With self-healing enabled, the proxy also detects a dead session
+(crashed browser or driver process) and respawns it, restoring the last known URL and cookies.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import time
+from typing import Callable
+from http.client import RemoteDisconnected
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.command import Command
+from selenium.common.exceptions import WebDriverException, InvalidSessionIdException
+from .logger import Logger
+from .command_listeners import CommandListener, get_command_listeners, add_command_listener
+
+# Error messages of the driver servers when the browser behind the session is gone
+DEAD_SESSION_MESSAGES = ('invalid session id', 'session deleted', 'chrome not reachable', 'browser has closed',
+                         'tab crashed', 'disconnected: not connected to devtools',
+                         'failed to decode response from marionette',
+                         'tried to run command without establishing a connection')
+
+
+def is_session_dead(error: BaseException) -> bool:
+    """
+    Tells whether a command failed because the session is gone, rather than because of the page.
+
+    :param error: The error raised by a command.
+    :return: True for invalid session ids, unreachable browsers and refused or dropped driver connections.
+    """
+    if isinstance(error, (InvalidSessionIdException, ConnectionError, RemoteDisconnected, Urllib3HTTPError)):
+        return True
+    return isinstance(error, WebDriverException) and any(
+        message in str(error.msg or '').lower() for message in DEAD_SESSION_MESSAGES
+    )
+
+
+class SessionGuard(CommandListener):
+    """Tracks the last loaded URL of a self-healing proxy and respawns its session when a command finds it dead."""
+
+    def __init__(self, proxy: 'DriverProxy'):
+        self.proxy = proxy
+
+    def after_command(self, driver: WebDriver, command: str, params: dict, duration: float) -> None:
+        if command == Command.GET:
+            self.proxy.last_url = params['url']
+
+    def on_command_error(self, driver: WebDriver, command: str, params: dict, error: Exception) -> None:
+        if driver is self.proxy.wrapped_driver and is_session_dead(error):
+            self.proxy.respawn(error)
+
+
+class DriverProxy:
+    """Delegates every attribute to the current WebDriver, which can be swapped for a fresh one."""
+
+    def __init__(self, factory: Callable[[], WebDriver], self_healing: bool = False, max_respawns: int = 3):
+        self._logger = Logger(__name__)
+        self._factory = factory
+        self._driver = factory()
+        self.created_at = time.monotonic()
+        self.recycle_count = 0
+        self.max_respawns = max_respawns
+        # Respawns of crashed sessions: the error that revealed the crash and the seconds the respawn took
+        self.respawns: list[dict] = []
+        self.last_url: str | None = None
+        self.last_cookies: list[dict] = []
+        if self_healing:
+            add_command_listener(self._driver, SessionGuard(self))
+
+    @property
+    def wrapped_driver(self) -> WebDriver:
+        """The WebDriver currently behind the proxy."""
+        return self._driver
+
+    @property
+    def session_age(self) -> float:
+        """Seconds since the current WebDriver was created."""
+        return time.monotonic() - self.created_at
+
+    def __getattr__(self, name: str):
+        return getattr(self._driver, name)
+
+    def recycle(self, reason: str) -> None:
+        """
+        Replaces the current WebDriver with a fresh one, restoring the last URL, its cookies and the command
+        listeners attached to the old session.
+
+        :param reason: Why the driver is recycled, for the logs.
+        :raises WebDriverException: If the replacement WebDriver can't be initialized.
+        """
+        self._logger.warning(f'Recycling the WebDriver session. Reason: {reason}')
+        url, cookies = self._snapshot_state()
+        self._replace_driver(url, cookies)
+        self.recycle_count += 1
+
+    def checkpoint(self) -> None:
+        """Remembers the current URL and cookies, which a respawn restores if the session crashes later."""
+        url, cookies = self._snapshot_state()
+        if url is not None:
+            self.last_url, self.last_cookies = url, cookies
+
+    def respawn(self, error: BaseException) -> None:
+        """
+        Replaces a crashed WebDriver with a fresh one, restoring the last known URL and cookies.
+
+        A failing respawn is logged and left to the next command to retry, up to the max number of respawns.
+
+        :param error: The error that revealed the crash.
+        """
+        if len(self.respawns) >= self.max_respawns:
+            self._logger.error(f'The WebDriver session crashed again, but the max of {self.max_respawns} respawns '
+                               'was reached')
+            return
+        self._logger.error(f'The WebDriver session crashed, respawning it. Error: {error}')
+        start = time.monotonic()
+        try:
+            self._replace_driver(self.last_url, self.last_cookies)
+        except Exception as e:
+            self._logger.error(f'Failed to respawn the WebDriver session. Error: {e}')
+            return
+        seconds = time.monotonic() - start
+        # Selenium appends a documentation link to the driver's message
+        message = str(getattr(error, 'msg', None) or error).split('; For documentation')[0].strip()
+        self.respawns.append({'error': message.splitlines()[0] if message else type(error).__name__,
+                              'seconds': round(seconds, 2)})
+        self._logger.warning(f'WebDriver session respawned in {seconds:.2f} seconds')
+
+    def _replace_driver(self, url: str | None, cookies: list[dict]) -> None:
+        """
+        Quits the current WebDriver, creates a fresh one carrying over the command listeners, and restores the state.
+
+        :param url: The URL to restore.
+        :param cookies: The cookies to restore.
+        """
+        listeners = get_command_listeners(self._driver)
+        try:
+            self._driver.quit()
+        except Exception as e:
+            self._logger.warning(f'Failed to quit the old WebDriver session. Error: {e}')
+        self._driver = self._factory()
+        self.created_at = time.monotonic()
+        for listener in listeners:
+            add_command_listener(self._driver, listener)
+        self._restore_state(url, cookies)
+
+    def _snapshot_state(self) -> tuple[str | None, list[dict]]:
+        """
+        Retrieves the current URL and cookies of the session, if it still responds.
+
+        :return: The current URL (or None) and the list of cookies.
+        """
+        try:
+            return self._driver.current_url, self._driver.get_cookies()
+        except (WebDriverException, ConnectionError, Urllib3HTTPError):
+            return None, []
+
+    def _restore_state(self, url: str | None, cookies: list[dict]) -> None:
+        """
+        Navigates the fresh session to the previous URL and re-applies the previous cookies.
+
+        :param url: The URL to restore.
+        :param cookies: The cookies to restore.
+        """
+        if url is None or not url.startswith('http'):
+            return
+        try:
+            self._driver.get(url)
+            for cookie in cookies:
+                self._driver.add_cookie(cookie)
+            if cookies:
+                self._driver.refresh()
+        except WebDriverException as e:
+            self._logger.warning(f'Failed to restore the session state on {url}. Error: {e}')
@@ -0,0 +1,135 @@
+"""
+Fail-fast detection of server error pages for the ParaBank automation framework.
+
+When the application answers with an error page instead of the expected form, waiting for a locator that will never
+appear only burns the full timeout. The waits of the page objects therefore also watch for a configurable set of
+failure signatures (error headings or titles, HTTP error bodies, a blank document) and abort as soon as one appears.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+from functools import lru_cache
+from typing import Callable
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from .config_loader import ConfigLoader
+
+DEFAULT_ERROR_PAGE_SETTINGS = {
+    'enabled': True,
+    # ParaBank also titles ordinary application errors "Error!", so that title only counts with the internal-error text
+    'titles': {'Error!': 'An internal error has occurred', 'HTTP Status 500': None, 'Internal Server Error': None,
+               'Service Unavailable': None, 'Bad Gateway': None},
+    'body_patterns': ['HTTP Status [45]\\d\\d'],
+    'detect_blank': True,
+}
+
+ERROR_PAGE_SCRIPT = """
+const [titles, patterns, detectBlank] = arguments;
+const heading = document.querySelector('h1.title') || document.querySelector('h1');
+const headingText = heading ? heading.innerText.trim() : '';
+const bodyText = document.body ? document.body.innerText.trim() : '';
+const panel = document.getElementById('rightPanel');
+const errorText = (panel ? panel.innerText.trim() : bodyText).slice(0, 500);
+for (const [title, bodyPattern] of titles) {
+    const titleMatches = headingText === title || document.title.trim() === title;
+    if (titleMatches && (!bodyPattern || new RegExp(bodyPattern).test(bodyText))) return [title, errorText];
+}
+for (const pattern of patterns) {
+    if (new RegExp(pattern).test(bodyText)) return [pattern, errorText];
+}
+const empty = !bodyText && !document.querySelector('input, img, iframe, canvas');
+if (detectBlank && document.readyState === 'complete' && empty) return ['blank document', ''];
+return null;
+"""
+
+
+class ServerErrorPage(Exception):
+    """Raised when the browser shows a server error page while a page object waits for an element."""
+
+    def __init__(self, signature: str, error_text: str, url: str):
+        self.signature = signature
+        self.error_text = error_text
+        self.url = url
+        super().__init__(f'Server error page detected at {url} (matched "{signature}"): {error_text or "<empty>"}')
+
+
+class ErrorPageDetector:
+    """Checks the current document against the known failure signatures in a single script round trip."""
+
+    def __init__(self, titles: dict[str, str | None], body_patterns: list[str], detect_blank: bool = True):
+        """
+        :param titles: The exact error headings or document titles, each mapped to a body pattern the page must also
+                       match, or None when the title alone identifies an error page.
+        :param body_patterns: The regular expressions identifying an error page by its body text.
+        :param detect_blank: Whether a blank document counts as an error page.
+        """
+        self.titles = titles
+        self.body_patterns = body_patterns
+        self.detect_blank = detect_blank
+
+    @classmethod
+    def from_config(cls, settings: dict) -> 'ErrorPageDetector':
+        """
+        Creates a detector from the "error_pages" section of the configuration file.
+
+        :param settings: The configuration section.
+        :return: The detector.
+        """
+        settings = dict(DEFAULT_ERROR_PAGE_SETTINGS, **settings)
+        titles = settings['titles']
+        if isinstance(titles, list):
+            titles = dict.fromkeys(titles)
+        return cls(titles, settings['body_patterns'], settings['detect_blank'])
+
+    def check(self, driver: WebDriver) -> bool:
+        """
+        Checks the current document for a failure signature.
+
+        :param driver: The WebDriver.
+        :return: False when the document isn't an error page, so the check can extend a wait condition.
+        :raises ServerErrorPage: When the document matches a failure signature.
+        """
+        try:
+            match = driver.execute_script(ERROR_PAGE_SCRIPT, list(self.titles.items()), self.body_patterns,
+                                          self.detect_blank)
+            if not match:
+                return False
+            url = driver.current_url
+        except WebDriverException:
+            # The document is unloading or an alert is open: nothing to judge yet
+            return False
+        raise ServerErrorPage(match[0], match[1], url)
+
+
+@lru_cache(maxsize=1)
+def get_error_page_detector() -> ErrorPageDetector | None:
+    """Returns the process-wide detector configured in the "error_pages" section, or None when it is disabled."""
+    settings = ConfigLoader().get_setting('error_pages', {})
+    if not settings.get('enabled', DEFAULT_ERROR_PAGE_SETTINGS['enabled']):
+        return None
+    return ErrorPageDetector.from_config(settings)
+
+
+def fail_fast(condition: Callable[[WebDriver], object], detector: ErrorPageDetector = None) -> Callable:
+    """
+    Extends a wait condition so that the wait aborts as soon as the browser shows a server error page.
+
+    The error page check only runs while the condition isn't met, so successful waits cost nothing extra.
+
+    :param condition: The wait condition, e.g. an expected condition.
+    :param detector: The detector to use, defaulting to the configured one.
+    :return: The extended condition.
+    """
+    detector = detector or get_error_page_detector()
+    if detector is None:
+        return condition
+
+    def condition_or_error_page(driver: WebDriver):
+        try:
+            return condition(driver) or detector.check(driver)
+        except NoSuchElementException:
+            detector.check(driver)
+            raise
+
+    return condition_or_error_page
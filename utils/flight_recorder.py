@@ -0,0 +1,96 @@
+"""
+Failure flight recorder for the ParaBank automation framework.
+
+Instead of logging every page-object action, the flight recorder appends a compact record (action, locator,
+duration, outcome) to a bounded ring buffer that is reset for every test. Only the buffer of a failed test is
+flushed into the log and the report.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import time
+import logging
+from collections import deque
+from functools import wraps
+from .logger import Logger
+
+
+class FlightRecorder:
+    """Process-wide bounded ring buffer of page-object action records."""
+
+    def __init__(self, size: int = 200):
+        self.enabled = False
+        self.records: deque[tuple] = deque(maxlen=size)
+
+    def record(self, action: str, locator, duration: float, outcome: str) -> None:
+        """
+        Appends an action record, evicting the oldest one when the buffer is full.
+
+        :param action: The page-object action, e.g. "click".
+        :param locator: The locator the action targeted, or None.
+        :param duration: The action duration in seconds.
+        :param outcome: "ok" or the name of the raised exception.
+        """
+        self.records.append((time.time(), action, locator, duration, outcome))
+
+    def clear(self) -> None:
+        """Drops all records, at the start of every test."""
+        self.records.clear()
+
+    def format(self) -> str:
+        """
+        Formats the buffered records, oldest first.
+
+        :return: One line per record.
+        """
+        lines = []
+        for timestamp, action, locator, duration, outcome in self.records:
+            clock = time.strftime('%H:%M:%S', time.localtime(timestamp)) + f'.{int(timestamp % 1 * 1000):03d}'
+            target = f' {locator[0]}={locator[1]}' if locator else ''
+            lines.append(f'{clock} {action}{target} {duration * 1000:.1f} ms {outcome}')
+        return '\n'.join(lines)
+
+
+flight_recorder = FlightRecorder()
+
+
+def configure_flight_recorder(settings: dict) -> None:
+    """
+    Enables the flight-recorder mode from the "logging" section of the configuration file.
+
+    In this mode loggers created afterwards only emit warnings and errors; page-object actions go to the buffer.
+
+    :param settings: The configuration section.
+    """
+    if settings.get('mode') != 'flight_recorder':
+        return
+    flight_recorder.enabled = True
+    flight_recorder.records = deque(maxlen=settings.get('flight_recorder_size', 200))
+    Logger.default_level = logging.WARNING
+
+
+def recorded_action(action: str, has_locator: bool = True):
+    """
+    Decorator recording a page-object action in the flight recorder when it is enabled.
+
+    :param action: The action name.
+    :param has_locator: Whether the first argument of the action is its locator.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not flight_recorder.enabled:
+                return func(self, *args, **kwargs)
+            locator = kwargs.get('locator', args[0] if args else None) if has_locator else None
+            outcome = 'ok'
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                outcome = type(e).__name__
+                raise
+            finally:
+                flight_recorder.record(action, locator, time.perf_counter() - start, outcome)
+        return wrapper
+    return decorator
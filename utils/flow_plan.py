@@ -0,0 +1,314 @@
+"""
+Declarative multi-page flow plans for the ParaBank automation framework.
+
+A flow plan declares the steps of a flow across page objects: the URL each step needs the browser on, and either an
+input (a page-object method that fills or submits something) or a read (a page locator or getter, optionally with
+an expected value). Compiling the plan yields an execution plan that navigates only when the browser isn't already on
+the step's page, merges consecutive locator reads into a single script round trip, and times every operation.
+
+    plan = (FlowPlan('register')
+            .input(RegisterPage, 'register_user', url='register.htm', name='submit', user_data=data)
+            .read(RegisterPage, 'WELCOME_TITLE', name='welcome', expect=f'Welcome {data["username"]}'))
+    result = plan.compile().run(driver)
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import time
+from typing import Any, Callable
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from .logger import Logger
+from .page_router import PageRouter, get_base_url
+from .error_pages import fail_fast
+
+# Locator strategies the batched read script can resolve in the page
+BATCHABLE_STRATEGIES = {'id', 'css selector', 'xpath', 'name', 'class name', 'tag name'}
+
+BATCH_READ_SCRIPT = """
+const find = (by, value) => {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'css selector': return document.querySelector(value);
+        case 'name': return document.getElementsByName(value)[0];
+        case 'class name': return document.getElementsByClassName(value)[0];
+        case 'tag name': return document.getElementsByTagName(value)[0];
+        case 'xpath': return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+            .singleNodeValue;
+    }
+};
+return arguments[0].map(([by, value]) => {
+    const element = find(by, value);
+    const visible = element && (element.offsetWidth || element.offsetHeight || element.getClientRects().length);
+    return visible ? element.innerText.trim() : null;
+});
+"""
+
+
+class FlowAssertionError(AssertionError):
+    """Raised when a read step doesn't return its expected value."""
+
+
+class FlowStep:
+    """One declared step of a flow plan."""
+
+    def __init__(self, name: str, page: type, kind: str, target, url: str | None, kwargs: dict, expect: Any,
+                 lands_on: str | None = None):
+        self.name = name
+        self.page = page
+        self.kind = kind
+        self.target = target
+        self.url = url
+        self.kwargs = kwargs
+        self.expect = expect
+        self.lands_on = lands_on
+
+    @property
+    def locator(self) -> tuple[str, str] | None:
+        """The locator a read step reads, or None when it reads through a page-object method."""
+        target = getattr(self.page, self.target) if isinstance(self.target, str) else self.target
+        return target if isinstance(target, tuple) else None
+
+    def check(self, value) -> None:
+        """
+        Checks a read value against the step's expectation.
+
+        :param value: The value the step read.
+        :raises FlowAssertionError: When the value doesn't match the expected value or predicate.
+        """
+        if self.expect is None:
+            return
+        matches = self.expect(value) if callable(self.expect) else value == self.expect
+        if not matches:
+            expected = getattr(self.expect, '__name__', 'a predicate') if callable(self.expect) else self.expect
+            raise FlowAssertionError(f'Step "{self.name}" expected {expected!r}, but read {value!r}')
+
+
+class PlanOperation:
+    """One operation of an execution plan: a navigation, an input, a single read or a batch of locator reads."""
+
+    def __init__(self, kind: str, name: str, steps: list[FlowStep] = None, url: str = None,
+                 ready_locator: tuple[str, str] = None, check_location: bool = False, fresh_session: bool = False):
+        self.kind = kind
+        self.name = name
+        self.steps = steps or []
+        self.url = url
+        self.ready_locator = ready_locator
+        self.check_location = check_location
+        self.fresh_session = fresh_session
+
+    def __repr__(self) -> str:
+        return f'PlanOperation({self.kind!r}, {self.name!r})'
+
+
+class FlowResult:
+    """Values read and operation timings of one execution of a plan."""
+
+    def __init__(self):
+        self.values: dict[str, Any] = {}
+        self.timings: list[tuple[str, float]] = []
+        self.navigations = 0
+        self.navigations_avoided = 0
+
+    def __getitem__(self, name: str):
+        return self.values[name]
+
+
+class FlowPlan:
+    """Builder of the declared steps of a flow."""
+
+    def __init__(self, name: str, fresh_session: bool = False):
+        """
+        :param name: The flow name.
+        :param fresh_session: Whether the flow starts by dropping the cookies of the previous flow.
+        """
+        self.name = name
+        self.fresh_session = fresh_session
+        self.steps: list[FlowStep] = []
+
+    def input(self, page: type, method: str, url: str = None, name: str = None, lands_on: str = None,
+              **kwargs) -> 'FlowPlan':
+        """
+        Declares an input step calling a page-object method.
+
+        :param page: The page-object class.
+        :param method: The name of the method to call.
+        :param url: The URL (absolute or relative to the base URL) the step needs, or None to stay on the current page.
+        :param name: The step name, defaulting to the method name.
+        :param lands_on: The URL the browser is on after the step, when known; otherwise the location is re-checked.
+        :param kwargs: The method's keyword arguments.
+        :return: The plan, for chaining.
+        """
+        self.steps.append(FlowStep(name or method, page, 'input', method, url, kwargs, None, lands_on))
+        return self
+
+    def read(self, page: type, target: str | tuple[str, str], url: str = None, name: str = None, expect: Any = None,
+             **kwargs) -> 'FlowPlan':
+        """
+        Declares a read step, optionally asserting its value.
+
+        :param page: The page-object class.
+        :param target: The name of a page locator (read as visible text, batchable) or getter method, or a locator.
+        :param url: The URL the step needs, or None to stay on the current page.
+        :param name: The name the value is stored under, defaulting to the target name.
+        :param expect: The expected value, or a predicate the value must satisfy.
+        :param kwargs: The getter's keyword arguments.
+        :return: The plan, for chaining.
+        """
+        step_name = name or (target if isinstance(target, str) else target[1])
+        self.steps.append(FlowStep(step_name, page, 'read', target, url, kwargs, expect))
+        return self
+
+    def compile(self) -> 'ExecutionPlan':
+        """
+        Compiles the steps into operations.
+
+        A navigation is emitted only for a step whose URL differs from the known location; when the location is
+        unknown (at the start or after an input that doesn't declare where it lands) the navigation checks the
+        current document at run time first: its URL and, for a page's canonical URL, the page's readiness locator.
+        Consecutive locator reads are merged into one batched read.
+
+        :return: The execution plan.
+        """
+        operations = []
+        location = None
+        known = False
+        for step in self.steps:
+            if step.url is not None and not (known and location == step.url):
+                fresh_session = self.fresh_session and not operations
+                # The page's readiness locator only proves the step's URL when it is the page's canonical URL
+                ready_locator = getattr(step.page, 'READY_LOCATOR', None) \
+                    if getattr(step.page, 'URL', None) == step.url else None
+                operations.append(PlanOperation('navigate', 'open', url=step.url, ready_locator=ready_locator,
+                                                fresh_session=fresh_session,
+                                                check_location=not known and not fresh_session))
+                location, known = step.url, True
+            if step.kind == 'input':
+                operations.append(PlanOperation('input', step.name, [step]))
+                location, known = step.lands_on, step.lands_on is not None
+            elif step.locator is not None and step.locator[0] in BATCHABLE_STRATEGIES:
+                previous = operations[-1] if operations else None
+                if previous is not None and previous.kind == 'read_batch':
+                    previous.steps.append(step)
+                    previous.name = f'{previous.name}+{step.name}'
+                else:
+                    operations.append(PlanOperation('read_batch', step.name, [step]))
+            else:
+                operations.append(PlanOperation('read', step.name, [step]))
+        return ExecutionPlan(self.name, operations)
+
+
+class ExecutionPlan:
+    """Compiled operations of a flow plan."""
+
+    def __init__(self, name: str, operations: list[PlanOperation]):
+        self.name = name
+        self.operations = operations
+        self.logger = Logger(__name__)
+
+    def run(self, driver: WebDriver, base_url: str = None, context=None, timeout: float = 10,
+            router: PageRouter = None) -> FlowResult:
+        """
+        Runs every operation in order.
+
+        :param driver: The WebDriver.
+        :param base_url: The base URL relative step URLs resolve against, defaulting to the configured one.
+        :param context: The browser context page objects are bound to, if any.
+        :param timeout: The max seconds a batched read waits for all its elements to be visible.
+        :param router: The router of the driver to navigate with, so that it counts the plan's navigations.
+        :return: The values read and the operation timings.
+        :raises FlowAssertionError: When a read doesn't return its expected value.
+        """
+        result = FlowResult()
+        for _, operation in self.as_steps(base_url, result, context, timeout, router):
+            operation(driver)
+        return result
+
+    def as_steps(self, base_url: str = None, result: FlowResult = None, context=None, timeout: float = 10,
+                 router: PageRouter = None) -> list[tuple[str, Callable[[WebDriver], None]]]:
+        """
+        Exposes the operations as named callables, e.g. for the load runner to time and run one by one.
+
+        :param base_url: The base URL relative step URLs resolve against, defaulting to the configured one.
+        :param result: The result the callables record values and timings into.
+        :param context: The browser context page objects are bound to, if any.
+        :param timeout: The max seconds a batched read waits for all its elements to be visible.
+        :param router: The router of the driver the steps run on; by default every navigation gets its own.
+        :return: The (name, callable) steps.
+        """
+        result = result if result is not None else FlowResult()
+        base_url = router.base_url if router is not None else base_url or get_base_url()
+        pages = {}
+
+        def page_of(driver: WebDriver, page: type):
+            if page not in pages:
+                pages[page] = page(driver, context)
+            return pages[page]
+
+        def timed(operation: PlanOperation) -> Callable[[WebDriver], None]:
+            def run(driver: WebDriver) -> None:
+                start = time.perf_counter()
+                try:
+                    self._run_operation(operation, driver, router or PageRouter(driver, base_url), result, page_of,
+                                        context, timeout)
+                finally:
+                    result.timings.append((operation.name, time.perf_counter() - start))
+                if operation.kind in ('navigate', 'input'):
+                    pages.clear()
+            return run
+
+        return [(operation.name, timed(operation)) for operation in self.operations]
+
+    def _run_operation(self, operation: PlanOperation, driver: WebDriver, router: PageRouter, result: FlowResult,
+                       page_of: Callable, context, timeout: float) -> None:
+        if operation.kind == 'navigate':
+            if context is not None:
+                context.activate()
+            if operation.fresh_session:
+                driver.delete_all_cookies()
+            if router.navigate(operation.url, operation.ready_locator, force=not operation.check_location):
+                result.navigations += 1
+            else:
+                result.navigations_avoided += 1
+        elif operation.kind == 'input':
+            step = operation.steps[0]
+            getattr(page_of(driver, step.page), step.target)(**step.kwargs)
+        elif operation.kind == 'read':
+            step = operation.steps[0]
+            page = page_of(driver, step.page)
+            value = page.find_element(step.locator).text if step.locator else getattr(page, step.target)(**step.kwargs)
+            result.values[step.name] = value
+            step.check(value)
+        else:
+            if context is not None:
+                context.activate()
+            values = read_visible_texts(driver, [step.locator for step in operation.steps], timeout)
+            for step, value in zip(operation.steps, values):
+                result.values[step.name] = value
+                step.check(value)
+
+
+def read_visible_texts(driver: WebDriver, locators: list[tuple[str, str]], timeout: float = 10) -> list[str]:
+    """
+    Reads the visible text of several elements in one script round trip, polling until all of them are visible.
+
+    :param driver: The WebDriver.
+    :param locators: The locators to read.
+    :param timeout: The max seconds to wait for all the elements to be visible.
+    :return: The texts, in locator order.
+    :raises TimeoutException: When some elements aren't visible within the timeout.
+    :raises ServerErrorPage: When the browser shows a server error page while waiting.
+    """
+    last_values = []
+
+    def all_visible(web_driver: WebDriver):
+        last_values[:] = web_driver.execute_script(BATCH_READ_SCRIPT, [list(locator) for locator in locators])
+        return last_values if all(value is not None for value in last_values) else False
+
+    try:
+        return WebDriverWait(driver, timeout).until(fail_fast(all_visible))
+    except TimeoutException as e:
+        missing = [locator for locator, value in zip(locators, last_values) if value is None]
+        raise TimeoutException(f'Elements not visible within {timeout} seconds: {missing}') from e
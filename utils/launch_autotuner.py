@@ -0,0 +1,250 @@
+"""
+Launch-flag autotuner for the ParaBank automation framework.
+
+Launches the browser through WebDriverInitializer with each candidate set of launch flags a number of times and
+measures the cold start, the navigation to the local stand-in server, a full RegisterPage registration and the peak
+memory of the driver and browser processes. The candidates are ranked by their median total time, and the winner can
+be written back to config/config.json as a named launch-flag profile of the browser.
+
+Usage:
+    python -m utils.launch_autotuner --browser chrome --runs 5 --save-as tuned --select
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import json
+import time
+import uuid
+import argparse
+import statistics
+from pathlib import Path
+from pages.register_page import RegisterPage
+from utils.logger import Logger
+from utils.config_loader import ConfigLoader
+from utils.data_generator import generate_register_data
+from utils.resource_monitor import ResourceMonitor, MB
+from utils.stand_in_server import StandInServer
+from utils.webdriver_initializer import WebDriverInitializer
+
+PHASES = ('cold_start', 'navigation', 'register')
+CURRENT_CANDIDATE = 'current'
+
+
+class LaunchAutotuner:
+    """Measures and ranks candidate launch-flag sets of one browser."""
+
+    def __init__(self, browser: str, candidates: dict[str, list[str]], runs: int = 3, headless: bool = True,
+                 sample_interval: float = 0.1):
+        self.logger = Logger(__name__)
+        self.browser = browser
+        self.candidates = candidates
+        self.runs = runs
+        self.headless = headless
+        self.monitor = ResourceMonitor(interval=sample_interval)
+        self.driver_path = None
+
+    def effective_flags(self, flags: list[str]) -> list[str]:
+        """
+        Returns the flags a candidate is launched with, including the headless flag when running headless.
+
+        :param flags: The candidate flags.
+        :return: The flags passed to the browser.
+        """
+        if self.headless and not WebDriverInitializer.has_headless_option(flags):
+            return flags + [WebDriverInitializer.HEADLESS_OPTIONS[self.browser]]
+        return list(flags)
+
+    def run(self, base_url: str = None) -> list[dict]:
+        """
+        Measures every candidate, against the local stand-in server unless a base URL is given. The driver is resolved
+        once up front, so that no candidate's cold start pays for its download or version check.
+
+        :param base_url: The ParaBank base URL.
+        :return: The ranked report rows, best candidate first.
+        """
+        self.driver_path = WebDriverInitializer(browser=self.browser).resolve_driver_path()
+        server = StandInServer().start() if base_url is None else None
+        self.monitor.start()
+        try:
+            base_url = server.base_url if server else base_url
+            results = {name: self.measure(name, flags, base_url) for name, flags in self.candidates.items()}
+        finally:
+            self.monitor.stop()
+            if server:
+                server.stop()
+        return rank(results, {name: self.effective_flags(flags) for name, flags in self.candidates.items()})
+
+    def measure(self, name: str, flags: list[str], base_url: str) -> list[dict | None]:
+        """
+        Launches the browser with a candidate's flags the configured number of times.
+
+        :param name: The candidate name, for the logs.
+        :param flags: The candidate flags.
+        :param base_url: The ParaBank base URL.
+        :return: The measurements of every run, None for the failed runs.
+        """
+        measurements = []
+        for run in range(1, self.runs + 1):
+            self.logger.info(f'Measuring the "{name}" launch flags {flags}, run {run}/{self.runs}')
+            try:
+                measurements.append(self._measure_run(self.effective_flags(flags), base_url))
+            except Exception as e:
+                self.logger.error(f'Run {run} of the "{name}" launch flags failed. Error: {e}')
+                measurements.append(None)
+        return measurements
+
+    def _measure_run(self, flags: list[str], base_url: str) -> dict:
+        """
+        Launches the browser once, loads the register page and registers a new customer.
+
+        :param flags: The launch flags.
+        :param base_url: The ParaBank base URL.
+        :return: The seconds spent in every phase and the peak RSS in bytes.
+        """
+        initializer = WebDriverInitializer(browser=self.browser, browser_options=flags, driver_path=self.driver_path)
+        start = time.perf_counter()
+        driver = initializer.initialize_webdriver()
+        measurement = {'cold_start': time.perf_counter() - start}
+        self.monitor.register(driver)
+        try:
+            start = time.perf_counter()
+            driver.get(f'{base_url}{RegisterPage.URL}')
+            measurement['navigation'] = time.perf_counter() - start
+            data = generate_register_data()
+            data['username'] = f'{data["username"]}{uuid.uuid4().hex[:6]}'
+            start = time.perf_counter()
+            register_page = RegisterPage(driver)
+            register_page.register_user(user_data=data)
+            register_page.get_welcome_message()
+            measurement['register'] = time.perf_counter() - start
+            measurement['peak_rss'] = self.monitor.get_stats(driver).peak_rss
+        finally:
+            self.monitor.unregister(driver)
+            driver.quit()
+        return measurement
+
+
+def rank(results: dict[str, list[dict | None]], flags: dict[str, list[str]]) -> list[dict]:
+    """
+    Ranks the candidates by their median total time, then by their median peak memory. Candidates with failed runs
+    are ranked after the ones without, and candidates without any successful run come last.
+
+    :param results: The measurements of every run per candidate, None for the failed runs.
+    :param flags: The flags every candidate was launched with.
+    :return: One row per candidate with the median seconds per phase and in total and the median peak RSS in MB.
+    """
+    rows = []
+    for name, measurements in results.items():
+        succeeded = [measurement for measurement in measurements if measurement is not None]
+        row = {'candidate': name, 'flags': flags[name], 'runs': len(measurements),
+               'failures': len(measurements) - len(succeeded)}
+        if succeeded:
+            for phase in PHASES:
+                row[phase] = statistics.median(measurement[phase] for measurement in succeeded)
+            row['total'] = statistics.median(sum(measurement[phase] for phase in PHASES) for measurement in succeeded)
+            row['peak_mb'] = statistics.median(measurement['peak_rss'] for measurement in succeeded) / MB
+        rows.append(row)
+    return sorted(rows, key=lambda row: ('total' not in row, row['failures'] > 0, row.get('total', 0),
+                                         row.get('peak_mb', 0)))
+
+
+def format_report(rows: list[dict]) -> str:
+    """
+    Formats ranked rows as a fixed-width table.
+
+    :param rows: The rows returned by rank.
+    :return: The formatted table.
+    """
+    header = (f'{"rank":<6}{"candidate":<20}{"failed":>8}' + ''.join(f'{f"{phase} ms":>16}' for phase in PHASES)
+              + f'{"total ms":>12}{"peak MB":>10}  flags')
+    lines = [header]
+    for position, row in enumerate(rows, start=1):
+        failed = f'{row["failures"]}/{row["runs"]}'
+        line = f'{position:<6}{row["candidate"]:<20}{failed:>8}'
+        if 'total' in row:
+            line += ''.join(f'{row[phase] * 1000:>16.1f}' for phase in PHASES)
+            line += f'{row["total"] * 1000:>12.1f}{row["peak_mb"]:>10.1f}'
+        else:
+            line += f'{"all runs failed":>{16 * len(PHASES) + 22}}'
+        lines.append(f'{line}  {" ".join(row["flags"])}')
+    return '\n'.join(lines)
+
+
+def format_config(value, indent: int = 0) -> str:
+    """
+    Formats a configuration value the way config/config.json is laid out: two-space indentation, with lists of
+    plain values kept on one line.
+
+    :param value: The configuration value.
+    :param indent: The indentation level of the value.
+    :return: The formatted JSON.
+    """
+    padding = '  ' * (indent + 1)
+    if isinstance(value, dict) and value:
+        items = [f'{padding}{json.dumps(key)}: {format_config(item, indent + 1)}' for key, item in value.items()]
+    elif isinstance(value, list) and any(isinstance(item, (dict, list)) for item in value):
+        items = [f'{padding}{format_config(item, indent + 1)}' for item in value]
+    else:
+        return json.dumps(value)
+    brackets = '{}' if isinstance(value, dict) else '[]'
+    return brackets[0] + '\n' + ',\n'.join(items) + '\n' + '  ' * indent + brackets[1]
+
+
+def save_profile(browser: str, name: str, flags: list[str], select: bool = False,
+                 config_path: str = 'config/config.json') -> None:
+    """
+    Writes launch flags to the configuration file as a named profile of the browser.
+
+    :param browser: The browser the flags were tuned for.
+    :param name: The profile name.
+    :param flags: The launch flags.
+    :param select: Whether to also select the profile, so WebDriverInitializer launches the browser with it.
+    :param config_path: The configuration file.
+    """
+    config = ConfigLoader(config_path).config
+    settings = config.setdefault(browser, {})
+    settings.setdefault('profiles', {})[name] = flags
+    if select:
+        settings['profile'] = name
+    Path(config_path).write_text(format_config(config))
+
+
+def parse_candidate(value: str) -> tuple[str, list[str]]:
+    """Parses a candidate such as "lean=--headless=new,--disable-gpu" (the flags after the first "=")."""
+    name, _, flags = value.partition('=')
+    return name.strip(), [flag.strip() for flag in flags.split(',') if flag.strip()]
+
+
+def main() -> None:
+    config = ConfigLoader()
+    settings = config.get_setting('launch_autotuner', {})
+    parser = argparse.ArgumentParser(description='Rank candidate browser launch flags by startup and flow speed.')
+    parser.add_argument('--browser', default=config.get_specified_browser(),
+                        choices=WebDriverInitializer.SUPPORTED_BROWSERS, help='browser to tune')
+    parser.add_argument('--runs', type=int, default=settings.get('runs', 3), help='launches per candidate')
+    parser.add_argument('--candidate', type=parse_candidate, action='append', default=[],
+                        help='candidate as NAME=FLAG,FLAG (repeatable); replaces the configured candidates')
+    parser.add_argument('--base-url', help='ParaBank base URL (default: a local stand-in server)')
+    parser.add_argument('--headed', action='store_true', help="don't add the browser's headless flag")
+    parser.add_argument('--save-as', help='write the winning flags to the config as a profile with this name')
+    parser.add_argument('--select', action='store_true', help='also select the saved profile for test runs')
+    args = parser.parse_args()
+    candidates = dict(args.candidate) or {
+        CURRENT_CANDIDATE: WebDriverInitializer(browser=args.browser).get_configured_flags(),
+        **settings.get('candidates', {}).get(args.browser, {}),
+    }
+    tuner = LaunchAutotuner(args.browser, candidates, runs=args.runs, headless=not args.headed)
+    rows = tuner.run(args.base_url)
+    print(format_report(rows))
+    winner = rows[0]
+    if args.save_as:
+        if 'total' not in winner:
+            parser.exit(1, 'No candidate completed a run, so no profile was saved.\n')
+        save_profile(args.browser, args.save_as, winner['flags'], select=args.select)
+        print(f'Saved the "{winner["candidate"]}" flags as the "{args.save_as}" {args.browser} profile'
+              f'{" and selected it" if args.select else ""}')
+
+
+if __name__ == '__main__':
+    main()
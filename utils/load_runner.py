@@ -0,0 +1,245 @@
+"""
+Browser-driven load runner for the ParaBank automation framework.
+
+Runs N concurrent virtual users on pooled headless WebDrivers. Every virtual user repeatedly picks a flow from a
+weighted mix (register, login, lookup) declared as flow plans over the existing page objects, waits a random think
+time between flows, and the runner reports throughput, error rate and latency percentiles per flow step while it runs.
+
+Usage:
+    python -m utils.load_runner --users 10 --duration 120 --mix register=1,login=3,lookup=1 --think-time 1-3
+    python -m utils.load_runner --stand-in --users 4 --duration 30
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import sys
+import time
+import uuid
+import random
+import argparse
+import threading
+from pathlib import Path
+from typing import Callable
+from selenium.webdriver.remote.webdriver import WebDriver
+
+root_path = Path(__file__).parent.parent
+sys.path.append(str(root_path))
+
+from pages.register_page import RegisterPage
+from pages.home_page import HomePage
+from pages.forgot_info_page import ForgotInfoPage
+from utils.logger import Logger
+from utils.driver_pool import DriverPool
+from utils.driver_proxy import is_session_dead
+from utils.load_stats import LoadStats, format_summary
+from utils.data_generator import generate_register_data
+from utils.webdriver_initializer import WebDriverInitializer
+from utils.stand_in_server import StandInServer
+from utils.page_router import get_base_url
+from utils.flow_plan import FlowPlan
+
+# Step recording the failures to get a WebDriver from the pool
+ACQUIRE_STEP = 'acquire_driver'
+LOOKUP_FIELDS = ['first_name', 'last_name', 'address', 'city', 'state', 'zip_code', 'ssn']
+
+
+class VirtualUser:
+    """State of one virtual user: the customer it registered, if any."""
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.customer: dict | None = None
+
+
+def register_steps(base_url: str, user: VirtualUser) -> list[tuple[str, Callable[[WebDriver], None]]]:
+    """Steps registering a new customer through RegisterPage."""
+    data = generate_register_data()
+    data['username'] = f'{data["username"]}{uuid.uuid4().hex[:6]}'
+
+    def welcomed(welcome_message: str) -> bool:
+        """Remembers the customer once the welcome message confirms the registration."""
+        if welcome_message != f'Welcome {data["username"]}':
+            return False
+        user.customer = data
+        return True
+
+    plan = (FlowPlan('register', fresh_session=True)
+            .input(RegisterPage, 'register_user', url=RegisterPage.URL, name='submit', user_data=data)
+            .read(RegisterPage, 'WELCOME_TITLE', name='verify', expect=welcomed))
+    return plan.compile().as_steps(base_url)
+
+
+def login_steps(base_url: str, user: VirtualUser) -> list[tuple[str, Callable[[WebDriver], None]]]:
+    """Steps logging in the virtual user's customer through HomePage."""
+    plan = (FlowPlan('login', fresh_session=True)
+            .input(HomePage, 'login_user', url=HomePage.URL, name='submit', username=user.customer['username'],
+                   password=user.customer['password'])
+            .read(HomePage, 'MAIN_TITLE', name='verify', expect='Accounts Overview'))
+    return plan.compile().as_steps(base_url)
+
+
+def lookup_steps(base_url: str, user: VirtualUser) -> list[tuple[str, Callable[[WebDriver], None]]]:
+    """Steps looking up the virtual user's customer through ForgotInfoPage."""
+    def found(credentials: dict) -> bool:
+        """Whether the lookup returned the customer's credentials."""
+        return credentials.get('username') == user.customer['username']
+
+    plan = (FlowPlan('lookup', fresh_session=True)
+            .input(ForgotInfoPage, 'perform_lookup_customer', url=ForgotInfoPage.URL, name='submit',
+                   user_data={key: user.customer[key] for key in LOOKUP_FIELDS})
+            .read(ForgotInfoPage, 'get_credentials', name='verify', expect=found))
+    return plan.compile().as_steps(base_url)
+
+
+FLOWS = {
+    'register': register_steps,
+    'login': login_steps,
+    'lookup': lookup_steps,
+}
+
+
+class LoadRunner:
+    """Drives a weighted mix of page-object flows with concurrent virtual users."""
+
+    def __init__(self, base_url: str, users: int, duration: float, flow_mix: dict[str, float],
+                 think_time: tuple[float, float] = (1.0, 3.0), drivers: int = None, report_interval: float = 5.0,
+                 driver_factory: Callable[[], WebDriver] = None):
+        self.logger = Logger(__name__)
+        unknown_flows = set(flow_mix) - set(FLOWS)
+        if unknown_flows:
+            raise ValueError(f'Unsupported flows: {sorted(unknown_flows)}. Supported flows are: {list(FLOWS)}')
+        self.base_url = base_url if base_url.endswith('/') else f'{base_url}/'
+        self.users = users
+        self.duration = duration
+        self.flow_mix = flow_mix
+        self.think_time = think_time
+        self.report_interval = report_interval
+        factory = driver_factory or (lambda: WebDriverInitializer(headless=True).initialize_webdriver())
+        self.pool = DriverPool(size=drivers or users, factory=factory)
+        self.stats = LoadStats()
+        self._stop_event = threading.Event()
+
+    def run(self) -> list[dict]:
+        """
+        Runs the load test for the configured duration.
+
+        :return: The final per-step summary rows.
+        """
+        self.logger.info(f'Starting load run: {self.users} users for {self.duration} s against {self.base_url}')
+        deadline = time.monotonic() + self.duration
+        workers = [threading.Thread(target=self._run_user, args=(VirtualUser(user_id), deadline),
+                                    name=f'virtual-user-{user_id}') for user_id in range(self.users)]
+        reporter = threading.Thread(target=self._report_progress, name='load-reporter', daemon=True)
+        reporter.start()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self._stop_event.set()
+        self.pool.close()
+        return self.stats.summary()
+
+    def _run_user(self, user: VirtualUser, deadline: float) -> None:
+        """Runs flows for one virtual user until the deadline."""
+        flows, weights = zip(*self.flow_mix.items())
+        while time.monotonic() < deadline:
+            flow = random.choices(flows, weights=weights)[0]
+            if flow != 'register' and user.customer is None:
+                flow = 'register'
+            start = time.perf_counter()
+            try:
+                driver = self.pool.acquire(timeout=max(deadline - time.monotonic(), 0.001))
+            except TimeoutError:
+                break
+            except Exception as e:
+                # A driver that fails to launch is an error of the flow, not the end of the virtual user
+                self.stats.record(f'{flow}.{ACQUIRE_STEP}', time.perf_counter() - start, error=True)
+                self.logger.error(f'Failed to acquire a WebDriver for {flow}. Error: {e}')
+                self._think(deadline)
+                continue
+            session_dead = False
+            try:
+                session_dead = self._run_flow(flow, FLOWS[flow](self.base_url, user), driver)
+            finally:
+                if session_dead:
+                    self.logger.warning('Discarding a crashed WebDriver session from the pool')
+                    self.pool.discard(driver)
+                else:
+                    self.pool.release(driver)
+            self._think(deadline)
+
+    def _think(self, deadline: float) -> None:
+        """Pauses for a random think time, without passing the deadline."""
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(min(random.uniform(*self.think_time), remaining))
+
+    def _run_flow(self, flow: str, steps: list[tuple[str, Callable[[WebDriver], None]]], driver: WebDriver) -> bool:
+        """
+        Runs the steps of one flow, stopping at the first failing step.
+
+        :return: True when a step failed because the WebDriver session is dead, so the pool replaces it.
+        """
+        for step, action in steps:
+            start = time.perf_counter()
+            try:
+                action(driver)
+            except Exception as e:
+                self.stats.record(f'{flow}.{step}', time.perf_counter() - start, error=True)
+                self.logger.error(f'Step {flow}.{step} failed. Error: {e}')
+                return is_session_dead(e)
+            self.stats.record(f'{flow}.{step}', time.perf_counter() - start)
+        return False
+
+    def _report_progress(self) -> None:
+        """Prints the running summary every report interval."""
+        while not self._stop_event.wait(self.report_interval):
+            print(format_summary(self.stats.summary()), flush=True)
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """Parses a flow mix such as "register=1,login=3,lookup=1"."""
+    mix = {}
+    for item in value.split(','):
+        flow, _, weight = item.partition('=')
+        mix[flow.strip()] = float(weight or 1)
+    return mix
+
+
+def parse_think_time(value: str) -> tuple[float, float]:
+    """Parses a think time such as "1-3" (seconds range) or "2" (fixed seconds)."""
+    low, _, high = value.partition('-')
+    return float(low), float(high or low)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Run browser-driven load against ParaBank using the page objects.')
+    parser.add_argument('--base-url', default=get_base_url(), help='ParaBank base URL')
+    parser.add_argument('--stand-in', action='store_true', help='run against a local stand-in server')
+    parser.add_argument('--users', type=int, default=5, help='number of concurrent virtual users')
+    parser.add_argument('--drivers', type=int, default=None, help='size of the WebDriver pool (default: users)')
+    parser.add_argument('--duration', type=float, default=60, help='run duration in seconds')
+    parser.add_argument('--mix', type=parse_mix, default='register=1,login=3,lookup=1', help='weighted flow mix')
+    parser.add_argument('--think-time', type=parse_think_time, default='1-3', help='think time range in seconds')
+    parser.add_argument('--report-interval', type=float, default=5, help='seconds between progress reports')
+    args = parser.parse_args()
+    server = StandInServer().start() if args.stand_in else None
+    try:
+        runner = LoadRunner(
+            base_url=server.base_url if server else args.base_url,
+            users=args.users,
+            duration=args.duration,
+            flow_mix=args.mix,
+            think_time=args.think_time,
+            drivers=args.drivers,
+            report_interval=args.report_interval,
+        )
+        print(format_summary(runner.run()))
+    finally:
+        if server:
+            server.stop()
+
+
+if __name__ == '__main__':
+    main()
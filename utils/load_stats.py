@@ -0,0 +1,91 @@
+"""
+Load statistics module for the ParaBank automation framework.
+
+Thread-safe aggregation of per-step latencies and errors, with the shared latency-percentile report format used by
+the load runners.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import math
+import time
+import threading
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """
+    Computes a percentile with the nearest-rank method.
+
+    :param sorted_values: The values, sorted ascending.
+    :param percent: The percentile, between 0 and 100.
+    :return: The percentile value, or 0.0 when there are no values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LoadStats:
+    """Collects latencies and errors per step name."""
+
+    def __init__(self):
+        self._latencies: dict[str, list[float]] = {}
+        self._errors: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.monotonic()
+
+    def record(self, step: str, latency: float, error: bool = False) -> None:
+        """
+        Records the outcome of one step execution.
+
+        :param step: The step name.
+        :param latency: The step duration in seconds.
+        :param error: Whether the step failed.
+        """
+        with self._lock:
+            self._latencies.setdefault(step, []).append(latency)
+            if error:
+                self._errors[step] = self._errors.get(step, 0) + 1
+
+    def summary(self) -> list[dict]:
+        """
+        Summarizes every step recorded so far.
+
+        :return: One row per step with count, throughput, error rate and latency percentiles in milliseconds.
+        """
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        with self._lock:
+            steps = {step: sorted(latencies) for step, latencies in self._latencies.items()}
+            errors = dict(self._errors)
+        rows = []
+        for step, latencies in steps.items():
+            row = {
+                'step': step,
+                'count': len(latencies),
+                'throughput': len(latencies) / elapsed,
+                'error_rate': errors.get(step, 0) / len(latencies),
+            }
+            for percent in PERCENTILES:
+                row[f'p{percent}'] = percentile(latencies, percent) * 1000
+            rows.append(row)
+        return rows
+
+
+def format_summary(rows: list[dict]) -> str:
+    """
+    Formats summary rows as a fixed-width latency-percentile table.
+
+    :param rows: The rows returned by LoadStats.summary.
+    :return: The formatted table.
+    """
+    header = f'{"step":<28}{"count":>8}{"req/s":>9}{"errors":>8}' + ''.join(f'{f"p{p} ms":>10}' for p in PERCENTILES)
+    lines = [header]
+    for row in rows:
+        line = f'{row["step"]:<28}{row["count"]:>8}{row["throughput"]:>9.2f}{row["error_rate"]:>8.1%}'
+        line += ''.join(f'{row[f"p{p}"]:>10.1f}' for p in PERCENTILES)
+        lines.append(line)
+    return '\n'.join(lines)
@@ -0,0 +1,135 @@
+"""
+Log merger for the ParaBank automation framework.
+
+Merges the per-worker log shards (including their compressed rollovers) into a single time-ordered log by
+streaming every shard, so memory use stays constant regardless of the size of the logs. Only the records of one run
+are merged, the latest one by default, which the run header records of the shards identify.
+
+Usage:
+    python -m utils.log_merger --log-dir logs --output logs/merged.log [--run RUN_ID | --all-runs]
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import re
+import gzip
+import heapq
+import argparse
+from pathlib import Path
+from typing import Iterator, TextIO
+from utils.logger import RUN_HEADER_PATTERN
+
+TIMESTAMP_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} - ')
+ROLLOVER_PATTERN = re.compile(r'\.(\d+)(\.gz)?$')
+
+
+def get_shard_files(log_dir: Path, shard_name: str) -> list[Path]:
+    """
+    Retrieves the files of a single shard, oldest rollover first and the active file last.
+
+    :param log_dir: The logs directory.
+    :param shard_name: The file name of the active shard, e.g. execution_gw0.log.
+    :return: The shard's files in chronological order.
+    """
+    rollovers = []
+    for path in log_dir.glob(f'{shard_name}.*'):
+        match = ROLLOVER_PATTERN.search(path.name)
+        if match:
+            rollovers.append((int(match.group(1)), path))
+    files = [path for _, path in sorted(rollovers, reverse=True)]
+    active_file = log_dir / shard_name
+    if active_file.exists():
+        files.append(active_file)
+    return files
+
+
+def open_log(path: Path) -> TextIO:
+    """Opens a plain or gzip-compressed log file for reading."""
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, encoding='utf-8', errors='replace')
+
+
+def iter_records(files: list[Path]) -> Iterator[tuple[str, str | None, str]]:
+    """
+    Streams the log records of a shard. Lines without a timestamp are continuation lines of the previous record.
+
+    :param files: The shard's files in chronological order.
+    :return: An iterator of (timestamp, run id, record text) tuples. The run id is the one of the last run header
+             record, None before the first one.
+    """
+    timestamp, run_id, lines = None, None, []
+    for path in files:
+        with open_log(path) as log_file:
+            for line in log_file:
+                if TIMESTAMP_PATTERN.match(line):
+                    if lines:
+                        yield timestamp, run_id, ''.join(lines)
+                    header = RUN_HEADER_PATTERN.search(line.rstrip('\n'))
+                    if header:
+                        run_id = header.group(1)
+                    timestamp, lines = line[:19], [line]
+                elif lines:
+                    lines.append(line)
+    if lines:
+        yield timestamp, run_id, ''.join(lines)
+
+
+def get_shard_names(log_dir: Path) -> list[str]:
+    """Retrieves the file names of the active shards in the logs directory."""
+    return sorted({ROLLOVER_PATTERN.sub('', path.name) for path in log_dir.glob('execution_*.log*')})
+
+
+def find_runs(log_dir: Path) -> list[str]:
+    """
+    Finds the runs logged in the logs directory.
+
+    :param log_dir: The logs directory.
+    :return: The run ids, ordered by the time their first header record was written.
+    """
+    started_at = {}
+    for shard_name in get_shard_names(log_dir):
+        for timestamp, run_id, _ in iter_records(get_shard_files(log_dir, shard_name)):
+            if run_id is not None and run_id not in started_at:
+                started_at[run_id] = timestamp
+    return sorted(started_at, key=started_at.get)
+
+
+def merge_logs(log_dir: Path, output: TextIO, run_id: str = None, all_runs: bool = False) -> int:
+    """
+    Merges the records of one run from every shard in the logs directory into the output in timestamp order.
+
+    :param log_dir: The logs directory.
+    :param output: The stream receiving the merged log.
+    :param run_id: The run to merge. Default is the latest run.
+    :param all_runs: Whether to merge the records of every run instead.
+    :return: The number of merged records.
+    """
+    if run_id is None and not all_runs:
+        runs = find_runs(log_dir)
+        run_id = runs[-1] if runs else None
+    streams = [iter_records(get_shard_files(log_dir, shard_name)) for shard_name in get_shard_names(log_dir)]
+    count = 0
+    for _, record_run_id, record in heapq.merge(*streams, key=lambda item: item[0]):
+        if all_runs or record_run_id == run_id:
+            output.write(record)
+            count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Merge per-worker log shards into one time-ordered log.')
+    parser.add_argument('--log-dir', default='logs', help='directory containing the log shards')
+    parser.add_argument('--output', default='logs/merged.log', help='path of the merged log')
+    runs = parser.add_mutually_exclusive_group()
+    runs.add_argument('--run', help='id of the run to merge (default: the latest run)')
+    runs.add_argument('--all-runs', action='store_true', help='merge the records of every run')
+    args = parser.parse_args()
+    with open(args.output, 'w', encoding='utf-8') as output:
+        count = merge_logs(Path(args.log_dir), output, run_id=args.run, all_runs=args.all_runs)
+    print(f'Merged {count} records into {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,21 +2,183 @@
 Custom logging module for the ParaBank automation framework.
 
 Handles log configuration, file/console handlers, and formatted output for test execution.
+Log files are sharded per worker (a stable "main" shard, plus "gw0", "gw1", ... under pytest-xdist). Every run starts
+with a header record carrying its run id and rolls the previous run's shard over, shards are also rotated when they
+reach a size cap, rollovers are compressed, and the log files are pruned by count and age.
 
 @author: Raed Eleyan
 @date: 04/07/2025
 @contact: raedeleyan1@gmail.com
 """
 import os
+import re
 import sys
+import gzip
+import json
+import time
+import shutil
 import logging
 from pathlib import Path
-from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+DEFAULT_LOG_SETTINGS = {
+    'max_bytes': 10 * 1024 * 1024,
+    'backup_count': 5,
+    'max_age_days': 7,
+    'max_files': 50,
+    'compress': True,
+}
+
+# Inherited by the processes a run spawns (xdist workers, subprocesses), so they all log under the same run id
+RUN_ID_VARIABLE = 'PARABANK_LOG_RUN_ID'
+# "<worker id>:<pid>" of the process that owns, and therefore rotates, the worker's shard
+SHARD_OWNER_VARIABLE = 'PARABANK_LOG_SHARD_OWNER'
+RUN_HEADER = 'Log run %s started'
+RUN_HEADER_PATTERN = re.compile(r' - Log run (\S+) started$')
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def get_worker_id() -> str:
+    """Returns the id of the current worker, used to shard the log files: the xdist worker id, or "main"."""
+    return os.environ.get('PYTEST_XDIST_WORKER', 'main')
+
+
+def get_run_id() -> str:
+    """Returns the id of the current run, creating it in the first process of the run."""
+    run_id = os.environ.get(RUN_ID_VARIABLE)
+    if run_id is None:
+        run_id = os.environ[RUN_ID_VARIABLE] = f'{time.strftime("%Y%m%d-%H%M%S")}-{os.getpid()}'
+    return run_id
+
+
+def claim_shard(worker_id: str) -> bool:
+    """
+    Claims the worker's shard for the current process unless a parent process of the same worker owns it, e.g. a
+    pytest subprocess spawned by a test.
+
+    :param worker_id: The id of the current worker.
+    :return: True if the current process owns the shard.
+    """
+    owner = os.environ.get(SHARD_OWNER_VARIABLE, '')
+    if owner.partition(':')[0] == worker_id and owner != f'{worker_id}:{os.getpid()}':
+        return False
+    os.environ[SHARD_OWNER_VARIABLE] = f'{worker_id}:{os.getpid()}'
+    return True
+
+
+def read_run_id(log_file: Path) -> str | None:
+    """
+    Reads the run id from the header record of a log file.
+
+    :param log_file: The log file.
+    :return: The run id, or None if the file is missing or doesn't start with a header record.
+    """
+    try:
+        with open(log_file, encoding='utf-8', errors='replace') as file:
+            match = RUN_HEADER_PATTERN.search(file.readline().rstrip('\n'))
+    except FileNotFoundError:
+        return None
+    return match.group(1) if match else None
+
+
+def create_file_handler(log_dir: Path, worker_id: str, run_id: str, settings: dict,
+                        owner: bool = True) -> logging.Handler:
+    """
+    Creates the file handler of a worker's shard for the run.
+
+    The owner of the shard rolls the previous run's file over and starts the file with the run's header record. Other
+    processes of the same run only append to the file, without rotating it.
+
+    :param log_dir: The logs directory.
+    :param worker_id: The id of the worker.
+    :param run_id: The id of the run.
+    :param settings: The log settings.
+    :param owner: Whether the current process owns the shard.
+    :return: The file handler.
+    """
+    log_file = log_dir / f'execution_{worker_id}.log'
+    if not owner:
+        return CompressingRotatingFileHandler(log_file, max_bytes=0, backup_count=0, compress=False)
+    previous_run_id = read_run_id(log_file)
+    handler = CompressingRotatingFileHandler(
+        log_file,
+        max_bytes=settings['max_bytes'],
+        backup_count=settings['backup_count'],
+        compress=settings['compress'],
+    )
+    if previous_run_id != run_id and log_file.stat().st_size > 0:
+        if settings['backup_count'] > 0:
+            handler.doRollover()
+        else:
+            handler.stream.truncate(0)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+    handler.emit(logging.LogRecord(__name__, logging.INFO, __file__, 0, RUN_HEADER, (run_id,), None))
+    return handler
+
+
+def prune_logs(log_dir: Path, max_age_days: float, max_files: int) -> None:
+    """
+    Deletes the log files older than the retention age, then the oldest ones beyond the max number of files.
+
+    :param log_dir: The logs directory.
+    :param max_age_days: The max age of a log file in days.
+    :param max_files: The max number of log files, across all shards and their rollovers.
+    """
+    cutoff = time.time() - max_age_days * 24 * 60 * 60
+    log_files = []
+    for log_file in log_dir.glob('execution_*.log*'):
+        try:
+            log_files.append((log_file.stat().st_mtime, log_file))
+        except FileNotFoundError:
+            continue
+    log_files.sort(reverse=True)
+    for position, (modified_at, log_file) in enumerate(log_files):
+        if modified_at < cutoff or position >= max_files:
+            log_file.unlink(missing_ok=True)
+
+
+def load_log_settings(config_path: str = 'config/config.json') -> dict:
+    """
+    Loads the "logging" section of the configuration file on top of the defaults.
+
+    :param config_path: The path of the configuration file.
+    :return: The log settings.
+    """
+    settings = dict(DEFAULT_LOG_SETTINGS)
+    try:
+        with open(config_path) as file:
+            settings.update(json.load(file).get('logging', {}))
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return settings
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """Size-capped rotating file handler that gzips every file it rolls over."""
+
+    def __init__(self, filename: Path, max_bytes: int, backup_count: int, compress: bool = True):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        if compress:
+            self.namer = lambda name: f'{name}.gz'
+            self.rotator = self._compress
+
+    @staticmethod
+    def _compress(source: str, destination: str) -> None:
+        """Compresses the rolled-over file into the destination and removes the original."""
+        with open(source, 'rb') as source_file, gzip.open(destination, 'wb') as destination_file:
+            shutil.copyfileobj(source_file, destination_file)
+        os.remove(source)
+
 
 class Logger:
     """Logger class to handle logging configuration and operations."""
 
-    def __init__(self, name: str = None, log_level: int = logging.INFO):
+    _handlers: list[logging.Handler] = []
+    # Level of loggers created without an explicit level; raised to WARNING in flight-recorder mode
+    default_level: int = logging.INFO
+
+    def __init__(self, name: str = None, log_level: int = None):
         if name is None:
             if "__main__" in sys.argv[0]:
                 script_path = sys.argv[0]
@@ -25,51 +187,58 @@ class Logger:
             else:
                 name = __name__
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(log_level)
+        self.logger.setLevel(log_level if log_level is not None else Logger.default_level)
         self.log_dir = Path('logs')
         self._configure_handlers()
 
     def _configure_handlers(self) -> None:
-        """Set up file and console handlers with formatters."""
+        """Attach the process-wide file and console handlers, creating them on first use."""
+        if not Logger._handlers:
+            Logger._handlers = self._create_handlers()
+        for handler in Logger._handlers:
+            if handler not in self.logger.handlers:
+                self.logger.addHandler(handler)
+
+    def _create_handlers(self) -> list[logging.Handler]:
+        """
+        Set up the rotating file handler of this worker's shard and the console handler.
+
+        :return: The created handlers.
+        """
         # Create logs directory if missing
         self.log_dir.mkdir(parents=True, exist_ok=True)
-
-        # Timestamped log file
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        log_file = self.log_dir / f"execution_{timestamp}.log"
+        settings = load_log_settings()
+        prune_logs(self.log_dir, settings['max_age_days'], settings['max_files'])
 
         # Log formatting
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
-        # File handler
-        file_handler = logging.FileHandler(log_file)
+        # One log shard per worker, rolled over once per run
+        worker_id = get_worker_id()
+        file_handler = create_file_handler(self.log_dir, worker_id, get_run_id(), settings, claim_shard(worker_id))
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
 
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        return [file_handler, console_handler]
 
-    def info(self, message: str) -> None:
-        """Log an info-level message."""
-        self.logger.info(message)
+    def info(self, message: str, *args) -> None:
+        """Log an info-level message, formatted with args only if the level is enabled."""
+        self.logger.info(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Log an error-level message."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """Log a debug-level message."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log a warning-level message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def critical(self, message):
+    def critical(self, message, *args):
         """Log a critical message."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
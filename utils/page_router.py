@@ -0,0 +1,94 @@
+"""
+Page-aware navigation router for the ParaBank automation framework.
+
+Page objects declare their canonical URL and a cheap readiness locator. The router resolves URLs against the
+configured base URL and only loads a page when the current document doesn't already satisfy it: the browser must be
+on the page's URL and the readiness locator must be present. It counts the navigations it performed and avoided.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import re
+from urllib.parse import urljoin, urlsplit
+from selenium.webdriver.remote.webdriver import WebDriver
+from .logger import Logger
+from .config_loader import ConfigLoader
+
+DEFAULT_BASE_URL = 'https://parabank.parasoft.com/parabank/'
+SESSION_ID_PATTERN = re.compile(r';jsessionid=[^?#]*', re.IGNORECASE)
+
+
+def get_base_url() -> str:
+    """Returns the base URL of the application under test from the configuration file, ending with a slash."""
+    base_url = ConfigLoader().get_setting('base_url', DEFAULT_BASE_URL)
+    return base_url if base_url.endswith('/') else f'{base_url}/'
+
+
+def same_location(current_url: str, url: str) -> bool:
+    """Whether the browser's current URL is the target URL, ignoring session ids and fragments."""
+    current, target = urlsplit(SESSION_ID_PATTERN.sub('', current_url)), urlsplit(SESSION_ID_PATTERN.sub('', url))
+    return current._replace(fragment='') == target._replace(fragment='')
+
+
+class PageRouter:
+    """Navigates a driver to pages, skipping loads the current document already satisfies."""
+
+    def __init__(self, driver: WebDriver, base_url: str = None):
+        self.logger = Logger(__name__)
+        self.driver = driver
+        base_url = base_url or get_base_url()
+        self.base_url = base_url if base_url.endswith('/') else f'{base_url}/'
+        self.navigations = 0
+        self.navigations_avoided = 0
+
+    def resolve(self, url: str) -> str:
+        """Resolves a URL relative to the base URL; absolute URLs are returned as they are."""
+        return urljoin(self.base_url, url)
+
+    def is_satisfied(self, url: str, ready_locator: tuple[str, str] = None) -> bool:
+        """
+        Checks whether the current document is the target page, without waiting.
+
+        :param url: The absolute target URL.
+        :param ready_locator: The locator that must be present for the page to count as loaded, if any.
+        :return: True if the browser is on the URL and the readiness locator is present.
+        """
+        if not same_location(self.driver.current_url, url):
+            return False
+        return ready_locator is None or bool(self.driver.find_elements(*ready_locator))
+
+    def navigate(self, url: str, ready_locator: tuple[str, str] = None, force: bool = False) -> bool:
+        """
+        Loads the URL unless the current document already satisfies it.
+
+        :param url: The target URL, absolute or relative to the base URL.
+        :param ready_locator: The locator that must be present for the current document to satisfy the target.
+        :param force: Whether to load the URL without checking the current document.
+        :return: True if the URL was loaded, False if the navigation was avoided.
+        """
+        target = self.resolve(url)
+        if not force and self.is_satisfied(target, ready_locator):
+            self.navigations_avoided += 1
+            self.logger.debug('Already on %s, navigation avoided', target)
+            return False
+        self.driver.get(target)
+        self.navigations += 1
+        return True
+
+    def open(self, page: type, context=None, force: bool = False):
+        """
+        Brings the browser to a page object's canonical URL and returns the page object.
+
+        :param page: The page-object class; it must declare URL and may declare READY_LOCATOR.
+        :param context: The browser context to bind the page object to, if any.
+        :param force: Whether to reload the page even if the browser is already on it.
+        :return: The page object.
+        :raises ValueError: When the page object doesn't declare a URL.
+        """
+        if getattr(page, 'URL', None) is None:
+            raise ValueError(f'{page.__name__} does not declare a URL')
+        if context is not None:
+            context.activate()
+        self.navigate(page.URL, getattr(page, 'READY_LOCATOR', None), force)
+        return page(self.driver, context)
@@ -0,0 +1,163 @@
+"""
+Performance timing module for the ParaBank automation framework.
+
+Collects the browser's PerformanceNavigationTiming and PerformanceResourceTiming entries of every document a
+test loads, either through a navigation or a form submit, and checks every document against its performance budget:
+the default budget of the configuration file, overridden by the PERFORMANCE_BUDGET of the page object whose URL
+matches the document, and then by the configuration's overrides for that URL.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+from urllib.parse import urlsplit
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.command import Command
+from selenium.common.exceptions import WebDriverException
+from .logger import Logger
+from .command_listeners import CommandListener
+from .page_router import SESSION_ID_PATTERN
+from pages.base_page import BasePage
+
+# Max allowed milliseconds per page-load metric of every document, unless the "performance" config overrides them
+DEFAULT_PERFORMANCE_BUDGET = {'ttfb': 1500, 'dom_content_loaded': 4000, 'load': 8000}
+
+# Reads the navigation entry and the slowest resources of the current document in a single script call.
+# Returns null while the document is still loading.
+PAGE_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+if (!nav || nav.loadEventEnd === 0) { return null; }
+const resources = performance.getEntriesByType('resource')
+    .map(r => ({name: r.name, type: r.initiatorType, duration: r.duration, size: r.transferSize}))
+    .sort((a, b) => b.duration - a.duration)
+    .slice(0, arguments[0]);
+return {
+    url: nav.name,
+    time_origin: performance.timeOrigin,
+    ttfb: nav.responseStart - nav.startTime,
+    dom_content_loaded: nav.domContentLoadedEventEnd - nav.startTime,
+    load: nav.loadEventEnd - nav.startTime,
+    slowest_resources: resources
+};
+"""
+
+
+def get_declared_budget(path: str) -> dict[str, float]:
+    """
+    Finds the performance budget declared by the page object whose URL matches a document path.
+
+    :param path: The path of the document, without session id.
+    :return: The declared max allowed milliseconds per metric, empty when no page object declares a budget for it.
+    """
+    pending = list(BasePage.__subclasses__())
+    while pending:
+        page = pending.pop(0)
+        pending.extend(page.__subclasses__())
+        if page.URL and page.PERFORMANCE_BUDGET and path.endswith(f'/{page.URL}'):
+            return page.PERFORMANCE_BUDGET
+    return {}
+
+
+class PerformanceBudgetExceeded(AssertionError):
+    """Raised when a document loaded during a test exceeded its performance budget."""
+
+
+class PerformanceRecorder(CommandListener):
+    """Records the timing of every document loaded in a WebDriver session during a test."""
+
+    def __init__(self, slowest_resources: int = 5, enforce_budgets: bool = True, budget: dict[str, float] = None,
+                 page_budgets: dict[str, dict[str, float]] = None):
+        self.logger = Logger(__name__)
+        self.slowest_resources = slowest_resources
+        self.enforce_budgets = enforce_budgets
+        # Max allowed milliseconds per metric (ttfb, dom_content_loaded, load), overridden per page URL
+        self.budget = DEFAULT_PERFORMANCE_BUDGET if budget is None else budget
+        self.page_budgets = page_budgets or {}
+        self.records: list[dict] = []
+        self.violations: list[str] = []
+        self._last_time_origin = None
+
+    @classmethod
+    def from_config(cls, settings: dict) -> 'PerformanceRecorder':
+        """
+        Creates a recorder from the "performance" section of the configuration file.
+
+        :param settings: The configuration section.
+        :return: The PerformanceRecorder instance.
+        """
+        return cls(
+            slowest_resources=settings.get('slowest_resources', 5),
+            enforce_budgets=settings.get('enforce_budgets', True),
+            budget=settings.get('budget'),
+            page_budgets=settings.get('page_budgets'),
+        )
+
+    def before_command(self, driver: WebDriver, command: str, params: dict) -> None:
+        # A click may be a form submit and a get replaces the document: record the document they leave.
+        if command in (Command.GET, Command.CLICK_ELEMENT):
+            self.record(driver)
+
+    def after_command(self, driver: WebDriver, command: str, params: dict, duration: float) -> None:
+        if command == Command.GET:
+            self.record(driver)
+
+    def record(self, driver: WebDriver) -> dict | None:
+        """
+        Records the timing of the current document unless it was already recorded or is still loading.
+
+        :param driver: The WebDriver.
+        :return: The timing record of the current document, or None if it isn't available.
+        """
+        try:
+            timing = driver.execute_script(PAGE_TIMING_SCRIPT, self.slowest_resources)
+        except WebDriverException as e:
+            self.logger.warning(f'Failed to collect the page timing. Error: {e}')
+            return None
+        if timing is None or not timing['url'].startswith('http'):
+            return None
+        if timing['time_origin'] != self._last_time_origin:
+            self._last_time_origin = timing['time_origin']
+            self.records.append(timing)
+            self.logger.info(f'Page timing of {timing["url"]}: TTFB {timing["ttfb"]:.0f} ms, '
+                             f'DOMContentLoaded {timing["dom_content_loaded"]:.0f} ms, load {timing["load"]:.0f} ms')
+            self._check_budget(timing)
+        return self.records[-1]
+
+    def budget_for(self, url: str) -> dict[str, float]:
+        """
+        Returns the budget of a document: the default budget, overridden by the budget declared by the page object
+        whose URL matches the document, then by the configured overrides of that URL.
+
+        :param url: The URL of the document.
+        :return: The max allowed milliseconds per metric.
+        """
+        path = SESSION_ID_PATTERN.sub('', urlsplit(url).path)
+        budget = {**self.budget, **get_declared_budget(path)}
+        for page_url, overrides in self.page_budgets.items():
+            if path.endswith(f'/{page_url}'):
+                budget.update(overrides)
+        return budget
+
+    def _check_budget(self, timing: dict) -> None:
+        """
+        Checks the timing of a newly recorded document against its budget, remembering the violations.
+
+        :param timing: The timing record of the document.
+        """
+        violations = [f'{metric} {timing[metric]:.0f} ms > {limit} ms'
+                      for metric, limit in self.budget_for(timing['url']).items() if timing.get(metric, 0) > limit]
+        if not violations:
+            return
+        timing['budget_violations'] = violations
+        message = f'{timing["url"]} exceeded its performance budget: {", ".join(violations)}'
+        self.logger.error(message)
+        self.violations.append(message)
+
+    def enforce(self) -> None:
+        """
+        Fails the test when a document it loaded exceeded its budget and budgets are enforced.
+
+        :raises PerformanceBudgetExceeded: When a document exceeded its budget.
+        """
+        if self.enforce_budgets and self.violations:
+            raise PerformanceBudgetExceeded('; '.join(self.violations))
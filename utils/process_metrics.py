@@ -0,0 +1,82 @@
+"""
+Process metrics utility for the ParaBank automation framework.
+
+Resolves the process tree (driver server plus browser processes) behind a local WebDriver session
+and samples its resident memory and CPU usage.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import psutil
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def get_driver_pid(driver: WebDriver) -> int | None:
+    """
+    Retrieves the PID of the driver server process that backs a local WebDriver session.
+
+    :param driver: The WebDriver instance.
+    :return: The driver server PID, or None for remote sessions.
+    """
+    service = getattr(driver, 'service', None)
+    process = getattr(service, 'process', None)
+    return getattr(process, 'pid', None)
+
+
+def get_process_tree(pid: int) -> list[psutil.Process]:
+    """
+    Retrieves a process and all of its live descendants.
+
+    :param pid: The PID of the root process.
+    :return: A list of processes, root first. Empty if the root process is gone.
+    """
+    try:
+        root = psutil.Process(pid)
+        return [root] + root.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return []
+
+
+def get_tree_rss(pid: int) -> int:
+    """
+    Sums the resident set size of a process tree.
+
+    :param pid: The PID of the root process.
+    :return: The total RSS in bytes.
+    """
+    total = 0
+    for process in get_process_tree(pid):
+        try:
+            total += process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total
+
+
+def get_tree_cpu_time(pid: int) -> float:
+    """
+    Sums the user and system CPU time consumed by a process tree.
+
+    :param pid: The PID of the root process.
+    :return: The total CPU time in seconds.
+    """
+    total = 0.0
+    for process in get_process_tree(pid):
+        try:
+            cpu_times = process.cpu_times()
+            total += cpu_times.user + cpu_times.system
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total
+
+
+def get_driver_rss(driver: WebDriver) -> int:
+    """
+    Retrieves the total RSS of the driver server and browser processes of a WebDriver session.
+
+    :param driver: The WebDriver instance.
+    :return: The total RSS in bytes, or 0 for remote sessions.
+    """
+    pid = get_driver_pid(driver)
+    return get_tree_rss(pid) if pid is not None else 0
@@ -0,0 +1,299 @@
+"""
+Protocol-level record-and-replay load mode for the ParaBank automation framework.
+
+The recorder runs one UI flow (RegisterPage.register_user followed by HomePage.login_user) in Chrome with
+performance logging, captures the HTTP requests it issues and turns them into a parameterized request template:
+recorded form values that match the generated user data become placeholders and session ids are dropped so the
+replay correlates them through its own cookie jar. The heading the UI saw after each step becomes that step's success
+marker, because ParaBank answers form and login errors with a 200 page. The replayer runs that template without a
+browser, with many virtual users sharing a pooled keep-alive async HTTP client, and reports in the shared
+latency-percentile format.
+
+Usage:
+    python -m utils.protocol_load record --output load_templates/register_login.json
+    python -m utils.protocol_load replay --template load_templates/register_login.json --users 500 --duration 60
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import sys
+import html
+import json
+import time
+import uuid
+import random
+import asyncio
+import argparse
+from pathlib import Path
+from string import Template
+from urllib.parse import parse_qsl, urlsplit
+import aiohttp
+
+root_path = Path(__file__).parent.parent
+sys.path.append(str(root_path))
+
+from pages.register_page import RegisterPage
+from pages.home_page import HomePage
+from utils.logger import Logger
+from utils.load_stats import LoadStats, format_summary
+from utils.data_generator import generate_register_data
+from utils.webdriver_initializer import WebDriverInitializer
+from utils.stand_in_server import StandInServer
+from utils.page_router import SESSION_ID_PATTERN, get_base_url
+
+SUCCESS_MARKER_SCRIPT = """
+const heading = document.querySelector('h1.title');
+return heading ? heading.innerText.trim() : document.title.trim();
+"""
+
+
+def generate_iteration_data() -> dict:
+    """Generates fresh registration data with a unique username for one recorded or replayed iteration."""
+    data = generate_register_data()
+    data['username'] = f'{data["username"]}{uuid.uuid4().hex[:6]}'
+    return data
+
+
+def extract_requests(log_entries: list[dict], include_assets: bool = False) -> list[dict]:
+    """
+    Extracts the HTTP requests issued by the browser from Chrome performance log entries.
+
+    Redirect follow-ups are skipped because the replay client follows redirects itself.
+
+    :param log_entries: The entries returned by driver.get_log('performance').
+    :param include_assets: Whether to keep sub-resource requests (stylesheets, scripts, images...).
+    :return: The requests in issue order, each with its method, url, post data and resource type.
+    """
+    requests = []
+    for entry in log_entries:
+        message = json.loads(entry['message'])['message']
+        if message['method'] != 'Network.requestWillBeSent':
+            continue
+        params = message['params']
+        request = params['request']
+        if 'redirectResponse' in params or not request['url'].startswith('http'):
+            continue
+        if not include_assets and params.get('type') != 'Document':
+            continue
+        requests.append({'method': request['method'], 'url': request['url'], 'post_data': request.get('postData'),
+                         'type': params.get('type')})
+    return requests
+
+
+def build_template(requests: list[dict], base_url: str, data: dict) -> dict:
+    """
+    Turns recorded requests into a parameterized request template.
+
+    :param requests: The recorded requests.
+    :param base_url: The base URL the UI flow ran against; it becomes the ${base_url} placeholder.
+    :param data: The user data the UI flow submitted; matching form values become placeholders.
+    :return: The request template.
+    """
+    placeholders = {}
+    for key, value in data.items():
+        if value and value not in placeholders:
+            placeholders[value] = f'${{{key}}}'
+    parameters = set()
+    steps = []
+    for request in requests:
+        expect = request.get('expect')
+        if expect:
+            expect = expect.replace('$', '$$')
+            for value, placeholder in sorted(placeholders.items(), key=lambda item: -len(item[0])):
+                if value.replace('$', '$$') in expect:
+                    parameters.add(placeholder[2:-1])
+                    expect = expect.replace(value.replace('$', '$$'), placeholder)
+        url = SESSION_ID_PATTERN.sub('', request['url'])
+        path = url[len(base_url):] if url.startswith(base_url) else url
+        form = []
+        for name, value in parse_qsl(request['post_data'] or '', keep_blank_values=True):
+            if value in placeholders:
+                parameters.add(placeholders[value][2:-1])
+                form.append([name, placeholders[value]])
+            else:
+                form.append([name, value.replace('$', '$$')])
+        steps.append({
+            'name': f'{request["method"]} {urlsplit(url).path.rsplit("/", 1)[-1] or "/"}',
+            'method': request['method'],
+            'url': f'${{base_url}}{path.replace("$", "$$")}' if url.startswith(base_url) else url.replace('$', '$$'),
+            'form': form if request['method'] == 'POST' else None,
+            'expect': expect or None,
+        })
+    return {'recorded_base_url': base_url, 'parameters': sorted(parameters), 'steps': steps}
+
+
+def record_flow(base_url: str, include_assets: bool = False) -> dict:
+    """
+    Runs the register then login UI flow in Chrome and records it as a request template.
+
+    :param base_url: The ParaBank base URL.
+    :param include_assets: Whether to keep sub-resource requests in the template.
+    :return: The request template.
+    :raises ValueError: When the configured browser isn't Chrome.
+    """
+    initializer = WebDriverInitializer(headless=True, capabilities={'goog:loggingPrefs': {'performance': 'ALL'}})
+    if initializer.browser != 'chrome':
+        raise ValueError('Recording HTTP requests requires the chrome browser.')
+    driver = initializer.initialize_webdriver()
+    requests = []
+
+    def record_segment() -> None:
+        """Collects the requests issued since the last segment; the last document gets the current heading."""
+        segment = extract_requests(driver.get_log('performance'), include_assets)
+        documents = [request for request in segment if request['type'] == 'Document']
+        if documents:
+            documents[-1]['expect'] = driver.execute_script(SUCCESS_MARKER_SCRIPT)
+        requests.extend(segment)
+
+    try:
+        data = generate_iteration_data()
+        driver.get_log('performance')
+        driver.get(f'{base_url}register.htm')
+        register_page = RegisterPage(driver)
+        record_segment()
+        register_page.register_user(user_data=data)
+        register_page.get_welcome_message()
+        record_segment()
+        driver.delete_all_cookies()
+        driver.get(f'{base_url}index.htm')
+        home_page = HomePage(driver)
+        record_segment()
+        home_page.login_user(username=data['username'], password=data['password'])
+        home_page.get_main_title()
+        record_segment()
+    finally:
+        driver.quit()
+    return build_template(requests, base_url, data)
+
+
+class ProtocolReplayer:
+    """Replays a request template with concurrent virtual users over a shared keep-alive connection pool."""
+
+    def __init__(self, template: dict, base_url: str, users: int, duration: float, connections: int = 100,
+                 keepalive_timeout: float = 30, think_time: tuple[float, float] = (0.0, 0.0),
+                 report_interval: float = 5.0):
+        self.logger = Logger(__name__)
+        self.steps = [dict(step, url_template=Template(step['url']),
+                           form_template=[(name, Template(value)) for name, value in step['form'] or []],
+                           expect_template=Template(step['expect']) if step.get('expect') else None)
+                      for step in template['steps']]
+        self.base_url = base_url if base_url.endswith('/') else f'{base_url}/'
+        self.users = users
+        self.duration = duration
+        self.connections = connections
+        self.keepalive_timeout = keepalive_timeout
+        self.think_time = think_time
+        self.report_interval = report_interval
+        self.stats = LoadStats()
+
+    def run(self) -> list[dict]:
+        """
+        Runs the replay for the configured duration.
+
+        :return: The final per-step summary rows.
+        """
+        self.logger.info(f'Starting protocol replay: {self.users} users for {self.duration} s against {self.base_url}')
+        asyncio.run(self._run())
+        return self.stats.summary()
+
+    async def _run(self) -> None:
+        connector = aiohttp.TCPConnector(limit=self.connections, keepalive_timeout=self.keepalive_timeout,
+                                         ttl_dns_cache=300)
+        deadline = time.monotonic() + self.duration
+        reporter = asyncio.create_task(self._report_progress())
+        try:
+            await asyncio.gather(*(self._run_user(connector, deadline) for _ in range(self.users)))
+        finally:
+            reporter.cancel()
+            await connector.close()
+
+    async def _run_user(self, connector: aiohttp.TCPConnector, deadline: float) -> None:
+        """Replays the template in a loop; every iteration gets fresh data and its own cookie jar."""
+        while time.monotonic() < deadline:
+            values = dict(generate_iteration_data(), base_url=self.base_url)
+            async with aiohttp.ClientSession(connector=connector, connector_owner=False,
+                                             cookie_jar=aiohttp.CookieJar(unsafe=True)) as session:
+                for step in self.steps:
+                    if not await self._run_step(session, step, values):
+                        break
+            if self.think_time[1] > 0:
+                await asyncio.sleep(random.uniform(*self.think_time))
+
+    async def _run_step(self, session: aiohttp.ClientSession, step: dict, values: dict) -> bool:
+        """
+        Sends one templated request and records its latency.
+
+        :return: True if the request succeeded and its body contains the step's success marker.
+        """
+        url = step['url_template'].safe_substitute(values)
+        form = [(name, value.safe_substitute(values)) for name, value in step['form_template']]
+        start = time.perf_counter()
+        try:
+            async with session.request(step['method'], url, data=form if step['form'] is not None else None) \
+                    as response:
+                body = await response.text(errors='replace')
+                succeeded = response.status < 400 and self._has_marker(step, body, values)
+                if not succeeded:
+                    self.logger.error(f'Request {step["name"]} failed with status {response.status}.')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f'Request {step["name"]} failed. Error: {e}')
+            succeeded = False
+        self.stats.record(step['name'], time.perf_counter() - start, error=not succeeded)
+        return succeeded
+
+    @staticmethod
+    def _has_marker(step: dict, body: str, values: dict) -> bool:
+        """Whether the response body contains the step's success marker, raw or HTML-escaped."""
+        if step['expect_template'] is None:
+            return True
+        marker = step['expect_template'].safe_substitute(values)
+        return marker in body or html.escape(marker, quote=False) in body
+
+    async def _report_progress(self) -> None:
+        """Prints the running summary every report interval."""
+        while True:
+            await asyncio.sleep(self.report_interval)
+            print(format_summary(self.stats.summary()), flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Record a UI flow as a request template and replay it as load.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    record_parser = subparsers.add_parser('record', help='record the register and login UI flow')
+    record_parser.add_argument('--base-url', default=get_base_url(), help='ParaBank base URL')
+    record_parser.add_argument('--output', default='load_templates/register_login.json', help='template path')
+    record_parser.add_argument('--include-assets', action='store_true', help='keep sub-resource requests')
+    replay_parser = subparsers.add_parser('replay', help='replay a request template without a browser')
+    replay_parser.add_argument('--template', default='load_templates/register_login.json', help='template path')
+    replay_parser.add_argument('--base-url', default=get_base_url(), help='ParaBank base URL')
+    replay_parser.add_argument('--users', type=int, default=100, help='number of concurrent virtual users')
+    replay_parser.add_argument('--duration', type=float, default=60, help='run duration in seconds')
+    replay_parser.add_argument('--connections', type=int, default=100, help='max pooled keep-alive connections')
+    replay_parser.add_argument('--keepalive-timeout', type=float, default=30, help='idle keep-alive seconds')
+    replay_parser.add_argument('--report-interval', type=float, default=5, help='seconds between progress reports')
+    for subparser in (record_parser, replay_parser):
+        subparser.add_argument('--stand-in', action='store_true', help='run against a local stand-in server')
+    args = parser.parse_args()
+    server = StandInServer().start() if args.stand_in else None
+    base_url = server.base_url if server else args.base_url
+    try:
+        if args.command == 'record':
+            template = record_flow(base_url, args.include_assets)
+            output = Path(args.output)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(json.dumps(template, indent=2))
+            print(f'Recorded {len(template["steps"])} requests into {output}')
+        else:
+            template = json.loads(Path(args.template).read_text())
+            replayer = ProtocolReplayer(template, base_url, users=args.users, duration=args.duration,
+                                        connections=args.connections, keepalive_timeout=args.keepalive_timeout,
+                                        report_interval=args.report_interval)
+            print(format_summary(replayer.run()))
+    finally:
+        if server:
+            server.stop()
+
+
+if __name__ == '__main__':
+    main()
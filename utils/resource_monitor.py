@@ -0,0 +1,176 @@
+"""
+Resource monitor module for the ParaBank automation framework.
+
+Samples CPU and RSS of the driver/browser process tree of every active WebDriver session in a background
+thread, counts the commands each session issues, and decides when a session should be recycled.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import time
+import threading
+from selenium.webdriver.remote.webdriver import WebDriver
+from .logger import Logger
+from .process_metrics import get_driver_pid, get_tree_rss, get_tree_cpu_time
+from .command_listeners import CommandListener, add_command_listener, remove_command_listener
+
+MB = 1024 * 1024
+
+
+class SessionStats(CommandListener):
+    """Resource statistics of a single monitored WebDriver session, counting the commands it issues."""
+
+    def __init__(self):
+        self.rss = 0
+        self.peak_rss = 0
+        self.cpu_time = 0.0
+        self.command_count = 0
+        self.started_at = time.monotonic()
+
+    def before_command(self, driver: WebDriver, command: str, params: dict) -> None:
+        self.command_count += 1
+
+
+class ResourceMonitor:
+    """Background sampler of the resources used by registered WebDriver sessions."""
+
+    def __init__(self, interval: float = 1.0, max_rss_mb: float = None, max_commands: int = None,
+                 max_session_age: float = None, leak_threshold_mb: float = 50):
+        self.logger = Logger(__name__)
+        self.interval = interval
+        self.max_rss_mb = max_rss_mb
+        self.max_commands = max_commands
+        self.max_session_age = max_session_age
+        self.leak_threshold_mb = leak_threshold_mb
+        self._sessions: dict[int, tuple[WebDriver, SessionStats]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_config(cls, settings: dict) -> 'ResourceMonitor':
+        """
+        Creates a monitor from the "resource_monitor" section of the configuration file.
+
+        :param settings: The configuration section.
+        :return: The ResourceMonitor instance.
+        """
+        return cls(
+            interval=settings.get('interval', 1.0),
+            max_rss_mb=settings.get('max_rss_mb'),
+            max_commands=settings.get('max_commands'),
+            max_session_age=settings.get('max_session_age'),
+            leak_threshold_mb=settings.get('leak_threshold_mb', 50),
+        )
+
+    def start(self) -> None:
+        """Starts the background sampling thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='resource-monitor', daemon=True)
+        self._thread.start()
+        self.logger.info(f'Resource monitor started with a sampling interval of {self.interval} seconds')
+
+    def stop(self) -> None:
+        """Stops the background sampling thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+        self.logger.info('Resource monitor stopped')
+
+    def register(self, driver: WebDriver) -> None:
+        """
+        Starts monitoring a WebDriver session.
+
+        :param driver: The WebDriver (or DriverProxy) to monitor.
+        """
+        stats = SessionStats()
+        add_command_listener(driver, stats)
+        with self._lock:
+            self._sessions[id(driver)] = (driver, stats)
+        self._sample(driver, stats)
+
+    def unregister(self, driver: WebDriver) -> None:
+        """
+        Stops monitoring a WebDriver session.
+
+        :param driver: The monitored WebDriver.
+        """
+        with self._lock:
+            entry = self._sessions.pop(id(driver), None)
+        if entry is not None:
+            remove_command_listener(driver, entry[1])
+
+    def reset(self, driver: WebDriver) -> None:
+        """
+        Resets the statistics of a session, e.g. after its driver was recycled.
+
+        :param driver: The monitored WebDriver.
+        """
+        self.unregister(driver)
+        self.register(driver)
+
+    def get_stats(self, driver: WebDriver) -> SessionStats | None:
+        """
+        Samples and returns the up-to-date statistics of a monitored session.
+
+        :param driver: The monitored WebDriver.
+        :return: The SessionStats, or None if the session isn't monitored.
+        """
+        with self._lock:
+            entry = self._sessions.get(id(driver))
+        if entry is None:
+            return None
+        self._sample(*entry)
+        return entry[1]
+
+    def recycle_reason(self, driver: WebDriver) -> str | None:
+        """
+        Checks the configured thresholds for a monitored session.
+
+        :param driver: The monitored WebDriver.
+        :return: A description of the exceeded threshold, or None if the session is within all thresholds.
+        """
+        stats = self.get_stats(driver)
+        if stats is None:
+            return None
+        if self.max_rss_mb is not None and stats.rss / MB > self.max_rss_mb:
+            return f'RSS {stats.rss / MB:.0f} MB exceeds {self.max_rss_mb} MB'
+        if self.max_commands is not None and stats.command_count > self.max_commands:
+            return f'{stats.command_count} commands exceed {self.max_commands}'
+        session_age = time.monotonic() - stats.started_at
+        if self.max_session_age is not None and session_age > self.max_session_age:
+            return f'session age {session_age:.0f} s exceeds {self.max_session_age} s'
+        return None
+
+    def is_leak(self, rss_delta: int) -> bool:
+        """
+        Checks whether an RSS growth over a single test is large enough to be flagged as a leak.
+
+        :param rss_delta: The RSS growth in bytes.
+        :return: True if the growth exceeds the leak threshold.
+        """
+        return rss_delta / MB > self.leak_threshold_mb
+
+    def _run(self) -> None:
+        """Samples every registered session until stopped."""
+        while not self._stop_event.wait(self.interval):
+            with self._lock:
+                entries = list(self._sessions.values())
+            for driver, stats in entries:
+                self._sample(driver, stats)
+
+    @staticmethod
+    def _sample(driver: WebDriver, stats: SessionStats) -> None:
+        """
+        Samples the RSS and CPU time of a session's process tree into its statistics.
+
+        :param driver: The monitored WebDriver.
+        :param stats: The session statistics to update.
+        """
+        pid = get_driver_pid(driver)
+        if pid is None:
+            return
+        stats.rss = get_tree_rss(pid)
+        stats.peak_rss = max(stats.peak_rss, stats.rss)
+        stats.cpu_time = get_tree_cpu_time(pid)
@@ -0,0 +1,136 @@
+"""
+Duration-aware test sharding for the ParaBank automation framework.
+
+Keeps a history of per-test durations and failures from previous runs, bin-packs the collected tests into K shards
+so the longest shard is as short as possible, keeps test classes and dependency chains (tests marked with the same
+`chain`) together and in order, and runs historically failing classes and chains first within a shard.
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import os
+import json
+import statistics
+from pathlib import Path
+
+DEFAULT_DURATION = 1.0
+FAILURE_DECAY = 0.5
+
+
+class TimingHistory:
+    """Per-test duration and failure history persisted as JSON."""
+
+    def __init__(self, path: str = '.test_durations.json'):
+        self.path = Path(path)
+        self.tests: dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                self.tests = json.loads(self.path.read_text())
+            except json.JSONDecodeError:
+                self.tests = {}
+
+    def duration(self, nodeid: str) -> float:
+        """
+        Retrieves the last recorded duration of a test.
+
+        :param nodeid: The pytest node id.
+        :return: The duration in seconds, or the median of the known durations for tests without history.
+        """
+        entry = self.tests.get(nodeid)
+        if entry is not None:
+            return entry['duration']
+        known = [entry['duration'] for entry in self.tests.values()]
+        return statistics.median(known) if known else DEFAULT_DURATION
+
+    def failure_score(self, nodeid: str) -> float:
+        """Retrieves the decayed failure count of a test; recent failures weigh the most."""
+        return self.tests.get(nodeid, {}).get('failures', 0.0)
+
+    def update(self, nodeid: str, duration: float | None, failed: bool) -> None:
+        """
+        Records the outcome of a test in this run.
+
+        :param nodeid: The pytest node id.
+        :param duration: The test duration in seconds, setup and teardown included, or None to keep the recorded
+                         duration (e.g. when the test failed before its call phase ran).
+        :param failed: Whether the test failed.
+        """
+        failures = self.failure_score(nodeid) * FAILURE_DECAY + (1 if failed else 0)
+        if duration is None:
+            duration = self.duration(nodeid)
+        self.tests[nodeid] = {'duration': round(duration, 3), 'failures': round(failures, 3)}
+
+    def save(self) -> None:
+        """Writes the history back to disk, atomically so a concurrent reader never sees a partial file."""
+        temporary = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        temporary.write_text(json.dumps(self.tests, indent=2, sort_keys=True))
+        os.replace(temporary, self.path)
+
+
+def build_units(items: list, chain_of, group_of=lambda item: None) -> list[list]:
+    """
+    Groups the collected items into schedulable units that must run together on one shard, in their original order:
+    the tests of one group (e.g. a test class sharing a class-scoped browser), the tests of one dependency chain, and
+    transitively every group and chain that share a test. Every remaining test is a unit of its own.
+
+    :param items: The collected items, in execution order.
+    :param chain_of: A function returning the chain name of an item, or None when it doesn't belong to one.
+    :param group_of: A function returning the group key of an item, or None when it doesn't belong to one.
+    :return: The units, each a list of items in execution order, ordered by their first item.
+    """
+    parents = list(range(len(items)))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    first_of: dict[tuple, int] = {}
+    for index, item in enumerate(items):
+        for key in (('chain', chain_of(item)), ('group', group_of(item))):
+            if key[1] is None:
+                continue
+            if key in first_of:
+                root, other = sorted((find(index), find(first_of[key])))
+                parents[other] = root
+            else:
+                first_of[key] = index
+    units: dict[int, list] = {}
+    for index, item in enumerate(items):
+        units.setdefault(find(index), []).append(item)
+    return list(units.values())
+
+
+def partition(units: list[list], shard_count: int, duration_of) -> list[list[list]]:
+    """
+    Bin-packs units into shards with the longest-processing-time-first heuristic.
+
+    Every node computes the same assignment given the same collection and history.
+
+    :param units: The units to distribute.
+    :param shard_count: The number of shards.
+    :param duration_of: A function returning the expected duration of an item.
+    :return: The units of every shard, in their original relative order.
+    """
+    indexed = [(sum(duration_of(item) for item in unit), index) for index, unit in enumerate(units)]
+    loads = [0.0] * shard_count
+    assignment: list[list[int]] = [[] for _ in range(shard_count)]
+    for unit_duration, index in sorted(indexed, key=lambda entry: (-entry[0], entry[1])):
+        shard = loads.index(min(loads))
+        loads[shard] += unit_duration
+        assignment[shard].append(index)
+    return [[units[index] for index in sorted(indexes)] for indexes in assignment]
+
+
+def order_failing_first(units: list[list], failure_score_of) -> list:
+    """
+    Orders the units of a shard so historically failing ones run first, keeping the original order otherwise.
+
+    :param units: The units of one shard.
+    :param failure_score_of: A function returning the failure score of an item.
+    :return: The flattened items of the shard.
+    """
+    ranked = sorted(units, key=lambda unit: -max(failure_score_of(item) for item in unit))
+    return [item for unit in ranked for item in unit]
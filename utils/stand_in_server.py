@@ -0,0 +1,275 @@
+"""
+Local stand-in for the ParaBank application.
+
+Serves the register, login (index) and customer lookup pages with the same field ids and locators as the real
+application, keeps registered customers in memory and issues a JSESSIONID session cookie, so flows, load runs and
+proxies can be verified offline.
+
+Usage:
+    python -m utils.stand_in_server --port 8080
+
+@author: Raed Eleyan
+@date: 10/19/2026
+@contact: raedeleyan1@gmail.com
+"""
+import html
+import uuid
+import argparse
+import threading
+from urllib.parse import parse_qs, urlsplit
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+BASE_PATH = '/parabank/'
+
+REGISTER_FIELDS = {
+    'customer.firstName': 'First name',
+    'customer.lastName': 'Last name',
+    'customer.address.street': 'Address',
+    'customer.address.city': 'City',
+    'customer.address.state': 'State',
+    'customer.address.zipCode': 'Zip Code',
+    'customer.phoneNumber': 'Phone #',
+    'customer.ssn': 'Social Security Number',
+    'customer.username': 'Username',
+    'customer.password': 'Password',
+    'repeatedPassword': 'Password confirmation',
+}
+OPTIONAL_REGISTER_FIELDS = {'customer.phoneNumber'}
+
+LOOKUP_FIELDS = {
+    'firstName': 'First name',
+    'lastName': 'Last name',
+    'address.street': 'Address',
+    'address.city': 'City',
+    'address.state': 'State',
+    'address.zipCode': 'Zip Code',
+    'ssn': 'Social Security Number',
+}
+
+STATIC_ASSETS = {
+    'style.css': ('text/css', b'body { font-family: sans-serif; } .title { color: #1a4d80; } .error { color: red; }'),
+    'js/app.js': ('application/javascript', b'window.parabank = { ready: true };'),
+    'images/logo.gif': ('image/gif', b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00'
+                                     b'\x00\x00\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'),
+}
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<title>ParaBank | {title}</title>
+<link rel="stylesheet" href="{base}style.css">
+<script src="{base}js/app.js"></script>
+</head>
+<body>
+<div id="leftPanel"><img src="{base}images/logo.gif" alt="ParaBank"></div>
+<div id="rightPanel">
+{content}
+</div>
+</body>
+</html>
+"""
+
+
+def render_form(action: str, fields: dict, values: dict, errors: dict, button: str) -> str:
+    """Renders a form of labelled text inputs with their error spans and a submit button."""
+    rows = []
+    for name, label in fields.items():
+        input_type = 'password' if 'assword' in name else 'text'
+        value = html.escape(values.get(name, ''))
+        error = html.escape(errors.get(name, ''))
+        rows.append(f'<tr><td>{label}:</td><td><input id="{name}" name="{name}" type="{input_type}" value="{value}">'
+                    f'</td><td><span id="{name}.errors" class="error">{error}</span></td></tr>')
+    return (f'<form method="post" action="{BASE_PATH}{action}"><table>{"".join(rows)}</table>'
+            f'<input type="submit" class="button" value="{button}"></form>')
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Request handler implementing the ParaBank pages used by the page objects."""
+
+    server: 'StandInServer'
+
+    def log_message(self, format, *args) -> None:
+        """Silence the default per-request stderr logging."""
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if not path.startswith(BASE_PATH):
+            return self._send(404, self._page('Error', '<h1 class="title">Error!</h1><p>Not found</p>'))
+        page = path[len(BASE_PATH):]
+        if page in STATIC_ASSETS:
+            content_type, body = STATIC_ASSETS[page]
+            return self._send(200, body, content_type, {'Cache-Control': 'public, max-age=3600'})
+        if page == 'register.htm':
+            return self._send(200, self._register_page({}, {}))
+        if page in ('', 'index.htm'):
+            return self._send(200, self._index_page())
+        if page == 'lookup.htm':
+            return self._send(200, self._lookup_page({}, {}))
+        if page == 'logout.htm':
+            self.server.sessions.pop(self._session_id(), None)
+            return self._send(200, self._index_page())
+        return self._send(404, self._page('Error', '<h1 class="title">Error!</h1><p>Not found</p>'))
+
+    def do_POST(self) -> None:
+        page = urlsplit(self.path).path[len(BASE_PATH):]
+        length = int(self.headers.get('Content-Length', 0))
+        form = {key: values[0] for key, values in parse_qs(self.rfile.read(length).decode()).items()}
+        if page == 'register.htm':
+            return self._register(form)
+        if page == 'login.htm':
+            return self._login(form)
+        if page == 'lookup.htm':
+            return self._lookup(form)
+        return self._send(404, self._page('Error', '<h1 class="title">Error!</h1><p>Not found</p>'))
+
+    def _register(self, form: dict) -> None:
+        errors = {name: f'{label} is required.' for name, label in REGISTER_FIELDS.items()
+                  if name not in OPTIONAL_REGISTER_FIELDS and not form.get(name)}
+        username = form.get('customer.username', '')
+        if 'customer.password' not in errors and 'repeatedPassword' not in errors \
+                and form['customer.password'] != form['repeatedPassword']:
+            errors['repeatedPassword'] = 'Passwords did not match.'
+        with self.server.lock:
+            if username and username in self.server.customers:
+                errors['customer.username'] = 'This username already exists.'
+            if not errors:
+                self.server.customers[username] = form
+        if errors:
+            return self._send(200, self._register_page(form, errors))
+        session_id = self._start_session(username)
+        content = (f'<h1 class="title">Welcome {html.escape(username)}</h1>'
+                   '<p>Your account was created successfully. You are now logged in.</p>')
+        self._send(200, self._page('Customer Created', content), cookies={'JSESSIONID': session_id})
+
+    def _login(self, form: dict) -> None:
+        customer = self.server.customers.get(form.get('username', ''))
+        if customer is None or customer['customer.password'] != form.get('password'):
+            content = ('<h1 class="title">Error!</h1>'
+                       '<p class="error">The username and password could not be verified.</p>')
+            return self._send(200, self._page('Error', content))
+        session_id = self._start_session(form['username'])
+        self._send(200, self._overview_page(customer), cookies={'JSESSIONID': session_id})
+
+    def _lookup(self, form: dict) -> None:
+        errors = {name: f'{label} is required.' for name, label in LOOKUP_FIELDS.items() if not form.get(name)}
+        if errors:
+            return self._send(200, self._lookup_page(form, errors))
+        mapping = {'firstName': 'customer.firstName', 'lastName': 'customer.lastName',
+                   'address.street': 'customer.address.street', 'address.city': 'customer.address.city',
+                   'address.state': 'customer.address.state', 'address.zipCode': 'customer.address.zipCode',
+                   'ssn': 'customer.ssn'}
+        match = next((customer for customer in self.server.customers.values()
+                      if all(customer.get(target) == form[source] for source, target in mapping.items())), None)
+        if match is None:
+            content = ('<h1 class="title">Error!</h1>'
+                       '<p class="error">The customer information provided could not be found.</p>')
+            return self._send(200, self._page('Error', content))
+        session_id = self._start_session(match['customer.username'])
+        content = ('<h1 class="title">Customer Lookup</h1>'
+                   '<p>Your login information was located successfully. You are now logged in.</p>'
+                   f'<p><b>Username</b>: {html.escape(match["customer.username"])}<br>'
+                   f'<b>Password</b>: {html.escape(match["customer.password"])}</p>')
+        self._send(200, self._page('Customer Lookup', content), cookies={'JSESSIONID': session_id})
+
+    def _register_page(self, values: dict, errors: dict) -> bytes:
+        content = ('<h1 class="title">Signing up is easy!</h1>'
+                   + render_form('register.htm', REGISTER_FIELDS, values, errors, 'Register'))
+        return self._page('Register for Free Online Account Access', content)
+
+    def _lookup_page(self, values: dict, errors: dict) -> bytes:
+        content = ('<h1 class="title">Customer Lookup</h1>'
+                   + render_form('lookup.htm', LOOKUP_FIELDS, values, errors, 'Find My Login Info'))
+        return self._page('Customer Lookup', content)
+
+    def _index_page(self) -> bytes:
+        content = (f'<form method="post" action="{BASE_PATH}login.htm">'
+                   '<input type="text" name="username"><input type="password" name="password">'
+                   '<input type="submit" class="button" value="Log In"></form>')
+        return self._page('Welcome | Online Banking', content)
+
+    def _overview_page(self, customer: dict) -> bytes:
+        content = (f'<p class="smallText">Welcome {html.escape(customer["customer.firstName"])} '
+                   f'{html.escape(customer["customer.lastName"])}</p>'
+                   '<div id="showOverview"><h1 class="title">Accounts Overview</h1></div>')
+        return self._page('Accounts Overview', content)
+
+    def _page(self, title: str, content: str) -> bytes:
+        return PAGE_TEMPLATE.format(title=title, base=BASE_PATH, content=content).encode()
+
+    def _session_id(self) -> str | None:
+        for cookie in self.headers.get('Cookie', '').split(';'):
+            name, _, value = cookie.strip().partition('=')
+            if name == 'JSESSIONID':
+                return value
+        return None
+
+    def _start_session(self, username: str) -> str:
+        session_id = uuid.uuid4().hex
+        with self.server.lock:
+            self.server.sessions[session_id] = username
+        return session_id
+
+    def _send(self, status: int, body: bytes, content_type: str = 'text/html;charset=utf-8', headers: dict = None,
+              cookies: dict = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {'Cache-Control': 'no-cache'}).items():
+            self.send_header(name, value)
+        for name, value in (cookies or {}).items():
+            self.send_header('Set-Cookie', f'{name}={value}; Path={BASE_PATH}')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """In-process ParaBank stand-in running on a background thread."""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), StandInHandler)
+        self.customers: dict[str, dict] = {}
+        self.sessions: dict[str, str] = {}
+        self.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """The base URL of the stand-in application, e.g. http://127.0.0.1:8080/parabank/."""
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}{BASE_PATH}'
+
+    def start(self) -> 'StandInServer':
+        """Starts serving on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name='stand-in-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and releases the socket."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> 'StandInServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Run the local ParaBank stand-in server.')
+    parser.add_argument('--host', default='127.0.0.1', help='interface to bind')
+    parser.add_argument('--port', type=int, default=8080, help='port to listen on')
+    args = parser.parse_args()
+    server = StandInServer(args.host, args.port)
+    print(f'ParaBank stand-in serving at {server.base_url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
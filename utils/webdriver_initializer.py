@@ -6,27 +6,41 @@ WebDriver initializer module for the ParaBank automation framework
 @contact: raedeleyan1@gmail.com
 """
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from selenium.common.exceptions import WebDriverException
 from .logger import Logger
 from .config_loader import ConfigLoader
+from .command_accounting import configure_command_connection
 
 
 class WebDriverInitializer:
     """Handles WebDriver initialization for supported browsers"""
 
     SUPPORTED_BROWSERS = ["chrome", "firefox", "edge"]
+    HEADLESS_OPTIONS = {"chrome": "--headless=new", "firefox": "-headless", "edge": "--headless=new"}
+    # host:port of the session's caching proxy; every browser launched while it is set is pointed at it
+    proxy_server: str | None = None
 
-    def __init__(self):
+    def __init__(self, headless: bool = False, extra_options: list[str] = None, capabilities: dict = None,
+                 browser: str = None, profile: str = None, browser_options: list[str] = None, driver_path: str = None):
+        """
+        :param headless: Whether to add the browser's headless flag.
+        :param extra_options: Flags added to the configured ones.
+        :param capabilities: Capabilities set on the options.
+        :param browser: The browser to launch, overriding the configured one.
+        :param profile: The named launch-flag profile of the browser section to use, overriding the selected one.
+        :param browser_options: The flags to launch with, overriding the configured ones and any profile.
+        :param driver_path: The driver executable to launch, skipping its resolution through webdriver_manager.
+        """
         self.logger = Logger(__name__)
         self.config = ConfigLoader()
-        self.browser = self.config.get_specified_browser()
+        self.browser = browser.lower() if browser else self.config.get_specified_browser()
         self._validate_browser()
+        self.headless = headless
+        self.extra_options = extra_options or []
+        self.profile = profile
+        self.browser_options = browser_options
+        self.capabilities = capabilities or {}
+        self.driver_path = driver_path
         self.driver = None
 
     def _validate_browser(self):
@@ -45,21 +59,42 @@ class WebDriverInitializer:
         try:
             self.logger.info(f'Initializing {self.browser.capitalize()} WebDriver...')
             options = self._get_browser_options()
+            connection_settings = dict(self.config.get_setting('command_connection') or {})
+            keep_alive = connection_settings.pop('keep_alive', True)
+            driver_path = self.driver_path or self.resolve_driver_path()
             if self.browser == 'chrome':
-                service = ChromeService(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=options)
+                service = webdriver.ChromeService(driver_path)
+                self.driver = webdriver.Chrome(service=service, options=options, keep_alive=keep_alive)
             elif self.browser == 'firefox':
-                service = FirefoxService(GeckoDriverManager().install())
-                self.driver = webdriver.Firefox(service=service, options=options)
+                service = webdriver.FirefoxService(driver_path)
+                self.driver = webdriver.Firefox(service=service, options=options, keep_alive=keep_alive)
             elif self.browser == 'edge':
-                service = EdgeService(EdgeChromiumDriverManager().install())
-                self.driver = webdriver.Edge(service=service, options=options)
+                service = webdriver.EdgeService(driver_path)
+                self.driver = webdriver.Edge(service=service, options=options, keep_alive=keep_alive)
+            if keep_alive and connection_settings:
+                configure_command_connection(self.driver, **connection_settings)
             self.logger.info(f'{self.browser.capitalize()} WebDriver initialized successfully')
             return self.driver
         except WebDriverException as e:
             self.logger.error('WebDriver initialization failed!')
             raise WebDriverException('An error occurred while initializing the webdriver!') from e
 
+    def resolve_driver_path(self) -> str:
+        """
+        Resolves the driver executable of the browser through webdriver_manager, downloading it when it isn't cached.
+
+        :return: The path of the driver executable.
+        """
+        # Driver managers are imported on first use to keep startup cheap
+        if self.browser == 'chrome':
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        if self.browser == 'firefox':
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+        return EdgeChromiumDriverManager().install()
+
     def _get_browser_options(self):
         """
         Returns the appropriate Options object populated with arguments based on browser settings.
@@ -73,8 +108,64 @@ class WebDriverInitializer:
             options = webdriver.FirefoxOptions()
         elif self.browser == 'edge':
             options = webdriver.EdgeOptions()
-        browser_options: list = self.config.get_browser_options(browser_name=self.browser).get('browser_options')
+        browser_options = self.get_configured_flags() if self.browser_options is None else list(self.browser_options)
         self.logger.info(f'Applying this browser options "{browser_options}" to {self.browser.capitalize()} WebDriver')
+        browser_options = browser_options + self.extra_options
+        if self.headless and not self.has_headless_option(browser_options):
+            browser_options.append(self.HEADLESS_OPTIONS[self.browser])
         for option in browser_options:
             options.add_argument(option)
+        if WebDriverInitializer.proxy_server:
+            self._apply_proxy(options, WebDriverInitializer.proxy_server)
+        for name, value in self.capabilities.items():
+            options.set_capability(name, value)
         return options
+
+    @staticmethod
+    def has_headless_option(browser_options: list[str]) -> bool:
+        """
+        Checks whether the browser options already contain any variant of the headless flag.
+
+        :param browser_options: The browser options.
+        :return: True for "headless", "-headless", "--headless", "--headless=new", "--headless=old", ...
+        """
+        return any(option.lstrip('-').partition('=')[0] == 'headless' for option in browser_options)
+
+    def get_configured_flags(self) -> list[str]:
+        """
+        Returns the launch flags of the browser section: those of the named profile when one is selected (by the
+        "profile" key of the section or the initializer), else its "browser_options".
+
+        :return: The launch flags.
+        :raises ValueError: If the selected profile isn't defined in the "profiles" of the browser section.
+        """
+        settings = self.config.get_browser_options(browser_name=self.browser)
+        profile = self.profile or settings.get('profile')
+        if profile is None:
+            return list(settings.get('browser_options'))
+        profiles = settings.get('profiles', {})
+        if profile not in profiles:
+            self.logger.error(f'Unknown launch-flag profile for {self.browser}: {profile}')
+            raise ValueError(f'Unknown launch-flag profile "{profile}" for {self.browser}. Defined profiles are: '
+                             f'{list(profiles)}')
+        self.logger.info(f'Using the "{profile}" launch-flag profile')
+        return list(profiles[profile])
+
+    def _apply_proxy(self, options, proxy_server: str) -> None:
+        """
+        Points the browser at the proxy for all traffic, including loopback origins such as the stand-in server.
+
+        :param options: The Options object.
+        :param proxy_server: The proxy's host:port.
+        """
+        self.logger.info(f'Routing {self.browser.capitalize()} WebDriver traffic through the proxy {proxy_server}')
+        if self.browser == 'firefox':
+            host, _, port = proxy_server.rpartition(':')
+            options.set_preference('network.proxy.type', 1)
+            for scheme in ('http', 'ssl'):
+                options.set_preference(f'network.proxy.{scheme}', host)
+                options.set_preference(f'network.proxy.{scheme}_port', int(port))
+            options.set_preference('network.proxy.allow_hijacking_localhost', True)
+        else:
+            options.add_argument(f'--proxy-server=http://{proxy_server}')
+            options.add_argument('--proxy-bypass-list=<-loopback>')